@@ -8,6 +8,7 @@ It shows how to use the crawler system to extract content from various types of
 
 import sys
 import json
+import logging
 from typing import List
 
 # Add the src directory to the path
@@ -177,4 +178,5 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
@@ -0,0 +1,80 @@
+"""
+Parser Benchmark Command
+
+Run with python -m src.benchmarks from the project root. Results are written as
+JSON; with --baseline the run is compared with an earlier results file and the
+command exits with status 1 if anything regressed.
+"""
+
+import argparse
+import json
+import sys
+
+from src.benchmarks.corpus import MUTATIONS
+from src.benchmarks.runner import ENTRY_POINTS, PARSERS, compare_results, run_benchmarks
+
+def print_result(result):
+    """Print a one-line summary of a result to stderr."""
+    p50 = result["latency_p50_ms"]
+    p99 = result["latency_p99_ms"]
+    latency = f"p50 {p50:.3f} ms, p99 {p99:.3f} ms" if p50 is not None else "no per-entry latency"
+    memory = result["peak_memory_bytes"]
+    memory = f"{memory / 2**20:.1f} MiB peak" if memory is not None else "memory not measured"
+    fallback = result["fallback_rate"]
+    fallback = f"{fallback:.1%} fallback" if fallback is not None else "fallback not counted"
+    print(f"{result['parser']:>4} {result['entry_point']:<22} "
+          f"{result['entries_per_second']:>10.0f} entries/s, {latency}, {memory}, {fallback}",
+          file=sys.stderr)
+
+def main():
+    """Main function for command-line usage."""
+    parser = argparse.ArgumentParser(description="Citation parser benchmarks")
+    parser.add_argument("-n", "--size", type=int, default=10000,
+                        help="Entries per synthetic corpus (default: 10000)")
+    parser.add_argument("-p", "--parser", action="append", choices=list(PARSERS),
+                        help="Parser to benchmark; repeat for several (default: all)")
+    parser.add_argument("-e", "--entry-point", action="append", choices=list(ENTRY_POINTS),
+                        help="Entry point to benchmark; repeat for several (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed (default: 0)")
+    parser.add_argument("--mutation-rate", type=float, default=0.3,
+                        help=f"Share of entries mutated with one of: {', '.join(MUTATIONS)} (default: 0.3)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for parse_many (default: 1)")
+    parser.add_argument("--memo-size", type=int, default=0,
+                        help="Parse memo size; 0 measures raw parsing (default: 0)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory runs")
+    parser.add_argument("-o", "--output", help="Path to write the JSON results (default: stdout)")
+    parser.add_argument("--baseline", help="Earlier results file to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Relative slowdown or growth allowed against the baseline (default: 0.10)")
+    
+    args = parser.parse_args()
+    
+    results = run_benchmarks(
+        size=args.size,
+        parsers=args.parser or list(PARSERS),
+        entry_points=args.entry_point or list(ENTRY_POINTS),
+        seed=args.seed,
+        mutation_rate=args.mutation_rate,
+        workers=args.workers,
+        memo_size=args.memo_size,
+        measure_memory=not args.no_memory,
+        progress=print_result
+    )
+    
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_results(json.load(f), results, args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Synthetic Benchmark Corpora
+
+This module builds large reference lists from the citation fixtures in
+src/tests/test_data. Each entry is a fixture citation, optionally changed by one
+of a fixed set of mutations, chosen by a seeded random generator so the same
+size, style and seed always give the same corpus.
+"""
+
+import json
+import os
+import random
+import string
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "test_data")
+
+STYLES = ("apa", "mla")
+
+SURNAMES = [
+    "Smith", "Johnson", "Garcia", "Nguyen", "Müller", "O'Brien", "van der Berg",
+    "Kowalski", "Okafor", "Tanaka", "Rossi", "Dubois", "Andersen", "Silva"
+]
+FORENAMES = ["John", "Mary", "Li", "Carlos", "Aisha", "Jean-Pierre", "Anna", "Raj"]
+
+def load_fixtures(style: str, data_dir: str = DATA_DIR) -> List[str]:
+    """Load the fixture citation texts for a style.
+    
+    Args:
+        style: "apa" or "mla"
+        data_dir: Directory holding <style>_citations.json
+        
+    Returns:
+        List of citation strings
+        
+    Raises:
+        ValueError: If the style is not supported
+    """
+    if style not in STYLES:
+        raise ValueError(f"Unknown citation style: {style}")
+    with open(os.path.join(data_dir, f"{style}_citations.json"), 'r', encoding='utf-8') as f:
+        return [citation["text"] for citation in json.load(f)["citations"]]
+
+def _author_split(text: str, style: str) -> int:
+    """Offset where the author list of a citation ends."""
+    end = text.find(" (") if style == "apa" else text.find(". ")
+    return end if end > 0 else 0
+
+def add_noise(text: str, style: str, rng: random.Random) -> str:
+    """Introduce typos, doubled spaces and stray punctuation."""
+    chars = list(text)
+    for _ in range(rng.randint(1, 4)):
+        position = rng.randrange(len(chars) + 1)
+        edit = rng.random()
+        if edit < 0.3 and position < len(chars):
+            del chars[position]
+        elif edit < 0.6:
+            chars.insert(position, rng.choice(string.ascii_letters + "  ,.;"))
+        elif position < len(chars):
+            chars[position] = rng.choice(string.ascii_letters)
+    return "".join(chars)
+
+def long_author_list(text: str, style: str, rng: random.Random) -> str:
+    """Replace the authors with a list of 20 to 200 names."""
+    count = rng.randint(20, 200)
+    surnames = [rng.choice(SURNAMES) for _ in range(count)]
+    if style == "apa":
+        names = [f"{surname}, {rng.choice(string.ascii_uppercase)}." for surname in surnames]
+        authors = ", ".join(names[:-1]) + ", & " + names[-1]
+    else:
+        names = [f"{rng.choice(FORENAMES)} {surname}" for surname in surnames[1:]]
+        authors = f"{surnames[0]}, {rng.choice(FORENAMES)}, " + ", ".join(names[:-1]) + ", and " + names[-1]
+    return authors + text[_author_split(text, style):]
+
+def drop_field(text: str, style: str, rng: random.Random) -> str:
+    """Remove one sentence-level field: authors, year, title, source or trailing details."""
+    fields = text.split(". ")
+    if len(fields) > 1:
+        del fields[rng.randrange(len(fields))]
+    return ". ".join(fields)
+
+def adversarial(text: str, style: str, rng: random.Random) -> str:
+    """Strings that make backtracking patterns work hard."""
+    size = rng.randint(200, 2000)
+    return rng.choice([
+        "(" * size,
+        '"' + "word, " * size,
+        "Smith, J. " * size,
+        "a" * size + ".",
+        text.replace(". ", ".  " + " " * size, 1),
+        " ".join([text] * (size // 100 + 2))
+    ])
+
+MUTATIONS: Dict[str, Callable[[str, str, random.Random], str]] = {
+    "noise": add_noise,
+    "long_authors": long_author_list,
+    "missing_fields": drop_field,
+    "adversarial": adversarial
+}
+
+def iter_corpus(size: int, style: str, seed: int = 0, mutation_rate: float = 0.3,
+                mutations: Optional[List[str]] = None,
+                data_dir: str = DATA_DIR) -> Iterator[Tuple[str, str]]:
+    """Generate synthetic reference entries from the citation fixtures.
+    
+    Args:
+        size: Number of entries
+        style: "apa", "mla" or "mixed" for entries of both styles
+        seed: Random seed; the same arguments always give the same entries
+        mutation_rate: Share of entries changed by a mutation
+        mutations: Names of the mutations to apply (default: all of MUTATIONS)
+        data_dir: Directory holding the fixtures
+        
+    Yields:
+        (mutation name or "none", entry text) pairs
+        
+    Raises:
+        ValueError: If the style or a mutation name is unknown
+    """
+    styles = STYLES if style == "mixed" else (style,)
+    fixtures = [(name, text) for name in styles for text in load_fixtures(name, data_dir)]
+    names = list(mutations) if mutations is not None else list(MUTATIONS)
+    for name in names:
+        if name not in MUTATIONS:
+            raise ValueError(f"Unknown mutation: {name}")
+    
+    rng = random.Random(seed)
+    for _ in range(size):
+        text_style, text = rng.choice(fixtures)
+        if names and rng.random() < mutation_rate:
+            name = rng.choice(names)
+            yield name, MUTATIONS[name](text, text_style, rng).replace("\n", " ")
+        else:
+            yield "none", text
+
+def build_document(entries: List[str]) -> str:
+    """Wrap entries in a document with a reference section, one entry per paragraph.
+    
+    Args:
+        entries: Reference entry texts
+        
+    Returns:
+        Document text
+    """
+    return "Body text citing earlier work.\n\nReferences\n\n" + "\n\n".join(entries) + "\n"
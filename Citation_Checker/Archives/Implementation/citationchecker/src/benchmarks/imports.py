@@ -0,0 +1,153 @@
+"""
+Import Time Benchmark
+
+Run with python -m src.benchmarks.imports from the project root. Each module is
+imported in a fresh interpreter under python -X importtime, and the report
+gives how long the import took, which modules it loaded and where the time went.
+With --check the command exits with status 1 if a module is over its budget
+in IMPORT_BUDGETS or loads one of the modules listed for it in FORBIDDEN_IMPORTS.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Project root, the directory the src package is imported from
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Seconds each module may take to import in a fresh interpreter. Several times
+# the measured cost, so that only a new heavy dependency trips them
+IMPORT_BUDGETS = {
+    "src.main": 0.15,
+    "src.crawlers": 0.02,
+    "src.registry": 0.02
+}
+
+# Modules (and their submodules) that must only be imported on first use
+FORBIDDEN_IMPORTS = {
+    "src.main": ("requests", "bs4", "urllib3", "multiprocessing", "pyarrow", "src.crawlers",
+                 "src.parsers.apa_parser", "src.parsers.mla_parser", "src.parsers.auto_parser"),
+    "src.crawlers": ("requests", "bs4", "urllib3", "src.crawlers.base_crawler"),
+    "src.registry": ("src.parsers.base_parser", "src.crawlers.base_crawler")
+}
+
+def _import_times(statement: str) -> List[Tuple[str, int, int, int]]:
+    """Run a statement under -X importtime and parse the report.
+    
+    Returns:
+        (module, nesting depth, self microseconds, cumulative microseconds)
+        for every module imported, in the order the report lists them
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, cwd=ROOT
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Running {statement!r} failed: {result.stderr.strip().splitlines()[-1:]}")
+    
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the column header
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return times
+
+def measure_import(module: str, runs: int = 3, top: int = 10) -> Dict[str, Any]:
+    """Measure the cost of importing a module in a fresh interpreter.
+    
+    Modules the interpreter loads at startup (site, encodings, ...) are not
+    counted. The fastest of the runs is reported, as the least disturbed by
+    other work on the machine.
+    
+    Args:
+        module: Dotted module name, importable from the project root
+        runs: Number of fresh interpreters to time
+        top: Number of slowest modules to list
+        
+    Returns:
+        Dictionary with "module", "seconds", "modules" (every module the
+        import loaded, sorted) and "slowest" ([name, self seconds] pairs)
+    """
+    startup = {name for name, _, _, _ in _import_times("pass")}
+    best = None
+    for _ in range(runs):
+        times = [entry for entry in _import_times(f"import {module}") if entry[0] not in startup]
+        # Top-level entries are the ones the import statement itself triggered;
+        # their cumulative times include everything nested under them
+        total = sum(cumulative for _, depth, _, cumulative in times if depth == 0)
+        if best is None or total < best[0]:
+            best = (total, times)
+    
+    total, times = best
+    slowest = sorted(times, key=lambda entry: entry[2], reverse=True)[:top]
+    return {
+        "module": module,
+        "seconds": total / 1e6,
+        "modules": sorted(name for name, _, _, _ in times),
+        "slowest": [[name, self_us / 1e6] for name, _, self_us, _ in slowest]
+    }
+
+def check_budgets(results: Sequence[Dict[str, Any]],
+                  budgets: Optional[Dict[str, float]] = None,
+                  forbidden: Optional[Dict[str, Sequence[str]]] = None) -> List[str]:
+    """Compare import measurements with their budgets.
+    
+    Args:
+        results: Results from measure_import()
+        budgets: Seconds allowed per module (default: IMPORT_BUDGETS)
+        forbidden: Modules each module must not load (default: FORBIDDEN_IMPORTS)
+        
+    Returns:
+        One message per problem found; empty if every module is within budget
+    """
+    budgets = IMPORT_BUDGETS if budgets is None else budgets
+    forbidden = FORBIDDEN_IMPORTS if forbidden is None else forbidden
+    
+    problems = []
+    for result in results:
+        module = result["module"]
+        budget = budgets.get(module)
+        if budget is not None and result["seconds"] > budget:
+            problems.append(f"{module} took {result['seconds'] * 1000:.1f} ms to import "
+                            f"(budget {budget * 1000:.0f} ms)")
+        for name in forbidden.get(module, ()):
+            loaded = [m for m in result["modules"] if m == name or m.startswith(name + ".")]
+            if loaded:
+                problems.append(f"{module} imports {name} ({loaded[0]})")
+    return problems
+
+def main():
+    """Main function for command-line usage."""
+    parser = argparse.ArgumentParser(description="Module import time benchmark")
+    parser.add_argument("modules", nargs="*",
+                        help="Modules to import (default: every module with a budget)")
+    parser.add_argument("-r", "--runs", type=int, default=3,
+                        help="Fresh interpreters per module; the fastest counts (default: 3)")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit with status 1 if a module is over budget or imports a forbidden module")
+    
+    args = parser.parse_args()
+    
+    results = []
+    for module in args.modules or list(IMPORT_BUDGETS):
+        result = measure_import(module, runs=args.runs)
+        results.append(result)
+        slowest = ", ".join(f"{name} {seconds * 1000:.1f}" for name, seconds in result["slowest"][:5])
+        print(f"{module:<24} {result['seconds'] * 1000:>7.1f} ms, "
+              f"{len(result['modules'])} modules (slowest, ms: {slowest})")
+    
+    if args.check:
+        problems = check_budgets(results)
+        for problem in problems:
+            print(f"Over budget: {problem}", file=sys.stderr)
+        if problems:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
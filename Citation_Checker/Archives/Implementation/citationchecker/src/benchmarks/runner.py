@@ -0,0 +1,277 @@
+"""
+Parser Benchmarks
+
+This module times each parser through each public entry point over a synthetic
+corpus and reports throughput, per-entry latency, peak memory and how often the
+fallback parser was needed. Results are plain dictionaries that serialize to
+JSON, so a run can be saved and compared with the run of another commit.
+"""
+
+import collections
+import datetime
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.benchmarks.corpus import build_document, iter_corpus
+from src.models.source_buffer import SourceBuffer
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.auto_parser import AutoCitationParser
+from src.parsers.base_parser import BaseCitationParser
+from src.parsers.mla_parser import MLACitationParser
+
+# Bump when the layout of the results changes
+SCHEMA_VERSION = 1
+
+PARSERS = {
+    "apa": (APACitationParser, "apa"),
+    "mla": (MLACitationParser, "mla"),
+    "auto": (AutoCitationParser, "mixed")
+}
+
+ENTRY_POINTS = ("parse", "parse_many", "extract_citations", "iter_citations", "iter_buffer_citations")
+
+# Entry points handed one entry at a time; the others get a whole document
+PER_ENTRY = ("parse", "parse_many")
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of already sorted values.
+    
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction, e.g. 0.99
+        
+    Returns:
+        The percentile, or None for no values
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+def _timed_iteration(citations, record: bool) -> Tuple[int, Optional[List[float]]]:
+    """Consume a citation iterator, timing the gap before each citation."""
+    count = 0
+    latencies = [] if record else None
+    last = time.perf_counter()
+    for _ in citations:
+        count += 1
+        if record:
+            now = time.perf_counter()
+            latencies.append(now - last)
+            last = now
+    return count, latencies
+
+def _workload(parser: BaseCitationParser, entry_point: str, entries: List[str], document: str,
+              path: str, workers: int) -> Callable[[bool], Tuple[int, Optional[List[float]]]]:
+    """Build a callable that runs one entry point and returns (citations, latencies)."""
+    if entry_point == "parse":
+        def run(record):
+            count = 0
+            latencies = [] if record else None
+            for text in entries:
+                start = time.perf_counter()
+                citation = parser.parse(text)
+                if record:
+                    latencies.append(time.perf_counter() - start)
+                count += citation is not None
+            return count, latencies
+    elif entry_point == "parse_many":
+        def run(record):
+            return sum(c is not None for c in parser.parse_many(entries, workers=workers)), None
+    elif entry_point == "extract_citations":
+        def run(record):
+            return len(parser.extract_citations(document)), None
+    elif entry_point == "iter_citations":
+        def run(record):
+            with open(path, 'r', encoding='utf-8') as f:
+                return _timed_iteration(parser.iter_citations(f), record)
+    elif entry_point == "iter_buffer_citations":
+        def run(record):
+            with SourceBuffer(path) as source:
+                return _timed_iteration(parser.iter_buffer_citations(source), record)
+    else:
+        raise ValueError(f"Unknown entry point: {entry_point}")
+    return run
+
+def run_benchmark(parser_name: str, entry_point: str, entries: List[str], document: str,
+                  path: str, workers: int = 1, memo_size: int = 0,
+                  measure_memory: bool = True) -> Dict[str, Any]:
+    """Time one parser through one entry point.
+    
+    Latency is per entry for parse(); for the streaming entry points it is the
+    time spent before each citation is produced, including the candidates
+    rejected on the way. Peak memory is measured in a second, untimed run,
+    because tracing allocations slows parsing down.
+    
+    Args:
+        parser_name: Key of PARSERS
+        entry_point: One of ENTRY_POINTS
+        entries: Corpus entries
+        document: The entries as one document
+        path: File holding the document
+        workers: Worker processes for parse_many
+        memo_size: Parse memo size for the parser (0 measures raw parsing)
+        measure_memory: Whether to measure peak memory
+        
+    Returns:
+        Result dictionary
+    """
+    parser_class = PARSERS[parser_name][0]
+    parser = parser_class(memo_size=memo_size)
+    run = _workload(parser, entry_point, entries, document, path, workers)
+    start = time.perf_counter()
+    citations, latencies = run(True)
+    seconds = time.perf_counter() - start
+    
+    stats = parser.get_stats()
+    parser.close_pool()
+    if entry_point in PER_ENTRY:
+        attempted = len(entries)
+    else:
+        attempted = stats['prefilter_accepted']
+    if entry_point == "parse_many" and workers > 1:
+        # Workers keep their own counters
+        fallback_rate = None
+    else:
+        fallback_rate = stats['fallback_parses'] / attempted if attempted else 0.0
+    
+    peak_memory = None
+    if measure_memory:
+        run = _workload(parser_class(memo_size=memo_size), entry_point, entries, document, path, workers)
+        tracemalloc.start()
+        try:
+            run(False)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    
+    latencies = sorted(latencies) if latencies else []
+    return {
+        "parser": parser_name,
+        "entry_point": entry_point,
+        "entries": len(entries),
+        "citations": citations,
+        "seconds": seconds,
+        "entries_per_second": len(entries) / seconds if seconds else None,
+        "latency_p50_ms": percentile(latencies, 0.50) * 1000 if latencies else None,
+        "latency_p99_ms": percentile(latencies, 0.99) * 1000 if latencies else None,
+        "peak_memory_bytes": peak_memory,
+        "fallback_rate": fallback_rate
+    }
+
+def _git_commit() -> Optional[str]:
+    """Commit of the working tree, if it is a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=10,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+def run_benchmarks(size: int = 10000, parsers: Sequence[str] = tuple(PARSERS),
+                   entry_points: Sequence[str] = ENTRY_POINTS, seed: int = 0,
+                   mutation_rate: float = 0.3, workers: int = 1, memo_size: int = 0,
+                   measure_memory: bool = True,
+                   progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Benchmark parsers and entry points over synthetic corpora.
+    
+    Args:
+        size: Entries per corpus
+        parsers: Keys of PARSERS to benchmark
+        entry_points: Entry points to benchmark
+        seed: Corpus random seed
+        mutation_rate: Share of corpus entries that are mutated
+        workers: Worker processes for parse_many
+        memo_size: Parse memo size (0 measures raw parsing)
+        measure_memory: Whether to measure peak memory
+        progress: Called with each result as it is finished
+        
+    Returns:
+        Dictionary with the run's environment, configuration, corpus
+        composition and results
+    """
+    for name in parsers:
+        if name not in PARSERS:
+            raise ValueError(f"Unknown parser: {name}")
+    for entry_point in entry_points:
+        if entry_point not in ENTRY_POINTS:
+            raise ValueError(f"Unknown entry point: {entry_point}")
+    
+    corpora = {}
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name in parsers:
+            corpus = list(iter_corpus(size, PARSERS[name][1], seed, mutation_rate))
+            corpora[name] = dict(collections.Counter(mutation for mutation, _ in corpus))
+            entries = [text for _, text in corpus]
+            del corpus
+            document = build_document(entries)
+            path = os.path.join(directory, f"{name}.txt")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(document)
+            
+            for entry_point in entry_points:
+                result = run_benchmark(name, entry_point, entries, document, path,
+                                       workers, memo_size, measure_memory)
+                results.append(result)
+                if progress:
+                    progress(result)
+    
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "environment": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "git_commit": _git_commit()
+        },
+        "config": {
+            "size": size,
+            "seed": seed,
+            "mutation_rate": mutation_rate,
+            "workers": workers,
+            "memo_size": memo_size
+        },
+        "corpora": corpora,
+        "results": results
+    }
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    tolerance: float = 0.10) -> List[str]:
+    """Find results that got slower or bigger than a baseline run.
+    
+    Args:
+        baseline: Earlier run_benchmarks() output
+        current: Later run_benchmarks() output
+        tolerance: Allowed relative change before a result counts as a regression
+        
+    Returns:
+        One message per regression, empty if there are none
+    """
+    earlier = {(r["parser"], r["entry_point"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = earlier.get((result["parser"], result["entry_point"]))
+        if not before:
+            continue
+        name = f"{result['parser']}.{result['entry_point']}"
+        if before["entries_per_second"] and result["entries_per_second"] is not None:
+            ratio = result["entries_per_second"] / before["entries_per_second"]
+            if ratio < 1 - tolerance:
+                regressions.append(f"{name}: throughput {ratio:.2f}x of baseline")
+        if before["peak_memory_bytes"] and result["peak_memory_bytes"] is not None:
+            ratio = result["peak_memory_bytes"] / before["peak_memory_bytes"]
+            if ratio > 1 + tolerance:
+                regressions.append(f"{name}: peak memory {ratio:.2f}x of baseline")
+    return regressions
@@ -5,10 +5,17 @@ This module provides web crawling functionality to retrieve and extract content
 from online sources referenced in citations.
 """
 
-from .base_crawler import BaseCrawler
-from .crawler_manager import CrawlerManager
-from .web_crawler import WebCrawler
-from .academic_crawler import AcademicCrawler
+import importlib
+
+# Each class is imported from its module on first access (PEP 562), so that
+# importing the package does not pull in requests and BeautifulSoup until a
+# crawler is actually used
+_EXPORTS = {
+    'BaseCrawler': '.base_crawler',
+    'CrawlerManager': '.crawler_manager',
+    'WebCrawler': '.web_crawler',
+    'AcademicCrawler': '.academic_crawler'
+}
 
 __all__ = [
     'BaseCrawler',
@@ -16,3 +23,13 @@ __all__ = [
     'WebCrawler',
     'AcademicCrawler'
 ]
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
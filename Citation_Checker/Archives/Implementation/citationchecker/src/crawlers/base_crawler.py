@@ -15,8 +15,6 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class CrawlResult:
@@ -46,6 +44,24 @@ class CrawlResult:
             'response_time': self.response_time,
             'crawl_timestamp': self.crawl_timestamp
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CrawlResult":
+        """Build a crawl result from a dictionary made by to_dict().
+        
+        Args:
+            data: Dictionary of crawl result fields
+            
+        Returns:
+            CrawlResult with the given fields, including its original
+            crawl timestamp
+        """
+        result = cls(data['url'], data.get('success', False), data.get('content', ""),
+                     data.get('metadata'), data.get('error'), data.get('status_code'),
+                     data.get('response_time'))
+        if data.get('crawl_timestamp') is not None:
+            result.crawl_timestamp = data['crawl_timestamp']
+        return result
 
 class BaseCrawler(ABC):
     """Abstract base class for all web crawlers.
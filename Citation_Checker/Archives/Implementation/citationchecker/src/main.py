@@ -6,35 +6,177 @@ It provides command-line functionality to parse citations from text or files.
 """
 
 import argparse
+import glob
+import io
 import json
+import os
 import sys
+import time
+from concurrent.futures import as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 
-from src.parsers.apa_parser import APACitationParser
-from src.models.citation import Citation
+from src.parsers.cache import ParseCache, hash_file, hash_text
+from src.parsers.incremental import IncrementalParser, IncrementalResult
+from src.models.citation import Citation, SpanCitation
+from src.models.source_buffer import SourceBuffer
+from src.output.columnar import COLUMNAR_WRITERS
+from src.output.writers import WRITERS, get_writer
+from src.registry import parsers
 
-def parse_file(file_path: str, parser_name: str = "apa") -> List[Citation]:
+def parse_file(file_path: str, parser_name: str = "apa", cache: Optional[ParseCache] = None,
+               stats: Optional[Dict[str, Any]] = None) -> List[Citation]:
     """Parse citations from a file.
     
+    The citations hold their own copy of their text. To keep only offsets
+    into a memory map of the file instead, use open_file_citations().
+    
     Args:
         file_path: Path to the file containing citations
         parser_name: Name of the parser to use (default: "apa")
+        cache: Persistent cache to consult before parsing and update after
+        stats: Dictionary to fill with the parser's statistics, including
+            per-stage call counts and times
         
     Returns:
         List of Citation objects found in the file
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    parser = get_parser(parser_name)
+    if not parser:
+        print(f"Error: Parser '{parser_name}' not found.")
+        return []
+    return _parse_file_with(parser, file_path, False, cache, stats)
+
+@contextmanager
+def open_file_citations(file_path: str, parser_name: str = "apa",
+                        stats: Optional[Dict[str, Any]] = None) -> Iterator[List[SpanCitation]]:
+    """Parse citations from a memory map of a file, kept open for the with block.
+    
+    The citations store byte offsets into the map rather than their own
+    copy of the citation text, which is decoded when it is read, so they
+    must not be used after the block ends:
+    
+        with open_file_citations("corpus.txt") as citations:
+            titles = [citation.title for citation in citations]
+            
+    Args:
+        file_path: Path to the UTF-8 file containing citations
+        parser_name: Name of the parser to use (default: "apa")
+        stats: Dictionary to fill with the parser's statistics
+        
+    Returns:
+        Context manager giving the list of SpanCitation objects
+        
+    Raises:
+        ValueError: If the parser name is unknown
+    """
+    parser = get_parser(parser_name)
+    if not parser:
+        raise ValueError(f"Parser '{parser_name}' not found.")
+    with SourceBuffer(file_path) as buffer:
+        citations = list(parser.iter_buffer_citations(buffer))
+        _collect_stats(parser, stats)
+        yield citations
+
+def _materialize(citation: Citation) -> Citation:
+    """Copy a span citation into a Citation holding its own text, so it outlives its buffer."""
+    if isinstance(citation, SpanCitation):
+        return Citation(**{f.name: getattr(citation, f.name) for f in fields(Citation)})
+    return citation
+
+def _parse_file_with(parser, file_path: str, zero_copy: bool = False, cache: Optional[ParseCache] = None,
+                     stats: Optional[Dict[str, Any]] = None) -> List[Citation]:
+    """Parse citations from a file with an existing parser; see parse_file().
+    
+    With zero_copy the file is read through a memory map, which is closed
+    before returning, so the citations are given their own text.
+    """
+    if cache:
+        content_hash = hash_file(file_path)
+        citations = cache.get(content_hash, parser)
+        if citations is not None:
+            _collect_stats(parser, stats)
+            return citations
+    
+    time_budget_hits = parser.time_budget_hits
+    if zero_copy:
+        # The map is closed before returning, so the citations are given
+        # their own text while it can still be read
+        with SourceBuffer(file_path) as buffer:
+            citations = [_materialize(c) for c in parser.iter_buffer_citations(buffer)]
+    else:
+        # Stream the file so large documents are never held in memory whole
+        with open(file_path, 'r', encoding='utf-8') as f:
+            citations = list(parser.iter_citations(f))
+    
+    # A document with entries that ran out of time may parse fully later
+    if cache and parser.time_budget_hits == time_budget_hits:
+        cache.put(content_hash, parser, citations)
+    _collect_stats(parser, stats)
+    return citations
+
+def iter_file_citations(file_path: str, parser_name: str = "apa", zero_copy: bool = False,
+                        cache: Optional[ParseCache] = None,
+                        stats: Optional[Dict[str, Any]] = None) -> Iterator[Citation]:
+    """Yield citations from a file as they are parsed, without collecting them.
+    
+    With a cache, the file's complete result is looked up (or parsed and
+    stored) first, since the cache only holds whole documents.
+    
+    Args:
+        file_path: Path to the file containing citations
+        parser_name: Name of the parser to use (default: "apa")
+        zero_copy: Parse from a memory map of the file, closed once the
+            iterator is exhausted or closed
+        cache: Persistent cache to consult before parsing and update after
+        stats: Dictionary to fill with the parser's statistics once the
+            iterator is exhausted
+            
+    Returns:
+        Iterator over the Citation objects found in the file
+    """
+    parser = get_parser(parser_name)
+    if not parser:
+        print(f"Error: Parser '{parser_name}' not found.")
+        return
+    if cache:
+        yield from _parse_file_with(parser, file_path, zero_copy, cache, stats)
+        return
     
-    return parse_text(content, parser_name)
+    if zero_copy:
+        with SourceBuffer(file_path) as buffer:
+            for citation in parser.iter_buffer_citations(buffer):
+                yield _materialize(citation)
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yield from parser.iter_citations(f)
+    _collect_stats(parser, stats)
+
+def reparse_file(file_path: str, incremental: IncrementalParser) -> IncrementalResult:
+    """Re-parse a revised file, parsing only reference entries that changed.
+    
+    Args:
+        file_path: Path to the file containing citations
+        incremental: IncrementalParser that has seen earlier versions of the file
+        
+    Returns:
+        IncrementalResult with all citations and the diff since the last version
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return incremental.reparse(f, document_id=str(Path(file_path).resolve()))
 
-def parse_text(text: str, parser_name: str = "apa") -> List[Citation]:
+def parse_text(text: str, parser_name: str = "apa", cache: Optional[ParseCache] = None,
+               stats: Optional[Dict[str, Any]] = None) -> List[Citation]:
     """Parse citations from text.
     
     Args:
         text: Text containing citations
         parser_name: Name of the parser to use (default: "apa")
+        cache: Persistent cache to consult before parsing and update after
+        stats: Dictionary to fill with the parser's statistics, including
+            per-stage call counts and times
         
     Returns:
         List of Citation objects found in the text
@@ -44,7 +186,26 @@ def parse_text(text: str, parser_name: str = "apa") -> List[Citation]:
         print(f"Error: Parser '{parser_name}' not found.")
         return []
     
-    return parser.extract_citations(text)
+    if cache:
+        content_hash = hash_text(text)
+        citations = cache.get(content_hash, parser)
+        if citations is not None:
+            _collect_stats(parser, stats)
+            return citations
+    
+    time_budget_hits = parser.time_budget_hits
+    citations = parser.extract_citations(text)
+    
+    # A document with entries that ran out of time may parse fully later
+    if cache and parser.time_budget_hits == time_budget_hits:
+        cache.put(content_hash, parser, citations)
+    _collect_stats(parser, stats)
+    return citations
+
+def _collect_stats(parser, stats: Optional[Dict[str, Any]]):
+    """Copy a parser's statistics into stats, if the caller asked for them."""
+    if stats is not None:
+        stats.update(parser.get_stats())
 
 def get_parser(parser_name: str):
     """Get a parser instance by name.
@@ -55,75 +216,263 @@ def get_parser(parser_name: str):
     Returns:
         Parser instance or None if not found
     """
-    if parser_name.lower() == "apa":
-        return APACitationParser()
-    # Add more parsers here as they are implemented
-    return None
+    # Only the requested parser's module is imported (see src/registry.py)
+    if parser_name not in parsers:
+        return None
+    return parsers.create(parser_name)
 
 def format_citation_output(citations: List[Citation], output_format: str = "text") -> str:
     """Format citations for output.
     
+    To write a large number of citations without building the whole output
+    in memory, use a writer from src.output.writers instead.
+    
     Args:
         citations: List of Citation objects
-        output_format: Format to use ("text", "json", "csv")
+        output_format: Format to use ("text", "json", "jsonl", "csv")
         
     Returns:
         Formatted string
     """
-    if output_format == "json":
-        # Convert to dictionary and dump to JSON
-        return json.dumps({
-            "citations": [citation.to_dict() for citation in citations],
-            "count": len(citations)
-        }, indent=2)
-    
-    elif output_format == "csv":
-        # Create CSV header and rows
-        header = "authors,year,title,source,citation_type,confidence_score,doi,url,volume,issue,pages"
-        rows = []
-        for citation in citations:
-            authors_str = "|".join(citation.authors)
-            row = f'"{authors_str}",{citation.year},"{citation.title}","{citation.source}",{citation.citation_type},{citation.confidence_score},{citation.doi or ""},{citation.url or ""},{citation.volume or ""},{citation.issue or ""},{citation.pages or ""}'
-            rows.append(row)
+    if output_format not in WRITERS:
+        # Default to text format
+        output_format = "text"
+    out = io.StringIO()
+    with get_writer(output_format, out, total=len(citations)) as writer:
+        writer.write_all(citations)
+    return out.getvalue()
+
+# Characters that make a --file argument a glob pattern
+GLOB_CHARS = "*?["
+
+# Output file extension for each output format in --output-dir runs
+OUTPUT_EXTENSIONS = {"text": ".txt", "json": ".json", "jsonl": ".jsonl", "csv": ".csv",
+                     "parquet": ".parquet", "arrow": ".arrow"}
+
+@dataclass
+class FileResult:
+    """Outcome of parsing one file in a multi-file run.
+    
+    Attributes:
+        path: Path of the input file
+        citations: Citations found (empty if the file failed)
+        error: Description of the error that stopped the file, or None
+        seconds: Time spent on the file
+        stats: Parser statistics for this file alone
+    """
+    path: str
+    citations: List[Citation] = field(default_factory=list)
+    error: Optional[str] = None
+    seconds: float = 0.0
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+def expand_inputs(inputs: List[str], pattern: str = "*.txt") -> List[str]:
+    """Expand files, directories and glob patterns into a list of files.
+    
+    Args:
+        inputs: File paths, directories (searched recursively) or glob
+            patterns ("**" matches any number of directories)
+        pattern: File name pattern used inside directories
         
-        return header + "\n" + "\n".join(rows)
+    Returns:
+        File paths in the order given, each listed once
+    """
+    paths = []
+    for item in inputs:
+        if any(char in item for char in GLOB_CHARS):
+            paths.extend(path for path in sorted(glob.glob(item, recursive=True)) if os.path.isfile(path))
+        elif os.path.isdir(item):
+            paths.extend(str(path) for path in sorted(Path(item).rglob(pattern)) if path.is_file())
+        else:
+            # Missing files are reported when they are parsed
+            paths.append(item)
+    return list(dict.fromkeys(paths))
+
+# Parser, zero-copy flag and cache of a multi-file worker, set by _init_file_worker
+_file_worker = None
+
+def _init_file_worker(parser_name: str, zero_copy: bool, cache_path: Optional[str]):
+    """Build the parser (and open the cache) a worker uses for every file it gets."""
+    global _file_worker
+    cache = ParseCache(cache_path) if cache_path else None
+    _file_worker = (get_parser(parser_name), zero_copy, cache)
+
+def _close_file_worker():
+    """Close the cache of the multi-file worker in this process."""
+    global _file_worker
+    if _file_worker and _file_worker[2]:
+        _file_worker[2].close()
+    _file_worker = None
+
+def _parse_in_file_worker(file_path: str) -> FileResult:
+    """Parse one file with this process's worker parser, catching any error."""
+    parser, zero_copy, cache = _file_worker
+    started = time.perf_counter()
+    try:
+        # With zero_copy, each file's map is closed before its result is
+        # returned, so a long-lived worker does not pile up open descriptors
+        citations = _parse_file_with(parser, file_path, zero_copy, cache)
+        error = None
+    except Exception as e:
+        citations, error = [], f"{type(e).__name__}: {str(e)}"
+    stats = parser.get_stats()
+    parser.reset_stats()
+    return FileResult(file_path, citations, error, time.perf_counter() - started, stats)
+
+def parse_files(file_paths: List[str], parser_name: str = "apa", workers: Optional[int] = None,
+                zero_copy: bool = False, cache_path: Optional[str] = None) -> Iterator[FileResult]:
+    """Parse many files across a pool of worker processes.
     
-    else:  # Default to text format
-        if not citations:
-            return "No citations found."
+    Each worker builds its parser once and reuses it for every file it is
+    given. Results are yielded as files finish, so the order can differ from
+    file_paths. An error in one file is recorded in its result and does not
+    stop the others.
+    
+    Args:
+        file_paths: Paths of the files to parse
+        parser_name: Name of the parser to use (default: "apa")
+        workers: Number of worker processes (default: one per CPU; 1 parses
+            in this process)
+        zero_copy: Memory-map each file while it is parsed
+        cache_path: Path of a parse cache database shared by the workers
+        
+    Returns:
+        Iterator over FileResult objects, one per file
         
-        output = f"Found {len(citations)} citations:\n\n"
-        for i, citation in enumerate(citations, 1):
-            output += f"Citation {i}:\n"
-            output += f"  Authors: {', '.join(citation.authors)}\n"
-            output += f"  Year: {citation.year}\n"
-            output += f"  Title: {citation.title}\n"
-            output += f"  Source: {citation.source}\n"
-            if citation.doi:
-                output += f"  DOI: {citation.doi}\n"
-            if citation.url:
-                output += f"  URL: {citation.url}\n"
-            if citation.volume:
-                output += f"  Volume: {citation.volume}\n"
-            if citation.issue:
-                output += f"  Issue: {citation.issue}\n"
-            if citation.pages:
-                output += f"  Pages: {citation.pages}\n"
-            output += f"  Type: {citation.citation_type}\n"
-            output += f"  Confidence: {citation.confidence_score:.2f}\n"
-            output += "\n"
+    Raises:
+        ValueError: If the parser name is unknown
+    """
+    if get_parser(parser_name) is None:
+        raise ValueError(f"Parser '{parser_name}' not found.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(file_paths))
+    
+    if workers <= 1:
+        _init_file_worker(parser_name, zero_copy, cache_path)
+        try:
+            for file_path in file_paths:
+                yield _parse_in_file_worker(file_path)
+        finally:
+            _close_file_worker()
+        return
+    
+    # Imported here: multiprocessing is slow to import and single-file runs never need it
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_file_worker,
+                             initargs=(parser_name, zero_copy, cache_path)) as executor:
+        futures = {executor.submit(_parse_in_file_worker, path): path for path in file_paths}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed); the file is still reported
+                yield FileResult(futures[future], error=f"{type(e).__name__}: {str(e)}")
+
+def run_files(inputs: List[str], args: argparse.Namespace) -> int:
+    """Parse many files for the command line, streaming each file's output.
+    
+    Without --output-dir, results are written to --output-file (or stdout)
+    as each file finishes: JSON as one line per file, JSON Lines as one line
+    per citation with its "file", text and CSV under a "==> path <==" header. A summary goes to stderr.
+    
+    Args:
+        inputs: Files, directories and glob patterns from --file
+        args: Parsed command-line arguments
         
-        return output
+    Returns:
+        Process exit status: 0, or 1 if any file failed
+    """
+    if get_parser(args.parser) is None:
+        print(f"Error: Parser '{args.parser}' not found.", file=sys.stderr)
+        return 1
+    file_paths = expand_inputs(inputs, args.pattern)
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in file_paths]) if file_paths else ""
+    out = open(args.output_file, 'w', encoding='utf-8', newline='') if args.output_file else sys.stdout
+    totals = {}
+    citation_count = 0
+    failed = 0
+    started = time.perf_counter()
+    
+    try:
+        for result in parse_files(file_paths, args.parser, args.workers, args.mmap, args.cache):
+            for key, value in result.stats.items():
+                if isinstance(value, (int, float)):
+                    totals[key] = totals.get(key, 0) + value
+            if result.error:
+                failed += 1
+                print(f"Error: {result.path}: {result.error}", file=sys.stderr)
+                continue
+            citation_count += len(result.citations)
+            
+            if args.output_dir:
+                relative = os.path.relpath(os.path.abspath(result.path), root)
+                target = Path(args.output_dir) / Path(relative).with_suffix(OUTPUT_EXTENSIONS[args.output])
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if args.output in COLUMNAR_WRITERS:
+                    COLUMNAR_WRITERS[args.output](result.citations, str(target))
+                    continue
+                with open(target, 'w', encoding='utf-8', newline='') as f:
+                    with get_writer(args.output, f, total=len(result.citations)) as writer:
+                        writer.write_all(result.citations)
+            elif args.output == "json":
+                out.write(json.dumps({
+                    "file": result.path,
+                    "citations": [citation.to_dict() for citation in result.citations],
+                    "count": len(result.citations)
+                }) + "\n")
+            elif args.output == "jsonl":
+                for citation in result.citations:
+                    out.write(json.dumps({"file": result.path, **citation.to_dict()}) + "\n")
+            else:
+                out.write(f"==> {result.path} <==\n")
+                with get_writer(args.output, out, total=len(result.citations)) as writer:
+                    writer.write_all(result.citations)
+                out.write("\n\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    
+    seconds = time.perf_counter() - started
+    summary = {
+        "files": len(file_paths),
+        "failed_files": failed,
+        "citations": citation_count,
+        "seconds": seconds,
+        "files_per_second": len(file_paths) / seconds if seconds else 0.0,
+        "citations_per_second": citation_count / seconds if seconds else 0.0
+    }
+    print(f"Parsed {summary['files']} files ({failed} failed), {citation_count} citations in "
+          f"{seconds:.1f} s: {summary['files_per_second']:.1f} files/s, "
+          f"{summary['citations_per_second']:.1f} citations/s", file=sys.stderr)
+    if args.stats:
+        totals.update(summary)
+        print(json.dumps(totals, indent=2, sort_keys=True), file=sys.stderr)
+    return 1 if failed else 0
 
 def main():
     """Main function for command-line usage."""
     parser = argparse.ArgumentParser(description="Citation Parser Module")
-    parser.add_argument("-f", "--file", help="Path to file containing citations")
+    parser.add_argument("-f", "--file", action="append",
+                        help="File containing citations, or a directory or glob pattern of files "
+                             "to parse in parallel; repeat for several")
     parser.add_argument("-t", "--text", help="Text containing citations")
-    parser.add_argument("-p", "--parser", default="apa", help="Parser to use (default: apa)")
-    parser.add_argument("-o", "--output", default="text", choices=["text", "json", "csv"], 
-                        help="Output format (default: text)")
+    parser.add_argument("-p", "--parser", default="apa", help="Parser to use: apa, mla or auto (default: apa)")
+    parser.add_argument("-o", "--output", default="text", choices=["text", "json", "jsonl", "csv", "parquet", "arrow"],
+                        help="Output format (default: text); parquet and arrow need pyarrow and "
+                             "--output-file or --output-dir")
     parser.add_argument("--output-file", help="Path to output file (default: stdout)")
+    parser.add_argument("--output-dir", help="Directory for one output file per input file (multi-file runs)")
+    parser.add_argument("--pattern", default="*.txt",
+                        help="File name pattern used inside directories (default: *.txt)")
+    parser.add_argument("-j", "--workers", type=int,
+                        help="Worker processes for multi-file runs (default: one per CPU)")
+    parser.add_argument("--mmap", action="store_true",
+                        help="Read the input file through a memory map instead of in chunks")
+    parser.add_argument("--cache", help="Path to a parse cache database shared across runs")
+    parser.add_argument("--stats", action="store_true",
+                        help="Print parser statistics, with time spent in each parsing stage, as JSON to stderr")
     
     args = parser.parse_args()
     
@@ -132,22 +481,42 @@ def main():
         parser.print_help()
         sys.exit(1)
     
-    # Parse citations
-    citations = []
-    if args.file:
-        citations = parse_file(args.file, args.parser)
-    elif args.text:
-        citations = parse_text(args.text, args.parser)
+    # Several files, a directory or a glob pattern: parse them in parallel
+    if args.file and (len(args.file) > 1 or any(
+            os.path.isdir(item) or any(char in item for char in GLOB_CHARS) for item in args.file)):
+        if args.output in COLUMNAR_WRITERS and not args.output_dir:
+            parser.error(f"-o {args.output} with several files needs --output-dir")
+        sys.exit(run_files(args.file, args))
+    if args.output in COLUMNAR_WRITERS and not args.output_file:
+        parser.error(f"-o {args.output} needs --output-file")
     
-    # Format output
-    output = format_citation_output(citations, args.output)
+    # Parse citations, writing each one as soon as it is found
+    cache = ParseCache(args.cache) if args.cache else None
+    stats = {} if args.stats else None
+    out = None
+    try:
+        if args.file:
+            citations = iter_file_citations(args.file[0], args.parser, zero_copy=args.mmap, cache=cache, stats=stats)
+            total = None
+        else:
+            citations = parse_text(args.text, args.parser, cache=cache, stats=stats)
+            total = len(citations)
+        if args.output in COLUMNAR_WRITERS:
+            COLUMNAR_WRITERS[args.output](citations, args.output_file)
+        else:
+            out = open(args.output_file, 'w', encoding='utf-8', newline='') if args.output_file else sys.stdout
+            with get_writer(args.output, out, total=total) as writer:
+                writer.write_all(citations)
+            if out is sys.stdout:
+                out.write("\n")
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+        if cache:
+            cache.close()
     
-    # Write output
-    if args.output_file:
-        with open(args.output_file, 'w', encoding='utf-8') as f:
-            f.write(output)
-    else:
-        print(output)
+    if stats is not None:
+        print(json.dumps(stats, indent=2, sort_keys=True), file=sys.stderr)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,8 +1,12 @@
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-@dataclass
+# Slotted instances have no per-instance __dict__; dataclass(slots=True) needs Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Citation:
     """Standardized model for storing parsed citations.
     
@@ -50,6 +54,66 @@ class Citation:
             "confidence_score": self.confidence_score
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Citation":
+        """Build a citation from a dictionary made by to_dict().
+        
+        Keys that are not citation fields, such as the "file" of multi-file
+        JSON output, are ignored.
+        
+        Args:
+            data: Dictionary of citation fields
+            
+        Returns:
+            Citation with the given fields
+        """
+        names = {f.name for f in fields(Citation)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+    
     def __str__(self):
         """String representation of the citation."""
-        return f"Citation({self.citation_format}): {', '.join(self.authors)} ({self.year}). {self.title}. {self.source}."
\ No newline at end of file
+        return f"Citation({self.citation_format}): {', '.join(self.authors)} ({self.year}). {self.title}. {self.source}."
+
+class SpanCitation(Citation):
+    """Citation whose original text is a byte range of a shared SourceBuffer.
+    
+    Only the (start, end) offsets are stored; citation_text is decoded from
+    the buffer each time it is read, so a large corpus does not keep a second
+    copy of every reference in memory.
+    """
+    
+    __slots__ = ("buffer", "span_start", "span_end", "_citation_text")
+    
+    def __init__(self, *args, buffer=None, span_start: int = 0, span_end: int = 0, **kwargs):
+        self.buffer = buffer
+        self.span_start = span_start
+        self.span_end = span_end
+        super().__init__(*args, **kwargs)
+    
+    @property
+    def citation_text(self) -> str:
+        """The original citation text, read from the source buffer."""
+        if self._citation_text or self.buffer is None:
+            return self._citation_text
+        return self.buffer.text(self.span_start, self.span_end).strip()
+    
+    @citation_text.setter
+    def citation_text(self, value: str):
+        self._citation_text = value
+    
+    @classmethod
+    def from_citation(cls, citation: Citation, buffer, span_start: int, span_end: int) -> "SpanCitation":
+        """Build a span citation from a parsed one, dropping its copy of the text.
+        
+        Args:
+            citation: Citation parsed from buffer.text(span_start, span_end)
+            buffer: SourceBuffer the citation was read from
+            span_start: Start byte offset of the citation in buffer
+            span_end: End byte offset of the citation in buffer
+            
+        Returns:
+            SpanCitation with the same fields as citation
+        """
+        values = {f.name: getattr(citation, f.name) for f in fields(citation)}
+        values["citation_text"] = ""
+        return cls(buffer=buffer, span_start=span_start, span_end=span_end, **values)
\ No newline at end of file
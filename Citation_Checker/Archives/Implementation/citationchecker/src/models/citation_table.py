@@ -0,0 +1,271 @@
+"""
+Citation Table
+
+This module stores large sets of citations column by column instead of as one
+object per citation. Strings are kept UTF-8 encoded in one shared pool and rows
+hold 4-byte ids into it, with repetitive values such as sources and authors
+interned so each is stored once. Years and confidence scores are packed into
+typed arrays, and author lists are runs of ids marked by offsets. Filtering, sorting
+and slicing return views that share the columns, and rows are read back as
+lightweight CitationView objects.
+"""
+
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.models.citation import Citation
+
+# String fields of Citation, each stored as ids into the string pool
+STRING_COLUMNS = ("title", "source", "doi", "url", "volume", "issue", "pages", "publisher",
+                  "citation_type", "citation_format", "citation_text")
+
+# String columns whose values repeat across citations, stored once each
+INTERNED_COLUMNS = ("source", "volume", "issue", "publisher", "citation_type", "citation_format")
+
+# Every column, in Citation field order
+COLUMNS = ("authors", "year") + STRING_COLUMNS + ("confidence_score",)
+
+# Stored in the year column for citations without a year
+_NO_YEAR = -2 ** 31
+
+class CitationView:
+    """One row of a CitationTable, read with the same attributes as a Citation.
+    
+    A view holds only its table and row number; each attribute is decoded
+    from the table's columns when it is read.
+    """
+    
+    __slots__ = ("table", "row")
+    
+    def __init__(self, table: "CitationTable", row: int):
+        self.table = table
+        self.row = row
+    
+    def __getattr__(self, name: str) -> Any:
+        # Slots that are not set yet (e.g. while copy or pickle builds a view)
+        # and special methods must not be looked up in the table, which would
+        # read self.table and recurse
+        if name in CitationView.__slots__ or name.startswith("__"):
+            raise AttributeError(name)
+        return self.table._value(name, self.row)
+    
+    def __copy__(self) -> "CitationView":
+        return CitationView(self.table, self.row)
+    
+    def __reduce__(self):
+        # Pickled (and deep-copied) views become Citations rather than carry
+        # the whole table with them, e.g. to a worker process
+        return (Citation.from_dict, (self.to_dict(),))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the row to the same dictionary as Citation.to_dict()."""
+        return {name: self.table._value(name, self.row) for name in COLUMNS}
+    
+    def to_citation(self) -> Citation:
+        """Copy the row into a Citation."""
+        return Citation(**self.to_dict())
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (CitationView, Citation)):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"CitationView(row={self.row}, title={self.title!r})"
+
+class CitationTable:
+    """Column-wise store of many citations.
+    
+    Tables are built by appending citations. filter(), where(), sort() and
+    slicing return views: tables that share the parent's columns and string
+    pool and keep only an array of the rows they select. Views cannot be
+    appended to.
+    """
+    
+    def __init__(self, citations: Iterable[Citation] = ()):
+        """Initialize the table.
+        
+        Args:
+            citations: Citations to append
+        """
+        # String pool: string i is _pool[_pool_offsets[i]:_pool_offsets[i + 1]]; id 0 is None
+        self._pool = bytearray()
+        self._pool_offsets = array('Q', [0, 0])
+        # Ids of interned strings (those of INTERNED_COLUMNS and authors)
+        self._string_ids: Dict[Optional[str], int] = {None: 0}
+        self._columns = {name: array('I') for name in STRING_COLUMNS}
+        self._years = array('i')
+        self._scores = array('d')
+        # Authors of row i are _author_ids[_author_offsets[i]:_author_offsets[i + 1]]
+        self._author_offsets = array('Q', [0])
+        self._author_ids = array('I')
+        # Rows of the base columns this table selects, or None for all of them
+        self._rows: Optional[array] = None
+        self.extend(citations)
+    
+    def _store(self, value: Optional[str]) -> int:
+        """Add a string to the pool and get its id."""
+        if value is None:
+            return 0
+        self._pool += value.encode('utf-8')
+        self._pool_offsets.append(len(self._pool))
+        return len(self._pool_offsets) - 2
+    
+    def _intern(self, value: Optional[str]) -> int:
+        """Get the pool id of a string, adding it to the pool if it is new."""
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._store(value)
+            self._string_ids[value] = string_id
+        return string_id
+    
+    def _string(self, string_id: int) -> Optional[str]:
+        """Decode a string from the pool."""
+        if not string_id:
+            return None
+        return self._pool[self._pool_offsets[string_id]:self._pool_offsets[string_id + 1]].decode('utf-8')
+    
+    def append(self, citation: Citation):
+        """Append one citation (or CitationView) as a new row.
+        
+        Args:
+            citation: Citation to store
+            
+        Raises:
+            ValueError: If the table is a view
+        """
+        if self._rows is not None:
+            raise ValueError("Cannot append to a view of a table")
+        for name, column in self._columns.items():
+            store = self._intern if name in INTERNED_COLUMNS else self._store
+            column.append(store(getattr(citation, name)))
+        year = citation.year
+        self._years.append(_NO_YEAR if year is None else year)
+        self._scores.append(citation.confidence_score)
+        self._author_ids.extend(self._intern(author) for author in citation.authors)
+        self._author_offsets.append(len(self._author_ids))
+    
+    def extend(self, citations: Iterable[Citation]):
+        """Append citations from an iterable, consuming it lazily.
+        
+        Args:
+            citations: Citations to store
+        """
+        for citation in citations:
+            self.append(citation)
+    
+    def __len__(self) -> int:
+        return len(self._scores) if self._rows is None else len(self._rows)
+    
+    def _base_row(self, index: int) -> int:
+        """Map a row number of this table to a row of the base columns."""
+        return index if self._rows is None else self._rows[index]
+    
+    def _value(self, name: str, index: int) -> Any:
+        """Decode one field of one row."""
+        row = self._base_row(index)
+        column = self._columns.get(name)
+        if column is not None:
+            return self._string(column[row])
+        if name == "year":
+            year = self._years[row]
+            return None if year == _NO_YEAR else year
+        if name == "confidence_score":
+            return self._scores[row]
+        if name == "authors":
+            ids = self._author_ids[self._author_offsets[row]:self._author_offsets[row + 1]]
+            return [self._string(string_id) for string_id in ids]
+        raise AttributeError(f"Citations have no field '{name}'")
+    
+    def _view(self, indexes: Iterable[int]) -> "CitationTable":
+        """Make a view of some rows of this table, given by row number."""
+        view = CitationTable.__new__(CitationTable)
+        view.__dict__.update(self.__dict__)
+        view._rows = array('Q', (self._base_row(index) for index in indexes))
+        return view
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CitationTable index out of range")
+        return CitationView(self, index)
+    
+    def __iter__(self) -> Iterator[CitationView]:
+        for index in range(len(self)):
+            yield CitationView(self, index)
+    
+    def column(self, name: str) -> List[Any]:
+        """Decode one column for every row.
+        
+        Args:
+            name: Citation field name
+            
+        Returns:
+            List of the field's values, in row order
+        """
+        return [self._value(name, index) for index in range(len(self))]
+    
+    def filter(self, predicate: Callable[[CitationView], bool]) -> "CitationTable":
+        """Select the rows for which predicate is true.
+        
+        Args:
+            predicate: Function of a CitationView
+            
+        Returns:
+            View of the matching rows
+        """
+        return self._view(index for index in range(len(self)) if predicate(CitationView(self, index)))
+    
+    def where(self, **conditions: Any) -> "CitationTable":
+        """Select the rows whose fields equal the given values.
+        
+        Interned fields (INTERNED_COLUMNS) are compared by pool id, without
+        decoding any row.
+        
+        Args:
+            **conditions: Field name and value pairs, e.g. citation_type="book"
+            
+        Returns:
+            View of the matching rows
+            
+        Raises:
+            AttributeError: If a field name is unknown
+        """
+        indexes = range(len(self))
+        for name, value in conditions.items():
+            if name not in COLUMNS:
+                raise AttributeError(f"Citations have no field '{name}'")
+            if name in INTERNED_COLUMNS:
+                column = self._columns[name]
+                string_id = self._string_ids.get(value, -1)
+                indexes = [i for i in indexes if column[self._base_row(i)] == string_id]
+            else:
+                indexes = [i for i in indexes if self._value(name, i) == value]
+        return self._view(indexes)
+    
+    def sort(self, *names: str, reverse: bool = False) -> "CitationTable":
+        """Order the rows by one or more fields.
+        
+        Rows missing a value sort before rows that have one.
+        
+        Args:
+            *names: Field names to sort by, most significant first
+            reverse: Sort in descending order
+            
+        Returns:
+            View of the rows in sorted order
+        """
+        def key(index):
+            return tuple((value is not None, value) for value in (self._value(name, index) for name in names))
+        return self._view(sorted(range(len(self)), key=key, reverse=reverse))
+    
+    def to_citations(self) -> List[Citation]:
+        """Copy every row into a Citation.
+        
+        Returns:
+            List of Citation objects, in row order
+        """
+        return [view.to_citation() for view in self]
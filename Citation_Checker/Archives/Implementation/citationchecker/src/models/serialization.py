@@ -0,0 +1,427 @@
+"""
+Record Serialization
+
+This module saves and loads Citation and CrawlResult records in bulk, so that
+results can be passed between the parse, crawl and verify stages without
+re-parsing JSON documents. Two formats are supported:
+
+- "binary": a short header, then one length-prefixed MessagePack payload per
+  record. Each record is an array of its field values, so field names are
+  not repeated. The msgpack package is used when it is installed; otherwise
+  a pure-Python encoder and decoder write and read the same bytes.
+- "jsonl": one JSON object per line, with a "type" key. orjson is used when
+  it is installed.
+  
+Files are read back one record at a time, so files of any size can be
+streamed.
+"""
+
+import json
+import struct
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, BinaryIO, Iterable, Iterator, Tuple
+
+from src.models.citation import Citation
+from src.models.citation_table import CitationView
+
+# First bytes of a binary record file; the last one is the format version
+MAGIC = b"CITREC\x00\x01"
+
+# Field order of each record type in binary records
+CITATION_FIELDS = tuple(f.name for f in fields(Citation))
+CRAWL_RESULT_FIELDS = ("url", "success", "content", "metadata", "error", "status_code",
+                       "response_time", "crawl_timestamp")
+
+# Record types, by the tag stored first in each binary record
+RECORD_TYPES = ("citation", "crawl_result")
+
+FORMATS = ("binary", "jsonl")
+
+_FRAME = struct.Struct("<I")
+
+def _crawl_result_class():
+    """Import CrawlResult only when crawl results are actually read or written."""
+    from src.crawlers.base_crawler import CrawlResult
+    return CrawlResult
+
+def _record_type(record: Any) -> Tuple[int, Tuple[str, ...]]:
+    """Get the tag and field names of a record."""
+    if isinstance(record, (Citation, CitationView)):
+        return 0, CITATION_FIELDS
+    if isinstance(record, _crawl_result_class()):
+        return 1, CRAWL_RESULT_FIELDS
+    raise TypeError(f"Cannot serialize {type(record).__name__} records")
+
+def _build(tag: int, data: dict) -> Any:
+    """Build a record from its tag and field dictionary."""
+    if tag == 0:
+        return Citation.from_dict(data)
+    if tag == 1:
+        return _crawl_result_class().from_dict(data)
+    raise ValueError(f"Unknown record type tag {tag}")
+
+# MessagePack
+
+def _pack(value: Any, out: bytearray):
+    """Append the MessagePack encoding of a value to out."""
+    if value is None:
+        out.append(0xc0)
+    elif value is True:
+        out.append(0xc3)
+    elif value is False:
+        out.append(0xc2)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80:
+            out.append(value)
+        elif -32 <= value < 0:
+            out.append(value & 0xff)
+        elif value > 0:
+            if value <= 0xff:
+                out += struct.pack(">BB", 0xcc, value)
+            elif value <= 0xffff:
+                out += struct.pack(">BH", 0xcd, value)
+            elif value <= 0xffffffff:
+                out += struct.pack(">BI", 0xce, value)
+            elif value <= 0xffffffffffffffff:
+                out += struct.pack(">BQ", 0xcf, value)
+            else:
+                raise TypeError("Integer too large to serialize")
+        elif value >= -0x80:
+            out += struct.pack(">Bb", 0xd0, value)
+        elif value >= -0x8000:
+            out += struct.pack(">Bh", 0xd1, value)
+        elif value >= -0x80000000:
+            out += struct.pack(">Bi", 0xd2, value)
+        elif value >= -0x8000000000000000:
+            out += struct.pack(">Bq", 0xd3, value)
+        else:
+            raise TypeError("Integer too small to serialize")
+    elif isinstance(value, float):
+        out += struct.pack(">Bd", 0xcb, value)
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        size = len(data)
+        if size < 32:
+            out.append(0xa0 | size)
+        elif size <= 0xff:
+            out += struct.pack(">BB", 0xd9, size)
+        elif size <= 0xffff:
+            out += struct.pack(">BH", 0xda, size)
+        else:
+            out += struct.pack(">BI", 0xdb, size)
+        out += data
+    elif isinstance(value, (bytes, bytearray)):
+        size = len(value)
+        if size <= 0xff:
+            out += struct.pack(">BB", 0xc4, size)
+        elif size <= 0xffff:
+            out += struct.pack(">BH", 0xc5, size)
+        else:
+            out += struct.pack(">BI", 0xc6, size)
+        out += value
+    elif isinstance(value, (list, tuple)):
+        size = len(value)
+        if size < 16:
+            out.append(0x90 | size)
+        elif size <= 0xffff:
+            out += struct.pack(">BH", 0xdc, size)
+        else:
+            out += struct.pack(">BI", 0xdd, size)
+        for item in value:
+            _pack(item, out)
+    elif isinstance(value, dict):
+        size = len(value)
+        if size < 16:
+            out.append(0x80 | size)
+        elif size <= 0xffff:
+            out += struct.pack(">BH", 0xde, size)
+        else:
+            out += struct.pack(">BI", 0xdf, size)
+        for key, item in value.items():
+            _pack(key, out)
+            _pack(item, out)
+    else:
+        raise TypeError(f"Cannot serialize value of type {type(value).__name__}")
+
+# Fixed-size values: type byte -> (struct format, size)
+_FIXED = {
+    0xca: (">f", 4), 0xcb: (">d", 8),
+    0xcc: (">B", 1), 0xcd: (">H", 2), 0xce: (">I", 4), 0xcf: (">Q", 8),
+    0xd0: (">b", 1), 0xd1: (">h", 2), 0xd2: (">i", 4), 0xd3: (">q", 8)
+}
+
+# Sized values: type byte -> (kind, struct format of the size, size of the size)
+_SIZED = {
+    0xc4: ("bin", ">B", 1), 0xc5: ("bin", ">H", 2), 0xc6: ("bin", ">I", 4),
+    0xd9: ("str", ">B", 1), 0xda: ("str", ">H", 2), 0xdb: ("str", ">I", 4),
+    0xdc: ("array", ">H", 2), 0xdd: ("array", ">I", 4),
+    0xde: ("map", ">H", 2), 0xdf: ("map", ">I", 4)
+}
+
+def _unpack(data: bytes, pos: int) -> Tuple[Any, int]:
+    """Decode the MessagePack value at data[pos:], returning it and the next position."""
+    byte = data[pos]
+    pos += 1
+    if byte < 0x80:
+        return byte, pos
+    if byte >= 0xe0:
+        return byte - 0x100, pos
+    if byte <= 0x8f:
+        kind, size = "map", byte & 0x0f
+    elif byte <= 0x9f:
+        kind, size = "array", byte & 0x0f
+    elif byte <= 0xbf:
+        kind, size = "str", byte & 0x1f
+    elif byte == 0xc0:
+        return None, pos
+    elif byte == 0xc2:
+        return False, pos
+    elif byte == 0xc3:
+        return True, pos
+    elif byte in _FIXED:
+        fmt, width = _FIXED[byte]
+        return struct.unpack_from(fmt, data, pos)[0], pos + width
+    elif byte in _SIZED:
+        kind, fmt, width = _SIZED[byte]
+        size = struct.unpack_from(fmt, data, pos)[0]
+        pos += width
+    else:
+        raise ValueError(f"Unsupported MessagePack type byte 0x{byte:02x}")
+    
+    if kind == "str":
+        return bytes(data[pos:pos + size]).decode('utf-8'), pos + size
+    if kind == "bin":
+        return bytes(data[pos:pos + size]), pos + size
+    if kind == "array":
+        items = []
+        for _ in range(size):
+            item, pos = _unpack(data, pos)
+            items.append(item)
+        return items, pos
+    mapping = {}
+    for _ in range(size):
+        key, pos = _unpack(data, pos)
+        mapping[key], pos = _unpack(data, pos)
+    return mapping, pos
+
+@lru_cache(maxsize=None)
+def _msgpack():
+    """Get the msgpack module, or None if it is not installed."""
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+def packb(value: Any) -> bytes:
+    """Encode a value as MessagePack.
+    
+    Args:
+        value: None, bool, int, float, str, bytes, or lists and dicts of them
+        
+    Returns:
+        Encoded bytes
+        
+    Raises:
+        TypeError: If the value contains an unsupported type
+    """
+    msgpack = _msgpack()
+    if msgpack is not None:
+        return msgpack.packb(value, use_bin_type=True)
+    out = bytearray()
+    _pack(value, out)
+    return bytes(out)
+
+def unpackb(data: bytes) -> Any:
+    """Decode one MessagePack value.
+    
+    Args:
+        data: Encoded bytes
+        
+    Returns:
+        Decoded value
+        
+    Raises:
+        ValueError: If the data is not a single valid value
+    """
+    msgpack = _msgpack()
+    if msgpack is not None:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    try:
+        value, pos = _unpack(data, 0)
+    except (IndexError, struct.error):
+        raise ValueError("Truncated MessagePack data") from None
+    if pos != len(data):
+        raise ValueError("Extra bytes after MessagePack value")
+    return value
+
+# JSON
+
+@lru_cache(maxsize=None)
+def _json_codec():
+    """Get (dumps to bytes, loads) from orjson if it is installed, else from json."""
+    try:
+        import orjson
+    except ImportError:
+        return (lambda value: json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode('utf-8'),
+                json.loads)
+    return orjson.dumps, orjson.loads
+
+# Records
+
+def to_bytes(record: Any) -> bytes:
+    """Serialize one Citation or CrawlResult as a MessagePack array.
+    
+    Args:
+        record: Citation (or CitationView) or CrawlResult
+        
+    Returns:
+        Encoded record
+        
+    Raises:
+        TypeError: If the record is of another type
+    """
+    tag, names = _record_type(record)
+    return packb([tag] + [getattr(record, name) for name in names])
+
+def from_bytes(data: bytes) -> Any:
+    """Deserialize one record made by to_bytes().
+    
+    Args:
+        data: Encoded record
+        
+    Returns:
+        Citation or CrawlResult
+        
+    Raises:
+        ValueError: If the data is not a valid record
+    """
+    values = unpackb(data)
+    if not isinstance(values, list) or not values:
+        raise ValueError("Not a serialized record")
+    tag = values[0]
+    if tag == 0 and len(values) == len(CITATION_FIELDS) + 1:
+        # Values are in field order, so no dictionary is needed
+        return Citation(*values[1:])
+    names = CITATION_FIELDS if tag == 0 else CRAWL_RESULT_FIELDS
+    return _build(tag, dict(zip(names, values[1:])))
+
+class RecordWriter:
+    """Writes records to a binary stream one at a time.
+    
+    Attributes:
+        out: Binary stream written to
+        format: "binary" or "jsonl"
+        count: Number of records written so far
+    """
+    
+    def __init__(self, out: BinaryIO, format: str = "binary"):
+        """Initialize the writer, writing the file header for binary output.
+        
+        Args:
+            out: Binary stream to write to
+            format: "binary" or "jsonl"
+            
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unknown record format '{format}'")
+        self.out = out
+        self.format = format
+        self.count = 0
+        self._dumps = _json_codec()[0]
+        if format == "binary":
+            out.write(MAGIC)
+    
+    def write(self, record: Any):
+        """Write one Citation or CrawlResult.
+        
+        Args:
+            record: Record to write
+            
+        Raises:
+            TypeError: If the record is of another type
+        """
+        if self.format == "binary":
+            payload = to_bytes(record)
+            self.out.write(_FRAME.pack(len(payload)))
+            self.out.write(payload)
+        else:
+            tag, names = _record_type(record)
+            data = {"type": RECORD_TYPES[tag]}
+            data.update((name, getattr(record, name)) for name in names)
+            self.out.write(self._dumps(data))
+            self.out.write(b"\n")
+        self.count += 1
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.out.flush()
+
+def write_records(records: Iterable[Any], path: str, format: str = "binary") -> int:
+    """Write records to a file.
+    
+    Args:
+        records: Citations and crawl results, consumed lazily
+        path: Path of the file to write
+        format: "binary" or "jsonl"
+        
+    Returns:
+        Number of records written
+    """
+    with open(path, 'wb') as f, RecordWriter(f, format) as writer:
+        for record in records:
+            writer.write(record)
+        return writer.count
+
+def iter_records(source) -> Iterator[Any]:
+    """Read records from a file made by write_records() (or JSON Lines output).
+    
+    The format is detected from the file's first bytes. Records are read and
+    decoded one at a time. JSON lines without a "type" key are read as
+    citations, so the JSON Lines output of the command line can be loaded.
+    
+    Args:
+        source: Path of the file, or a binary stream
+        
+    Returns:
+        Iterator over Citation and CrawlResult objects
+        
+    Raises:
+        ValueError: If a binary file is truncated or holds an invalid record
+    """
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        with open(source, 'rb') as f:
+            yield from iter_records(f)
+        return
+    
+    header = source.read(len(MAGIC))
+    if header == MAGIC:
+        while True:
+            prefix = source.read(_FRAME.size)
+            if not prefix:
+                return
+            if len(prefix) < _FRAME.size:
+                raise ValueError("Truncated record file")
+            size = _FRAME.unpack(prefix)[0]
+            payload = source.read(size)
+            if len(payload) < size:
+                raise ValueError("Truncated record file")
+            yield from_bytes(payload)
+    
+    loads = _json_codec()[1]
+    first = header + source.readline() if header and not header.endswith(b"\n") else header
+    for line in _chain_lines(first, source):
+        if line.strip():
+            data = loads(line)
+            tag = RECORD_TYPES.index(data.pop("type", "citation"))
+            yield _build(tag, data)
+
+def _chain_lines(first: bytes, source: BinaryIO) -> Iterator[bytes]:
+    """Yield the lines in first, which starts the stream, then the rest of source."""
+    yield from first.splitlines()
+    yield from source
@@ -0,0 +1,66 @@
+"""
+Memory-Mapped Citation Source
+
+This module provides a read-only memory map of a text file that parsed citations
+can point into by byte offsets, so the original text of each reference does not
+have to be kept as a separate string.
+"""
+
+import mmap
+import os
+
+class SourceBuffer:
+    """Read-only memory map of a text file shared by the citations parsed from it.
+    
+    Attributes:
+        path: Path of the mapped file
+        encoding: Text encoding of the file
+        data: The mapped bytes (an mmap, or b"" for an empty file)
+    """
+    
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        """Map a file into memory.
+        
+        Args:
+            path: Path to the file
+            encoding: Text encoding of the file (default: utf-8)
+        """
+        self.path = path
+        self.encoding = encoding
+        with open(path, 'rb') as f:
+            # mmap refuses empty files; the mapping outlives the file object
+            if os.fstat(f.fileno()).st_size:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.data = b""
+        self._view = memoryview(self.data)
+    
+    def text(self, start: int, end: int) -> str:
+        """Decode a byte range as text, with newlines translated like open() does.
+        
+        Args:
+            start: Start byte offset
+            end: End byte offset
+            
+        Returns:
+            The decoded text
+        """
+        text = str(self._view[start:end], self.encoding)
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    def close(self):
+        """Release the mapping. Citations pointing into it can no longer be read."""
+        self._view.release()
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,178 @@
+"""
+Columnar Citation Export
+
+This module converts a stream of citations into Apache Arrow record batches
+and writes them as Parquet or Arrow IPC files, for analytics tools that scan
+columns rather than parse JSON. Authors are stored as a list column, and the
+source, citation type and citation format columns are dictionary encoded.
+
+pyarrow is only imported when one of these functions is called, so the rest
+of the package works without it.
+"""
+
+from dataclasses import fields
+from typing import Iterable, Iterator
+
+from src.models.citation import Citation
+
+# Columns in schema order, one per Citation field
+COLUMNS = tuple(f.name for f in fields(Citation))
+
+# Columns with few distinct values, stored as indexes into a dictionary
+DICTIONARY_COLUMNS = ("source", "citation_type", "citation_format")
+
+# Rows per record batch (and per Parquet row group)
+DEFAULT_BATCH_SIZE = 65536
+
+def _require_pyarrow():
+    """Import pyarrow, with an installation hint if it is missing."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Arrow and Parquet output require pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+def citation_schema():
+    """Get the Arrow schema of exported citations.
+    
+    Returns:
+        pyarrow.Schema with one field per Citation field
+        
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    pa = _require_pyarrow()
+    string = pa.string()
+    types = {
+        "authors": pa.list_(string),
+        "year": pa.int32(),
+        "confidence_score": pa.float64()
+    }
+    return pa.schema([
+        pa.field(name, pa.dictionary(pa.int32(), string) if name in DICTIONARY_COLUMNS else types.get(name, string))
+        for name in COLUMNS
+    ])
+
+def iter_record_batches(citations: Iterable[Citation], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator:
+    """Convert a stream of citations into Arrow record batches.
+    
+    Citations are consumed lazily and at most batch_size rows are held at a
+    time. Dictionaries only grow from one batch to the next, so each batch's
+    dictionary extends the previous one's and IPC writers can send deltas.
+    
+    Args:
+        citations: Citations to convert
+        batch_size: Maximum rows per batch
+        
+    Returns:
+        Iterator over pyarrow.RecordBatch objects with citation_schema()
+        
+    Raises:
+        ImportError: If pyarrow is not installed
+        ValueError: If batch_size is less than 1
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    pa = _require_pyarrow()
+    schema = citation_schema()
+    # Value -> index, in index order, for each dictionary column
+    dictionaries = {name: {} for name in DICTIONARY_COLUMNS}
+    columns = {name: [] for name in COLUMNS}
+    
+    def build():
+        arrays = []
+        for schema_field in schema:
+            values = columns[schema_field.name]
+            if schema_field.name in dictionaries:
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(values, pa.int32()),
+                    pa.array(list(dictionaries[schema_field.name]), pa.string())
+                ))
+            else:
+                arrays.append(pa.array(values, schema_field.type))
+            values.clear()
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+    
+    rows = 0
+    for citation in citations:
+        for name in COLUMNS:
+            value = getattr(citation, name)
+            if name in dictionaries and value is not None:
+                value = dictionaries[name].setdefault(value, len(dictionaries[name]))
+            columns[name].append(value)
+        rows += 1
+        if rows == batch_size:
+            yield build()
+            rows = 0
+    if rows:
+        yield build()
+
+def citations_from_batches(batches: Iterable) -> Iterator[Citation]:
+    """Convert Arrow record batches (or tables) back into citations.
+    
+    Args:
+        batches: pyarrow.RecordBatch or pyarrow.Table objects with the
+            columns of citation_schema()
+            
+    Returns:
+        Iterator over Citation objects
+    """
+    for batch in batches:
+        for row in batch.to_pylist():
+            yield Citation(**{name: row[name] for name in COLUMNS})
+
+def write_parquet(citations: Iterable[Citation], path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                  compression: str = "zstd") -> int:
+    """Write citations to a Parquet file, one row group per batch.
+    
+    Args:
+        citations: Citations to write, consumed lazily
+        path: Path of the Parquet file
+        batch_size: Rows per row group
+        compression: Parquet compression codec
+        
+    Returns:
+        Number of citations written
+        
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+    count = 0
+    with pq.ParquetWriter(path, citation_schema(), compression=compression) as writer:
+        for batch in iter_record_batches(citations, batch_size):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+def write_arrow(citations: Iterable[Citation], path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                compression: str = "zstd") -> int:
+    """Write citations to an Arrow IPC (Feather v2) file.
+    
+    Args:
+        citations: Citations to write, consumed lazily
+        path: Path of the Arrow file
+        batch_size: Rows per record batch
+        compression: Buffer compression codec ("zstd", "lz4" or None)
+        
+    Returns:
+        Number of citations written
+        
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    pa = _require_pyarrow()
+    options = pa.ipc.IpcWriteOptions(compression=compression, emit_dictionary_deltas=True)
+    count = 0
+    with pa.ipc.new_file(path, citation_schema(), options=options) as writer:
+        for batch in iter_record_batches(citations, batch_size):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+# Writer function for each columnar output format
+COLUMNAR_WRITERS = {
+    "parquet": write_parquet,
+    "arrow": write_arrow
+}
@@ -0,0 +1,200 @@
+"""
+Streaming Citation Writers
+
+This module writes citations to an open text stream one at a time, as they
+are produced, so that output of any size is written in constant memory. The
+JSON, JSON Lines, CSV and text formats of the command line each have a writer.
+"""
+
+import csv
+import json
+from typing import IO, Iterable, Optional
+
+from src.models.citation import Citation
+
+# Column order of CSV output
+CSV_COLUMNS = ("authors", "year", "title", "source", "citation_type", "confidence_score",
+               "doi", "url", "volume", "issue", "pages")
+
+class CitationWriter:
+    """Base class for writers that stream citations to a text stream.
+    
+    Writers can be used as context managers; leaving the block calls close(),
+    which writes any trailer but does not close the underlying stream.
+    
+    Attributes:
+        out: Text stream written to
+        count: Number of citations written so far
+        closed: Whether close() has been called
+    """
+    
+    def __init__(self, out: IO[str]):
+        """Initialize the writer.
+        
+        Args:
+            out: Text stream to write to
+        """
+        self.out = out
+        self.count = 0
+        self.closed = False
+    
+    def write(self, citation: Citation):
+        """Write one citation.
+        
+        Args:
+            citation: Citation to write
+        """
+        self.count += 1
+        self._write(citation)
+    
+    def write_all(self, citations: Iterable[Citation]) -> int:
+        """Write every citation from an iterable, consuming it lazily.
+        
+        Args:
+            citations: Citations to write
+            
+        Returns:
+            Number of citations written by this call
+        """
+        start = self.count
+        for citation in citations:
+            self.write(citation)
+        return self.count - start
+    
+    def close(self):
+        """Finish the output. Calling close() again has no effect."""
+        if not self.closed:
+            self.closed = True
+            self._finish()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _write(self, citation: Citation):
+        """Write the output for one citation."""
+        raise NotImplementedError("Subclasses must implement this method")
+    
+    def _finish(self):
+        """Write whatever follows the last citation."""
+        pass
+
+class JSONLinesWriter(CitationWriter):
+    """Writes each citation as one JSON object per line."""
+    
+    def _write(self, citation: Citation):
+        self.out.write(json.dumps(citation.to_dict()))
+        self.out.write("\n")
+
+class JSONWriter(CitationWriter):
+    """Writes a {"citations": [...], "count": n} document, one citation at a time.
+    
+    The output is the same as json.dumps() of the whole document with
+    indent=2, without ever holding more than one citation.
+    """
+    
+    def _write(self, citation: Citation):
+        self.out.write('{\n  "citations": [\n' if self.count == 1 else ',\n')
+        # Strings are escaped, so every newline here is one json.dumps() added
+        item = json.dumps(citation.to_dict(), indent=2)
+        self.out.write("    " + item.replace("\n", "\n    "))
+    
+    def _finish(self):
+        if self.count:
+            self.out.write(f'\n  ],\n  "count": {self.count}\n}}')
+        else:
+            self.out.write('{\n  "citations": [],\n  "count": 0\n}')
+
+class CSVWriter(CitationWriter):
+    """Writes citations as RFC 4180 CSV, with a header row.
+    
+    Fields holding commas, quotes or line breaks are quoted, quotes are
+    doubled and rows end with CRLF. Authors are joined with "|" and missing
+    values are left empty. Files written to should be opened with newline=""
+    so that line endings are not translated.
+    """
+    
+    def __init__(self, out: IO[str]):
+        super().__init__(out)
+        self.rows = csv.writer(out)
+        self.rows.writerow(CSV_COLUMNS)
+    
+    def _write(self, citation: Citation):
+        self.rows.writerow([
+            "|".join(citation.authors), citation.year, citation.title, citation.source,
+            citation.citation_type, citation.confidence_score, citation.doi, citation.url,
+            citation.volume, citation.issue, citation.pages
+        ])
+
+class TextWriter(CitationWriter):
+    """Writes citations as numbered, human-readable blocks.
+    
+    When the number of citations is known up front, a "Found n citations:"
+    header is written first; otherwise the same line is written after the
+    last citation.
+    """
+    
+    def __init__(self, out: IO[str], total: Optional[int] = None):
+        """Initialize the writer.
+        
+        Args:
+            out: Text stream to write to
+            total: Number of citations that will be written, if known
+        """
+        super().__init__(out)
+        self.total = total
+        if total:
+            out.write(f"Found {total} citations:\n\n")
+    
+    def _write(self, citation: Citation):
+        lines = [
+            f"Citation {self.count}:",
+            f"  Authors: {', '.join(citation.authors)}",
+            f"  Year: {citation.year}",
+            f"  Title: {citation.title}",
+            f"  Source: {citation.source}"
+        ]
+        for label, value in (("DOI", citation.doi), ("URL", citation.url), ("Volume", citation.volume),
+                             ("Issue", citation.issue), ("Pages", citation.pages)):
+            if value:
+                lines.append(f"  {label}: {value}")
+        lines.append(f"  Type: {citation.citation_type}")
+        lines.append(f"  Confidence: {citation.confidence_score:.2f}")
+        self.out.write("\n".join(lines) + "\n\n")
+    
+    def _finish(self):
+        if not self.count:
+            self.out.write("No citations found.")
+        elif self.total is None:
+            self.out.write(f"Found {self.count} citations.")
+
+# Writer class for each output format
+WRITERS = {
+    "text": TextWriter,
+    "json": JSONWriter,
+    "jsonl": JSONLinesWriter,
+    "csv": CSVWriter
+}
+
+def get_writer(output_format: str, out: IO[str], total: Optional[int] = None) -> CitationWriter:
+    """Create the writer for an output format.
+    
+    Args:
+        output_format: One of "text", "json", "jsonl" or "csv"
+        out: Text stream to write to
+        total: Number of citations that will be written, if known (only the
+            text format uses it)
+            
+    Returns:
+        CitationWriter for the format
+        
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if output_format not in WRITERS:
+        raise ValueError(f"Unknown output format '{output_format}'")
+    if output_format == "text":
+        return TextWriter(out, total)
+    return WRITERS[output_format](out)
@@ -2,14 +2,12 @@ import re
 from typing import List, Optional, Tuple
 from src.models.citation import Citation
 from src.parsers.base_parser import BaseCitationParser
+from src.parsers.prefilter import has_author_year
+from src.parsers.regex_backend import BudgetExceeded
 from src.parsers.utils import (
-    normalize_author_name, 
     extract_urls, 
-    extract_year, 
-    extract_doi,
     clean_title,
-    extract_pages,
-    extract_volume_issue
+    scan_fields
 )
 
 class APACitationParser(BaseCitationParser):
@@ -20,8 +18,21 @@ class APACitationParser(BaseCitationParser):
     Author, A. A., & Author, B. B. (Year). Title of the article. Journal Name, Vol(Issue), pages. DOI
     """
     
-    def __init__(self):
-        super().__init__()
+    author_style = "apa"
+    
+    # Indicators of each citation type, in the order they are tried
+    type_rules = [
+        ("article", ['journal', 'article', 'periodical']),
+        ("book", ['book', 'press']),
+        ("book_chapter", ['chapter']),
+        ("conference", ['conference', 'proceedings', 'symposium']),
+        ("thesis", ['thesis', 'dissertation']),
+        ("report", ['report', 'technical']),
+        ("web", ['website', 'retrieved from', 'available at', 'http'])
+    ]
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.format_name = "apa"
         
         # Regex patterns for APA citation components
@@ -46,7 +57,7 @@ class APACitationParser(BaseCitationParser):
         }
         
         # Complete APA reference pattern (comprehensive but may not catch all variations)
-        self.apa_pattern = re.compile(
+        self.apa_pattern = self.regex_backend.compile(
             r"([^(]+)\s*\((\d{4}[a-z]?)\)\.\s+([^.]+)\.\s+([^,]+)(?:,\s*(\d+)(?:\((\d+[A-Za-z]?)\))?)?,?\s*(?:(\d+[-–]\d+))?\.\s*(?:https?://doi\.org/(.+)|DOI:\s*(.+))?",
             re.DOTALL
         )
@@ -62,8 +73,18 @@ class APACitationParser(BaseCitationParser):
         """
         text = text.strip()
         
+        # Very long candidates are unsplit pages, not citations
+        if not self.budget.fits(text):
+            return None
+        
         # Try to match the complete pattern first
-        match = self.apa_pattern.match(text)
+        deadline = self.budget.deadline()
+        try:
+            match = self.budget.match(self.apa_pattern, text, deadline)
+            if not match:
+                self.budget.check(deadline)
+        except BudgetExceeded:
+            return None
         
         if match:
             # Extract all components from the match
@@ -106,8 +127,11 @@ class APACitationParser(BaseCitationParser):
     
     def _fallback_parse(self, text: str) -> Optional[Citation]:
         """Fallback method for when the main regex pattern doesn't match."""
+        self.parse_stats['fallback_parses'] += 1
         authors = self._extract_authors(text)
-        year = extract_year(text)
+        # One scan finds year, DOI, URL, pages and volume/issue together
+        fields = scan_fields(text)
+        year = fields.year
         title = self._extract_title(text)
         source = self._extract_source(text)
         
@@ -122,12 +146,11 @@ class APACitationParser(BaseCitationParser):
             )
             
             # Extract additional metadata
-            citation.doi = extract_doi(text)
-            citation.url = self._extract_url(text)
-            citation.pages = extract_pages(text)
-            volume, issue = extract_volume_issue(text)
-            citation.volume = volume
-            citation.issue = issue
+            citation.doi = fields.get("doi")
+            citation.url = fields.get("url")
+            citation.pages = fields.get("pages")
+            citation.volume = fields.get("volume")
+            citation.issue = fields.get("issue")
             citation.citation_type = self._determine_citation_type(text)
             
             # Calculate confidence (will be lower for partial matches)
@@ -146,122 +169,16 @@ class APACitationParser(BaseCitationParser):
         Returns:
             List of Citation objects found in the text
         """
-        citations = []
-        
-        # Look for a references section
-        references_match = re.search(r'(?:References|Bibliography|Works Cited)[:.\n]+(.*)', text, re.IGNORECASE | re.DOTALL)
-        if references_match:
-            # If we found a references section, focus on that
-            references_text = references_match.group(1)
-            # Split by newlines (common format for reference lists)
-            potential_citations = re.split(r'\n\s*\n|\n(?=[A-Z])', references_text)
-        else:
-            # Otherwise, try to find citations in the full text
-            # Split by periods followed by multiple spaces or newlines, or by newlines followed by capital letters
-            potential_citations = re.split(r'\.\s{2,}|\.\n+|\n(?=[A-Z])', text)
-        
-        for potential in potential_citations:
-            # Skip very short strings
-            if len(potential.strip()) < 20:
-                continue
-                
-            # Basic check: does it look like it might be an APA citation?
-            # Look for author-year pattern: text followed by year in parentheses
-            if re.search(r'[A-Za-z]+.*\(\d{4}[a-z]?\)', potential):
-                citation = self.parse(potential)
-                if citation and citation.confidence_score > 0.5:
-                    citations.append(citation)
-        
-        return citations
+        return list(self.iter_citations(text))
+    
+    def _looks_like_citation(self, text: str) -> bool:
+        """Basic check: does it look like it might be an APA citation?"""
+        # Look for author-year pattern: text followed by year in parentheses
+        return has_author_year(text)
     
     def _process_authors(self, authors_str: str) -> List[str]:
         """Process author string into list of normalized author names."""
-        # Handle the case with '&' - common in APA citations
-        if '&' in authors_str:
-            # Split the string at the '&' to separate the last author
-            parts = authors_str.split('&')
-            
-            # Process all authors before the '&'
-            main_authors = parts[0].strip()
-            last_author = parts[1].strip()
-            
-            # Process the main authors (comma-separated list)
-            authors = []
-            
-            # If there are commas in the main authors part
-            if ',' in main_authors:
-                # Split by commas
-                main_parts = main_authors.split(',')
-                
-                # Process pairs of lastname, initials
-                current_author = ""
-                for i, part in enumerate(main_parts):
-                    part = part.strip()
-                    if not part:  # Skip empty parts
-                        continue
-                        
-                    # If this looks like initials (short and contains periods)
-                    if len(part) <= 5 and '.' in part:
-                        # This is initials for the previous lastname
-                        if current_author:
-                            authors.append(f"{current_author}, {part}")
-                            current_author = ""
-                    else:
-                        # This is a new lastname
-                        if current_author:  # If we have a pending author, add it
-                            authors.append(current_author)
-                        current_author = part
-                
-                # Add any remaining author
-                if current_author:
-                    authors.append(current_author)
-            else:
-                # No commas, just a single author
-                authors.append(main_authors)
-            
-            # Process the last author (after the '&')
-            if ',' in last_author:
-                last_parts = last_author.split(',')
-                if len(last_parts) >= 2:
-                    authors.append(f"{last_parts[0].strip()}, {last_parts[1].strip()}")
-                else:
-                    authors.append(last_author)
-            else:
-                authors.append(last_author)
-        else:
-            # No '&', process as a single author or comma-separated list
-            authors = []
-            if ',' in authors_str:
-                parts = authors_str.split(',')
-                
-                # Process pairs of lastname, initials
-                current_author = ""
-                for i, part in enumerate(parts):
-                    part = part.strip()
-                    if not part:  # Skip empty parts
-                        continue
-                        
-                    # If this looks like initials (short and contains periods)
-                    if len(part) <= 5 and '.' in part:
-                        # This is initials for the previous lastname
-                        if current_author:
-                            authors.append(f"{current_author}, {part}")
-                            current_author = ""
-                    else:
-                        # This is a new lastname
-                        if current_author:  # If we have a pending author, add it
-                            authors.append(current_author)
-                        current_author = part
-                
-                # Add any remaining author
-                if current_author:
-                    authors.append(current_author)
-            else:
-                # No commas, just a single author
-                authors.append(authors_str.strip())
-        
-        # Filter out any empty strings and normalize
-        return [normalize_author_name(author) for author in authors if author.strip()]
+        return self.author_tokenizer.split(authors_str)
     
     def _extract_authors(self, text: str) -> List[str]:
         """Extract authors from citation text."""
@@ -302,24 +219,7 @@ class APACitationParser(BaseCitationParser):
     
     def _determine_citation_type(self, text: str) -> str:
         """Determine the type of citation (article, book, chapter, etc.)."""
-        # Look for indicators of citation type
-        if re.search(r'journal|article|periodical', text.lower()):
-            return "article"
-        if re.search(r'book|press', text.lower()):
-            return "book"
-        if re.search(r'chapter|in\s+[A-Z]|\(Eds?\.\)', text.lower()):
-            return "book_chapter"
-        if re.search(r'conference|proceedings|symposium', text.lower()):
-            return "conference"
-        if re.search(r'thesis|dissertation', text.lower()):
-            return "thesis"
-        if re.search(r'report|technical', text.lower()):
-            return "report"
-        if re.search(r'website|retrieved from|available at|http', text.lower()):
-            return "web"
-        
-        # Default to article as most common type
-        return "article"
+        return self.type_classifier.classify(text)
     
     def calculate_confidence(self, citation: Citation) -> float:
         """Calculate confidence score for a parsed APA citation.
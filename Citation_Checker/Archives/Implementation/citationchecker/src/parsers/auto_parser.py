@@ -0,0 +1,122 @@
+import re
+from typing import Any, Dict, List, Optional
+from src.models.citation import Citation
+from src.parsers.base_parser import BaseCitationParser
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.mla_parser import MLACitationParser
+
+# The first of these features in an entry decides its format: APA puts the year
+# in parentheses right after the authors, MLA quotes article titles and labels
+# volume and issue numbers
+FORMAT_FEATURES = re.compile(
+    r'(?P<apa>\((?:\d{4}[a-z]?|n\.d\.)\))'
+    r'|(?P<mla>["“][^"”]+["”]|\b(?:vol|no)\.)',
+    re.IGNORECASE
+)
+# Without any of them, a spelled-out first name ("Wilson, Robert.") is MLA;
+# APA abbreviates it to initials
+MLA_AUTHOR_START = re.compile(r'[A-Z][a-z]+,\s+[A-Z][a-z]+')
+
+class AutoCitationParser(BaseCitationParser):
+    """Parser for bibliographies that mix citation formats.
+    
+    Each candidate entry is classified with a cheap feature scan and parsed by
+    exactly one format parser, so a mixed document is parsed in a single pass.
+    """
+    
+    def __init__(self, default_format: str = "apa", **kwargs):
+        """Initialize the format parsers.
+        
+        Args:
+            default_format: Format used when an entry shows no distinguishing
+                features ("apa" or "mla")
+            **kwargs: Options passed to every format parser (see BaseCitationParser)
+        """
+        # Results are memoized by the format parsers, not a second time here
+        super().__init__(**dict(kwargs, memo_size=0))
+        self.format_name = "auto"
+        self.config['default_format'] = default_format
+        self.parsers = {
+            "apa": APACitationParser(**kwargs),
+            "mla": MLACitationParser(**kwargs)
+        }
+        self.config['memo_size'] = self.parsers["apa"].memo.max_size
+        if default_format not in self.parsers:
+            raise ValueError(f"Unknown citation format: {default_format}")
+        self.default_format = default_format
+        self.routed = {name: 0 for name in self.parsers}
+    
+    def classify(self, text: str) -> str:
+        """Guess the citation format of one entry.
+        
+        Args:
+            text: A string containing a single citation
+            
+        Returns:
+            Format name ("apa" or "mla")
+        """
+        match = FORMAT_FEATURES.search(text)
+        if match:
+            return match.lastgroup
+        if MLA_AUTHOR_START.match(text.lstrip()):
+            return "mla"
+        return self.default_format
+    
+    def parse(self, text: str) -> Optional[Citation]:
+        """Parse a single citation with the parser for its detected format.
+        
+        Args:
+            text: A string containing a single citation
+            
+        Returns:
+            Citation object if parsing successful, None otherwise
+        """
+        return self._route(text).parse(text)
+    
+    def extract_citations(self, text: str) -> List[Citation]:
+        """Extract citations of any supported format from a larger text.
+        
+        Args:
+            text: A string that may contain multiple citations
+            
+        Returns:
+            List of Citation objects found in the text
+        """
+        return list(self.iter_citations(text))
+    
+    def parse_candidate(self, potential: str) -> Optional[Citation]:
+        """Hand a candidate to the format parser it is routed to."""
+        return self._route(potential).parse_candidate(potential)
+    
+    def _route(self, text: str) -> BaseCitationParser:
+        """Pick the format parser for an entry and count the decision."""
+        format_name = self.classify(text)
+        self.routed[format_name] += 1
+        return self.parsers[format_name]
+    
+    @property
+    def time_budget_hits(self) -> int:
+        """Number of candidates that ran out of matching time, over the format parsers."""
+        return super().time_budget_hits + sum(parser.time_budget_hits for parser in self.parsers.values())
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get parsing statistics summed over the format parsers.
+        
+        Returns:
+            Dictionary of counters, including routed_<format> entry counts
+        """
+        stats = super().get_stats()
+        for parser in self.parsers.values():
+            for key, value in parser.get_stats().items():
+                stats[key] = stats.get(key, 0) + value
+        for format_name, count in self.routed.items():
+            stats[f'routed_{format_name}'] = count
+        return stats
+    
+    def reset_stats(self):
+        """Reset all parsing statistics."""
+        super().reset_stats()
+        for parser in self.parsers.values():
+            parser.reset_stats()
+        for format_name in self.routed:
+            self.routed[format_name] = 0
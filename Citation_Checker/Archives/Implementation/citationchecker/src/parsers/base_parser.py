@@ -1,6 +1,99 @@
+import functools
+import hashlib
+import logging
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from src.models.citation import Citation
+from concurrent.futures import BrokenExecutor
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Union
+from src.models.citation import Citation, SpanCitation
+from src.models.source_buffer import SourceBuffer
+from src.parsers.authors import AuthorTokenizer
+from src.parsers.classifier import CitationTypeClassifier
+from src.parsers.memo import ParseMemo, normalize_citation_text
+from src.parsers.regex_backend import MatchBudget, get_backend
+from src.parsers.streaming import iter_reference_entries, iter_reference_spans
+from src.parsers.timing import StageTimer
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Parser instance owned by a pool worker process, built once by _init_worker
+_worker_parser = None
+
+def _init_worker(parser_class, config):
+    """Build the parser a pool worker uses for every chunk it receives."""
+    global _worker_parser
+    _worker_parser = parser_class(**config)
+
+def _parse_in_worker(text: str) -> Optional[Citation]:
+    """Parse one citation string inside a pool worker."""
+    return _worker_parser.parse(text)
+
+def _memoize_parse(parse):
+    """Wrap a parser's parse() so repeated citations are served from its memo."""
+    @functools.wraps(parse)
+    def memoized_parse(self, text: str) -> Optional[Citation]:
+        # The normalized text is what gets parsed, with or without a memo, so
+        # every text sharing a key gets the same result and results do not
+        # depend on the memo size
+        normalized = normalize_citation_text(text)
+        memo = getattr(self, 'memo', None)
+        if memo is None or not memo.enabled:
+            citation = parse(self, normalized)
+        else:
+            # Keyed by the implementation too, so an override calling
+            # super().parse() does not share entries with it, and by the
+            # parser's patterns and options, so a memo shared between
+            # differently configured parsers does not hand one the other's results
+            key = (parse.__qualname__, self._memo_scope(), normalized)
+            found, citation = memo.get(key)
+            if not found:
+                time_budget_hits = self.budget.stats['time_budget_hits']
+                citation = parse(self, normalized)
+                # A candidate that ran out of time may parse when the machine
+                # is less busy, so its None is not kept
+                if self.budget.stats['time_budget_hits'] == time_budget_hits:
+                    memo.put(key, citation)
+        if citation:
+            # Keep the caller's own text as the original citation text
+            citation.citation_text = text.strip()
+        return citation
+    
+    return memoized_parse
+
+# Parser methods counted as parsing stages when stage timing is on
+TIMED_METHODS = {
+    '_fallback_parse': 'fallback',
+    '_process_authors': 'authors',
+    '_determine_citation_type': 'classify',
+    'calculate_confidence': 'confidence'
+}
+
+def _time_stage(stage, method):
+    """Wrap a parser method so each call is counted under a stage of the parser's timer."""
+    @functools.wraps(method)
+    def timed_method(self, *args, **kwargs):
+        timer = getattr(self, 'stage_timer', None)
+        if timer is None:
+            return method(self, *args, **kwargs)
+        return timer.call(stage, method, self, *args, **kwargs)
+    
+    return timed_method
+
+def _pattern_sources(value) -> List[str]:
+    """Sources of the regex patterns held in a parser attribute, in a stable order."""
+    if isinstance(value, BaseCitationParser):
+        return [value.fingerprint()]
+    if isinstance(value, str):
+        return [value]
+    if hasattr(value, 'pattern') and hasattr(value, 'match'):
+        return [str(value.pattern)]
+    if isinstance(value, dict):
+        return [source for key in sorted(value, key=str) for source in _pattern_sources(value[key])]
+    return []
 
 class BaseCitationParser(ABC):
     """Abstract base class for all citation parsers.
@@ -9,9 +102,67 @@ class BaseCitationParser(ABC):
     must follow, ensuring consistent behavior across different citation formats.
     """
     
-    def __init__(self):
-        """Initialize the base parser."""
+    # Bump when a change alters parse results, so memoized results are dropped
+    version = "1.1"
+    # Author list convention for the shared tokenizer ("apa" or "mla"), if any
+    author_style = None
+    # Citation type rules for the keyword classifier, highest priority first
+    type_rules = None
+    
+    def __init_subclass__(cls, **kwargs):
+        """Memoize the parse() of every parser class that defines one, and time its stage methods."""
+        super().__init_subclass__(**kwargs)
+        if 'parse' in cls.__dict__ and not getattr(cls.parse, '__isabstractmethod__', False):
+            cls.parse = _memoize_parse(cls.__dict__['parse'])
+        for name, stage in TIMED_METHODS.items():
+            method = cls.__dict__.get(name)
+            if method and not getattr(method, '__isabstractmethod__', False):
+                setattr(cls, name, _time_stage(stage, method))
+    
+    def __init__(self, regex_backend: str = "re", max_length: Optional[int] = 5000,
+                 time_budget: Optional[float] = 0.25, memo_size: Optional[int] = 4096,
+                 stage_timing: Optional[int] = 64):
+        """Initialize the base parser.
+        
+        Args:
+            regex_backend: Engine for the full-citation patterns ("re", "regex",
+                "re2" or "auto")
+            max_length: Longest candidate, in characters, that parse() will try
+                to match (None for no limit)
+            time_budget: Seconds parse() may spend matching one candidate
+                (None for no limit)
+            memo_size: Number of parse results kept for repeated citations
+                (0 or None to disable)
+            stage_timing: Time one in this many calls of each parsing stage
+                (default: 64); every call is still counted and the stage's
+                time estimated from the timed ones. 1 times every call, for
+                profiling; None turns stage timing off
+        """
         self.format_name = "unknown"
+        self.config = {
+            'regex_backend': regex_backend,
+            'max_length': max_length,
+            'time_budget': time_budget,
+            'memo_size': memo_size,
+            'stage_timing': stage_timing
+        }
+        self.regex_backend = get_backend(regex_backend)
+        self.stage_timer = StageTimer(stage_timing) if stage_timing else None
+        self.budget = MatchBudget(self.regex_backend, max_length, time_budget, self.stage_timer)
+        self.memo = ParseMemo(memo_size)
+        self._memo_scope_key = None
+        self.author_tokenizer = AuthorTokenizer(self.author_style) if self.author_style else None
+        self.type_classifier = CitationTypeClassifier(self.type_rules) if self.type_rules else None
+        self.prefilter_stats = {
+            'prefilter_accepted': 0,
+            'prefilter_rejected': 0,
+            'prefilter_seconds': 0.0,
+            'parse_seconds': 0.0
+        }
+        # Entries the format parsers had to piece together field by field
+        self.parse_stats = {'fallback_parses': 0}
+        self._pool = None
+        self._pool_workers = 0
     
     @abstractmethod
     def parse(self, text: str) -> Optional[Citation]:
@@ -37,6 +188,267 @@ class BaseCitationParser(ABC):
         """
         pass
     
+    def iter_citations(self, text_or_file: Union[str, IO[str]]) -> Iterator[Citation]:
+        """Yield citations one at a time from a text or a text file object.
+        
+        Finds the same citations as extract_citations(), but each one is
+        yielded as soon as it is parsed and the document is read in chunks, so
+        memory stays bounded by the current reference entry.
+        
+        Args:
+            text_or_file: Document text, or a file object opened in text mode
+            
+        Returns:
+            Iterator over Citation objects in document order
+        """
+        for potential in iter_reference_entries(text_or_file, timer=self.stage_timer):
+            citation = self.parse_candidate(potential)
+            if citation:
+                yield citation
+    
+    def iter_buffer_citations(self, source: SourceBuffer) -> Iterator[SpanCitation]:
+        """Yield citations from a memory-mapped file without copying its text.
+        
+        Candidates are found by searching the mapped bytes in place and each
+        one is decoded only while it is parsed. The citations keep byte
+        offsets into source instead of their own copy of the citation text,
+        so source must stay open while they are used.
+        
+        Args:
+            source: SourceBuffer mapping a UTF-8 document
+            
+        Returns:
+            Iterator over SpanCitation objects in document order
+        """
+        for start, end in iter_reference_spans(source.data, self.stage_timer):
+            citation = self.parse_candidate(source.text(start, end))
+            if citation:
+                yield SpanCitation.from_citation(citation, source, start, end)
+    
+    def parse_candidate(self, potential: str) -> Optional[Citation]:
+        """Parse one candidate from a document if it passes the extraction checks.
+        
+        This is the step iter_citations() applies to each reference entry,
+        for callers that split documents into entries themselves. Unlike
+        parse(), the candidate is skipped if it is too short or fails the
+        format's prefilter, and parses with a confidence score of 0.5 or
+        less are rejected.
+        
+        Args:
+            potential: Candidate citation string
+            
+        Returns:
+            Citation object, or None if the candidate was skipped or rejected
+        """
+        stats = self.prefilter_stats
+        started = time.perf_counter()
+        # Skip very short strings, then anything without the format's features
+        accepted = len(potential.strip()) >= 20 and self._looks_like_citation(potential)
+        checked = time.perf_counter()
+        stats['prefilter_seconds'] += checked - started
+        if self.stage_timer:
+            self.stage_timer.add("prefilter", checked - started)
+        if not accepted:
+            stats['prefilter_rejected'] += 1
+            return None
+        
+        stats['prefilter_accepted'] += 1
+        citation = self.parse(potential)
+        stats['parse_seconds'] += time.perf_counter() - checked
+        if citation and citation.confidence_score > 0.5:
+            return citation
+        return None
+    
+    def _looks_like_citation(self, text: str) -> bool:
+        """Cheap check of whether a candidate is worth a full parse.
+        
+        Args:
+            text: Candidate citation string
+            
+        Returns:
+            True if parse() should be tried on the candidate
+        """
+        return True
+    
+    def classify_types(self, texts: Iterable[str]) -> List[str]:
+        """Determine the citation types of many citation strings in one scan.
+        
+        Args:
+            texts: Citation strings
+            
+        Returns:
+            Citation types, in the same order as texts
+            
+        Raises:
+            NotImplementedError: If the parser has no citation type rules
+        """
+        if not self.type_classifier:
+            raise NotImplementedError(f"{type(self).__name__} does not classify citation types")
+        return self.type_classifier.classify_many(list(texts))
+    
+    def parse_many(self, texts: Iterable[str], workers: Optional[int] = None,
+                   chunksize: Optional[int] = None) -> List[Optional[Citation]]:
+        """Parse many citation strings, spreading the work across processes.
+        
+        Results are returned in input order, with None wherever parse() would
+        have returned None. If a pool was opened with start_pool() it is reused;
+        otherwise a temporary pool is created for this call when workers > 1.
+        Without a pool (or if one cannot be started) parsing runs serially.
+        
+        Args:
+            texts: Citation strings to parse
+            workers: Number of worker processes (default: the open pool, or serial)
+            chunksize: Number of strings sent to a worker at a time
+            
+        Returns:
+            List of Citation objects (or None) in the same order as texts
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        
+        if workers is None:
+            workers = self._pool_workers if self._pool else 1
+        if workers <= 1 or len(texts) < 2:
+            return [self.parse(text) for text in texts]
+        
+        if chunksize is None:
+            # A few chunks per worker keeps the pool busy without paying
+            # a round trip per citation
+            chunksize = max(1, len(texts) // (workers * 4))
+        
+        if self._pool and workers == self._pool_workers:
+            try:
+                return list(self._pool.map(_parse_in_worker, texts, chunksize=chunksize))
+            except BrokenExecutor as e:
+                logger.warning(f"Parser pool broke, parsing serially: {str(e)}")
+                self.close_pool()
+                return [self.parse(text) for text in texts]
+        
+        try:
+            executor = self._create_pool(workers)
+        except (OSError, NotImplementedError) as e:
+            logger.warning(f"Could not start parser pool, parsing serially: {str(e)}")
+            return [self.parse(text) for text in texts]
+        
+        try:
+            with executor:
+                return list(executor.map(_parse_in_worker, texts, chunksize=chunksize))
+        except BrokenExecutor as e:
+            logger.warning(f"Parser pool broke, parsing serially: {str(e)}")
+            return [self.parse(text) for text in texts]
+    
+    def start_pool(self, workers: Optional[int] = None):
+        """Start a worker pool that later parse_many() calls will reuse.
+        
+        Args:
+            workers: Number of worker processes (default: CPU count)
+        """
+        self.close_pool()
+        workers = workers or os.cpu_count() or 1
+        self._pool = self._create_pool(workers)
+        self._pool_workers = workers
+    
+    def close_pool(self):
+        """Shut down the worker pool started by start_pool(), if any."""
+        if self._pool:
+            self._pool.shutdown()
+        self._pool = None
+        self._pool_workers = 0
+    
+    def _create_pool(self, workers: int) -> "ProcessPoolExecutor":
+        """Create a process pool whose workers each hold a parser of this class."""
+        # Imported here: multiprocessing is slow to import and most runs parse serially
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(type(self), self.config)
+        )
+    
+    def _memo_scope(self) -> tuple:
+        """Patterns and options that memoized results depend on, computed once."""
+        if self._memo_scope_key is None:
+            self._memo_scope_key = (self.fingerprint(), self.regex_backend.name)
+        return self._memo_scope_key
+    
+    def fingerprint(self) -> str:
+        """Identify this parser's behaviour, for keying persisted results.
+        
+        Combines the parser class, its version, the source of every pattern
+        set it holds and the options that change what parse() returns (such
+        as max_length and time_budget), so results stored under an older
+        pattern set or other limits are not reused.
+        
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha256(f"{type(self).__qualname__}:{self.version}".encode('utf-8'))
+        for name, value in sorted(self.config.items()):
+            # Cache sizes and timing change how fast results come, not what they are
+            if name not in ('memo_size', 'stage_timing'):
+                digest.update(f"\0{name}={value!r}".encode('utf-8'))
+        for name, value in sorted(vars(self).items()):
+            if isinstance(value, str) or name == 'config':
+                continue
+            for source in _pattern_sources(value):
+                digest.update(f"\0{name}\0{source}".encode('utf-8'))
+        return digest.hexdigest()[:16]
+    
+    @property
+    def time_budget_hits(self) -> int:
+        """Number of candidates that ran out of matching time so far.
+        
+        Results parsed while this goes up depend on how busy the machine
+        was, so they should not be cached.
+        """
+        return self.budget.stats['time_budget_hits']
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get parsing statistics.
+        
+        prefilter_seconds_saved estimates the parse time the prefilter avoided:
+        rejected candidates times the mean parse time of accepted ones.
+        
+        Returns:
+            Dictionary containing parser counters
+        """
+        stats = dict(self.budget.stats)
+        stats.update(self.memo.stats)
+        stats.update(self.prefilter_stats)
+        stats.update(self.parse_stats)
+        if self.stage_timer:
+            stats.update(self.stage_timer.get_stats())
+        if self.author_tokenizer:
+            stats.update(self.author_tokenizer.get_stats())
+        accepted = stats['prefilter_accepted']
+        mean_parse = stats['parse_seconds'] / accepted if accepted else 0.0
+        stats['prefilter_seconds_saved'] = stats['prefilter_rejected'] * mean_parse
+        return stats
+    
+    def reset_stats(self):
+        """Reset all parsing statistics."""
+        counter_sets = [self.budget.stats, self.memo.stats, self.prefilter_stats, self.parse_stats]
+        if self.author_tokenizer:
+            counter_sets.append(self.author_tokenizer.stats)
+        for counters in counter_sets:
+            for key in counters:
+                counters[key] = 0
+        if self.stage_timer:
+            self.stage_timer.reset()
+    
+    def clear_memo(self):
+        """Forget all memoized parse results."""
+        self.memo.clear()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close_pool()
+    
     def calculate_confidence(self, citation: Citation) -> float:
         """Calculate confidence score for a parsed citation.
         
@@ -0,0 +1,223 @@
+"""
+Persistent Parse Cache
+
+This module stores the citations parsed from whole documents in a SQLite file so
+that repeated runs (and concurrent worker processes) can skip documents they have
+already parsed. Entries are keyed by a hash of the document content together with
+the parser format and fingerprint (its patterns and the options that change its
+results), and results from an older pattern set or other options are purged the
+first time the new one writes to the cache.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+from src.models.citation import Citation
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    content_hash TEXT NOT NULL,
+    format TEXT NOT NULL,
+    version TEXT NOT NULL,
+    citations TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (content_hash, format, version)
+);
+CREATE INDEX IF NOT EXISTS parse_cache_last_used ON parse_cache (last_used);
+CREATE TABLE IF NOT EXISTS parse_cache_size (total INTEGER NOT NULL);
+CREATE TRIGGER IF NOT EXISTS parse_cache_size_insert AFTER INSERT ON parse_cache
+BEGIN
+    UPDATE parse_cache_size SET total = total + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS parse_cache_size_delete AFTER DELETE ON parse_cache
+BEGIN
+    UPDATE parse_cache_size SET total = total - OLD.size;
+END;
+"""
+
+def hash_text(text: str) -> str:
+    """Hash document text for use as a cache key."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def hash_file(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """Hash a file's bytes for use as a cache key, without reading it whole."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ParseCache:
+    """SQLite-backed cache of parsed documents.
+    
+    The database runs in WAL mode, so any number of processes can read while
+    one writes; writers wait up to timeout seconds for each other. When the
+    stored results grow past max_bytes, the least recently used documents are
+    evicted. Their total size is kept in the database by triggers, so every
+    process sees the same figure and a write does not have to add up the
+    whole table to check it.
+    
+    Attributes:
+        path: Path of the SQLite database
+        max_bytes: Size cap for stored results, in bytes of serialized JSON
+        stats: Hit, miss, write and eviction counters for this process
+    """
+    
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, timeout: float = 30.0):
+        """Open (or create) a cache database.
+        
+        Args:
+            path: Path of the SQLite database file
+            max_bytes: Size cap for stored results (default: 256 MB)
+            timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # INSERT OR REPLACE fires the delete trigger only with recursive triggers on
+        self._conn.execute("PRAGMA recursive_triggers=ON")
+        self._conn.executescript(_SCHEMA)
+        with self._write():
+            # Caches written before the size was tracked are added up once
+            self._conn.execute(
+                "INSERT INTO parse_cache_size SELECT COALESCE(SUM(size), 0) FROM parse_cache "
+                "WHERE NOT EXISTS (SELECT 1 FROM parse_cache_size)"
+            )
+        self._purged = set()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'evictions': 0
+        }
+    
+    def get(self, content_hash: str, parser) -> Optional[List[Citation]]:
+        """Look up the citations parsed from a document.
+        
+        Args:
+            content_hash: Hash of the document (see hash_text and hash_file)
+            parser: Parser the document is to be parsed with
+            
+        Returns:
+            List of Citation objects, or None if the document is not cached
+        """
+        key = (content_hash, parser.format_name, parser.fingerprint())
+        row = self._conn.execute(
+            "SELECT citations FROM parse_cache WHERE content_hash = ? AND format = ? AND version = ?",
+            key
+        ).fetchone()
+        if row is None:
+            self.stats['misses'] += 1
+            return None
+        
+        self.stats['hits'] += 1
+        try:
+            self._conn.execute(
+                "UPDATE parse_cache SET last_used = ? WHERE content_hash = ? AND format = ? AND version = ?",
+                (time.time(),) + key
+            )
+        except sqlite3.OperationalError as e:
+            # Recency is only a hint for eviction; never fail a read over it
+            logger.debug(f"Could not update cache entry recency: {str(e)}")
+        return [Citation(**data) for data in json.loads(row[0])]
+    
+    def put(self, content_hash: str, parser, citations: List[Citation]):
+        """Store the citations parsed from a document.
+        
+        Results from a parse in which entries ran out of time should not be
+        stored, since they depend on how busy the machine was (see
+        BaseCitationParser.time_budget_hits); the functions in src.main
+        skip them.
+        
+        Args:
+            content_hash: Hash of the document (see hash_text and hash_file)
+            parser: Parser the document was parsed with
+            citations: Parsed citations
+        """
+        version = parser.fingerprint()
+        payload = json.dumps([citation.to_dict() for citation in citations])
+        with self._write():
+            if (parser.format_name, version) not in self._purged:
+                self._conn.execute(
+                    "DELETE FROM parse_cache WHERE format = ? AND version != ?",
+                    (parser.format_name, version)
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parse_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (content_hash, parser.format_name, version, payload, len(payload), time.time())
+            )
+            self._evict()
+        self._purged.add((parser.format_name, version))
+        self.stats['writes'] += 1
+    
+    def _evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        total = self._total_size()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT rowid, size FROM parse_cache ORDER BY last_used")
+        stale = []
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((rowid,))
+            total -= size
+        self._conn.executemany("DELETE FROM parse_cache WHERE rowid = ?", stale)
+        self.stats['evictions'] += len(stale)
+    
+    def _total_size(self) -> int:
+        return self._conn.execute("SELECT total FROM parse_cache_size").fetchone()[0]
+    
+    def _write(self):
+        """Transaction that takes the write lock up front, so concurrent writers queue."""
+        return _ImmediateTransaction(self._conn)
+    
+    def clear(self):
+        """Delete every cached document."""
+        with self._write():
+            self._conn.execute("DELETE FROM parse_cache")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+        
+        Returns:
+            Dictionary with this process's counters, the number of stored
+            documents and their size in bytes
+        """
+        stats = dict(self.stats)
+        stats['entries'] = self._conn.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0]
+        stats['bytes'] = self._total_size()
+        return stats
+    
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+class _ImmediateTransaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back if the block raises."""
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+    
+    def __enter__(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
@@ -0,0 +1,118 @@
+"""
+Citation Type Classifier
+
+This module decides a citation's type (article, book, chapter, ...) from keyword
+rules tried in priority order. The keywords of all rules are compiled into one
+alternation, so the text is lowercased once and scanned once instead of once
+per rule, and each keyword found is looked up to see which rule it belongs to.
+Rules that need the original text (a compiled pattern rather than keywords) are
+only run when no keyword rule of higher priority has matched.
+"""
+
+import re
+from typing import Iterator, List, Match, Pattern, Sequence, Tuple, Union
+
+# A rule is a list of lowercase keywords found in lowercased text, or a
+# compiled pattern searched for in the original text
+Rule = Tuple[str, Union[Sequence[str], Pattern]]
+
+class CitationTypeClassifier:
+    """Classify citations by the first rule, in priority order, that matches.
+    
+    Attributes:
+        rules: (citation type, keywords or pattern) pairs, highest priority first
+        default: Type returned when no rule matches
+        keywords: Combined keyword pattern, highest priority keywords first
+    """
+    
+    def __init__(self, rules: Sequence[Rule], default: str = "article"):
+        """Build the classifier.
+        
+        Args:
+            rules: (citation type, rule) pairs, highest priority first. A rule
+                is a list of lowercase keywords looked for in the lowercased text or a
+                compiled pattern searched for in the original text.
+            default: Type for text that matches no rule
+        """
+        self.rules = list(rules)
+        self.default = default
+        # keyword -> priority of the first rule listing it
+        self._priorities = {}
+        # priority -> pattern, for rules that need the original text
+        self._patterns = {}
+        for priority, (_, rule) in enumerate(self.rules):
+            if hasattr(rule, 'search'):
+                self._patterns[priority] = rule
+            else:
+                for keyword in rule:
+                    self._priorities.setdefault(keyword, priority)
+        # Plain literals, no groups, so re can use its fast literal scan;
+        # where keywords start at the same place the higher priority one wins
+        self.keywords = re.compile('|'.join(map(re.escape, self._priorities)) or '(?!)')
+        self._first_keyword = min(
+            (p for p in range(len(self.rules)) if p not in self._patterns),
+            default=len(self.rules)
+        )
+    
+    def classify(self, text: str) -> str:
+        """Determine the type of one citation.
+        
+        Args:
+            text: Citation text
+            
+        Returns:
+            Citation type
+        """
+        best = len(self.rules)
+        for match in self._scan(text.lower()):
+            best = min(best, self._priorities[match.group()])
+            if best == self._first_keyword:
+                break
+        return self._resolve(text, best)
+    
+    def classify_many(self, texts: Sequence[str]) -> List[str]:
+        """Determine the types of many citations in one scan.
+        
+        The lowercased texts are joined and scanned together, and each
+        keyword match is credited to the text it falls in.
+        
+        Args:
+            texts: Citation texts
+            
+        Returns:
+            Citation types, in the same order as texts
+        """
+        lowered = [text.lower() for text in texts]
+        best = [len(self.rules)] * len(texts)
+        # Texts are joined with a NUL, which no keyword can match across
+        ends = []
+        position = 0
+        for text in lowered:
+            position += len(text) + 1
+            ends.append(position)
+        
+        index = 0
+        for match in self._scan('\0'.join(lowered)):
+            while match.start() >= ends[index]:
+                index += 1
+            best[index] = min(best[index], self._priorities[match.group()])
+        return [self._resolve(text, priority) for text, priority in zip(texts, best)]
+    
+    def _scan(self, text: str) -> Iterator[Match]:
+        """Keyword matches in text, including ones overlapping an earlier match."""
+        search = self.keywords.search
+        match = search(text)
+        while match:
+            yield match
+            # Resume just past the start, so "available atechnical" finds both
+            match = search(text, match.start() + 1)
+    
+    def _resolve(self, text: str, best: int) -> str:
+        """Type from the best keyword priority, after trying pattern rules of higher priority."""
+        for priority, pattern in self._patterns.items():
+            if priority >= best:
+                break
+            if pattern.search(text):
+                best = priority
+                break
+        return self.rules[best][0] if best < len(self.rules) else self.default
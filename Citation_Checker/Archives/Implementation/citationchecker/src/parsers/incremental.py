@@ -0,0 +1,169 @@
+"""
+Incremental Re-Parsing
+
+This module re-parses revised versions of a document by hashing each reference
+entry and parsing only the entries that were not in the previous version. The
+result is the full citation list together with a diff against the previous
+version (added, removed and changed citations).
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
+from src.models.citation import Citation
+from src.parsers.base_parser import BaseCitationParser
+from src.parsers.memo import copy_citation
+from src.parsers.streaming import iter_reference_entries
+
+def hash_entry(text: str) -> str:
+    """Hash one reference entry."""
+    return hashlib.blake2b(text.strip().encode('utf-8'), digest_size=16).hexdigest()
+
+@dataclass
+class CitationDiff:
+    """Differences between two versions of a document's citations.
+    
+    Attributes:
+        added: Citations only in the new version
+        removed: Citations only in the old version
+        changed: (old, new) pairs of entries edited in place
+    """
+    added: List[Citation] = field(default_factory=list)
+    removed: List[Citation] = field(default_factory=list)
+    changed: List[Tuple[Citation, Citation]] = field(default_factory=list)
+    
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+@dataclass
+class IncrementalResult:
+    """Result of re-parsing one version of a document.
+    
+    Attributes:
+        citations: All citations in the new version, in document order
+        diff: Changes since the previous version (everything is added the
+            first time a document is seen)
+        parsed: Number of entries that had to be parsed
+        reused: Number of entries whose earlier result was reused
+    """
+    citations: List[Citation]
+    diff: CitationDiff
+    parsed: int = 0
+    reused: int = 0
+
+class IncrementalParser:
+    """Re-parse documents by reference entry, reusing entries that did not change.
+    
+    Parsed entries are remembered per document id, so it suits a long-running
+    process checking successive revisions. Only the most recently re-parsed
+    documents are kept; a document dropped from the cache is parsed in full
+    the next time it is seen, and its diff reports every citation as added.
+    
+    Attributes:
+        max_documents: Most documents remembered; 0 or None for no limit
+        stats: Parsed and reused entry and evicted document counters
+    """
+    
+    def __init__(self, parser: BaseCitationParser, max_documents: Optional[int] = 256):
+        """Initialize the incremental parser.
+        
+        Args:
+            parser: Parser used for entries that need parsing
+            max_documents: Most documents remembered, least recently
+                re-parsed dropped first; 0 or None for no limit
+        """
+        self.parser = parser
+        self.max_documents = max_documents
+        # document id -> list of (entry hash, citation or None) in document order; the
+        # hash is None for entries that ran out of time, so they are parsed again
+        self._documents = OrderedDict()
+        self.stats = {
+            'entries_parsed': 0,
+            'entries_reused': 0,
+            'documents_evicted': 0
+        }
+    
+    def reparse(self, text_or_file: Union[str, IO[str]], document_id: str = "default") -> IncrementalResult:
+        """Parse a new version of a document, reusing unchanged entries.
+        
+        Args:
+            text_or_file: Document text, or a file object opened in text mode
+            document_id: Identifies the document across versions
+            
+        Returns:
+            IncrementalResult with the merged citations and the diff
+        """
+        previous = self._documents.get(document_id, [])
+        known = {entry_hash: citation for entry_hash, citation in previous}
+        entries = []
+        parsed = reused = 0
+        
+        for potential in iter_reference_entries(text_or_file):
+            # Very short strings are never citations; skip them before hashing
+            if len(potential.strip()) < 20:
+                continue
+            entry_hash = hash_entry(potential)
+            if entry_hash in known:
+                citation = known[entry_hash]
+                reused += 1
+            else:
+                time_budget_hits = self.parser.time_budget_hits
+                citation = self.parser.parse_candidate(potential)
+                if self.parser.time_budget_hits == time_budget_hits:
+                    known[entry_hash] = citation
+                else:
+                    # Ran out of time; remember no hash, so the next version parses it again
+                    entry_hash = None
+                parsed += 1
+            entries.append((entry_hash, citation))
+        
+        self._documents[document_id] = entries
+        self._documents.move_to_end(document_id)
+        while self.max_documents and len(self._documents) > self.max_documents:
+            self._documents.popitem(last=False)
+            self.stats['documents_evicted'] += 1
+        self.stats['entries_parsed'] += parsed
+        self.stats['entries_reused'] += reused
+        
+        citations = [copy_citation(citation) for _, citation in entries if citation]
+        diff = self._diff(
+            [(h, c) for h, c in previous if c],
+            [(h, c) for h, c in entries if c]
+        )
+        return IncrementalResult(citations, diff, parsed, reused)
+    
+    def _diff(self, old: List[Tuple[str, Citation]], new: List[Tuple[str, Citation]]) -> CitationDiff:
+        """Align two entry lists by hash; replaced runs pair up as changed entries."""
+        diff = CitationDiff()
+        matcher = SequenceMatcher(None, [h for h, _ in old], [h for h, _ in new], autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            old_run = [copy_citation(c) for _, c in old[i1:i2]]
+            new_run = [copy_citation(c) for _, c in new[j1:j2]]
+            paired = min(len(old_run), len(new_run)) if tag == 'replace' else 0
+            diff.changed.extend(zip(old_run[:paired], new_run[:paired]))
+            diff.removed.extend(old_run[paired:])
+            diff.added.extend(new_run[paired:])
+        return diff
+    
+    def forget(self, document_id: str = "default"):
+        """Drop the remembered entries of a document, e.g. once it is closed.
+        
+        Args:
+            document_id: Document to forget; unknown ids are ignored
+        """
+        self._documents.pop(document_id, None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get re-parsing statistics.
+        
+        Returns:
+            Dictionary with parsed and reused entry counts, evicted documents
+            and tracked documents
+        """
+        stats = dict(self.stats)
+        stats['documents'] = len(self._documents)
+        return stats
@@ -0,0 +1,154 @@
+"""
+Reference Section Locator
+
+This module finds the reference sections of a document by the shape of their
+headings: a line that holds nothing but a heading such as "References" or
+"7. Bibliography". Sections are resolved backwards from the end of the document;
+each one runs until the next heading-shaped line, and a heading is only accepted
+if its section contains something that looks like a reference (a year), so table
+of contents lines and stray mentions in body text are skipped. Documents with a
+reference list per chapter give one section per list.
+"""
+
+import mmap
+import re
+from typing import IO, Iterator, List, Optional, Tuple, Union
+
+REFERENCE_HEADING = re.compile(
+    r'(?:(?:\d+(?:\.\d+)*|[IVXLC]+)\.?\s+)?'
+    r'(?:References?|Bibliography|Works Cited|Literature Cited|Reference List|Sources Cited)'
+    r'\s*[:.]?',
+    re.IGNORECASE
+)
+# A year (or "n.d.") somewhere in a section marks it as a real reference list
+ENTRY_YEAR = re.compile(r'(?<!\d)(?:1[5-9]\d{2}|20\d{2})(?!\d)|n\.d\.')
+BYTES_NEWLINE = re.compile(rb'\r\n|\r|\n')
+
+# Lines longer than this are never treated as headings
+MAX_HEADING_LENGTH = 80
+
+Section = Tuple[int, int]
+
+def locate_reference_sections(source: Union[str, IO[str], bytes]) -> List[Section]:
+    """Find the reference sections of a document.
+    
+    Args:
+        source: Document text, a text file object (read from its current
+            position), or a UTF-8 buffer such as bytes or an mmap
+            
+    Returns:
+        (start, end) offsets of each section body in document order: character
+        offsets for text and files, byte offsets for buffers. Empty if the
+        document has no heading-shaped reference section.
+    """
+    # Heading-shaped lines in document order
+    headings = []
+    # A possible section boundary, confirmed if the next line is blank
+    pending = None
+    previous_blank = True
+    end = 0
+    
+    for offset, line_end, next_offset, line in iter_lines(source):
+        end = next_offset
+        stripped = line.strip()
+        if pending is not None:
+            if stripped:
+                # Not a heading after all, just a short line of text
+                if headings:
+                    headings[-1]['end'] = pending['end']
+            else:
+                headings.append(pending)
+            pending = None
+        
+        if not stripped:
+            if headings and headings[-1]['body'] == offset:
+                # Blank lines right after a heading are not part of the body
+                headings[-1]['body'] = next_offset
+            previous_blank = True
+            continue
+        
+        heading = {'start': offset, 'body': next_offset, 'end': next_offset, 'entries': False}
+        if len(stripped) <= MAX_HEADING_LENGTH and REFERENCE_HEADING.fullmatch(stripped):
+            heading['references'] = True
+            headings.append(heading)
+        elif previous_blank and _looks_like_heading(stripped):
+            heading.update(references=False, end=line_end)
+            pending = heading
+        elif headings:
+            headings[-1]['end'] = line_end
+            if not headings[-1]['entries'] and ENTRY_YEAR.search(stripped):
+                headings[-1]['entries'] = True
+        previous_blank = False
+    
+    if pending is not None:
+        headings.append(pending)
+    
+    # Walk back from the end: each section stops before the next heading starts
+    sections = []
+    boundary = end
+    for heading in reversed(headings):
+        if heading['references'] and heading['entries']:
+            sections.append((heading['body'], min(heading['end'], boundary)))
+        boundary = heading['start']
+    sections.reverse()
+    return sections
+
+def _looks_like_heading(line: str) -> bool:
+    """Check whether a stripped line set off by blank lines is a section heading.
+    
+    Headings are short, start with a capital or a number, and have no final
+    punctuation, commas or years, which almost every reference entry has.
+    """
+    return (len(line) <= MAX_HEADING_LENGTH
+            and (line[0].isupper() or line[0].isdigit())
+            and line[-1] not in '.,;:'
+            and ',' not in line
+            and not ENTRY_YEAR.search(line))
+
+def iter_lines(source: Union[str, IO[str], bytes], start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int, int, str]]:
+    """Yield the lines of a document, or of the part between two offsets.
+    
+    Args:
+        source: Document text, a text file object (offsets are counted from
+            its current position), or a UTF-8 buffer such as bytes or an mmap
+        start: Offset to start at; a line containing it is cut there
+        end: Offset to stop at, or None for the end of the document
+        
+    Returns:
+        Iterator over (offset, end of line, offset of next line, line text)
+        tuples, with the newline left out of the text
+    """
+    if isinstance(source, str):
+        limit = len(source) if end is None else end
+        position = start
+        while position < limit:
+            newline = source.find('\n', position, limit)
+            line_end = limit if newline < 0 else newline
+            next_position = min(line_end + 1, limit)
+            yield position, line_end, next_position, source[position:line_end]
+            position = next_position
+    elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        # Decoding one line at a time keeps a memory-mapped buffer mapped,
+        # not copied
+        limit = len(source) if end is None else end
+        position = start
+        for newline in BYTES_NEWLINE.finditer(source, start, limit):
+            text = str(source[position:newline.start()], 'utf-8', 'replace')
+            yield position, newline.start(), newline.end(), text
+            position = newline.end()
+        if position < limit:
+            yield position, limit, limit, str(source[position:limit], 'utf-8', 'replace')
+    else:
+        position = 0
+        for line in iter(source.readline, ""):
+            line_start, position = position, position + len(line)
+            if position <= start:
+                continue
+            if end is not None and line_start >= end:
+                break
+            text = line[:-1] if line.endswith('\n') else line
+            if end is not None:
+                text = text[:end - line_start]
+            if line_start < start:
+                text, line_start = text[start - line_start:], start
+            yield line_start, line_start + len(text), position, text
@@ -0,0 +1,95 @@
+"""
+Parse Result Memoization
+
+This module provides a bounded least-recently-used memo of parse results. The
+same references turn up in many documents, so parsers look each citation up by
+a normalized form of its text before parsing it again.
+"""
+
+import unicodedata
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Hashable, Optional, Tuple
+from src.models.citation import Citation
+
+def normalize_citation_text(text: str) -> str:
+    """Normalize citation text for use as a memo key.
+    
+    Runs of whitespace are collapsed to single spaces and the text is put in
+    Unicode NFC form, so the same reference typed with different line breaks
+    or composed characters gives the same key.
+    
+    Args:
+        text: Citation text
+        
+    Returns:
+        Normalized text
+    """
+    return unicodedata.normalize('NFC', ' '.join(text.split()))
+
+def copy_citation(citation: Optional[Citation]) -> Optional[Citation]:
+    """Copy a citation deeply enough that changing the copy cannot change the original.
+    
+    Every field except the author list is immutable, so only that list is copied.
+    """
+    if citation is None:
+        return None
+    return replace(citation, authors=list(citation.authors))
+
+class ParseMemo:
+    """Bounded LRU memo of parse results.
+    
+    Attributes:
+        max_size: Most results kept; 0 or None disables the memo
+        stats: Hit, miss and eviction counters
+    """
+    
+    def __init__(self, max_size: Optional[int] = 4096):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.stats = {
+            'memo_hits': 0,
+            'memo_misses': 0,
+            'memo_evictions': 0
+        }
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether results are being memoized."""
+        return bool(self.max_size)
+    
+    def get(self, key: Hashable) -> Tuple[bool, Optional[Citation]]:
+        """Look up a parse result.
+        
+        Args:
+            key: Memo key
+            
+        Returns:
+            Tuple of (found, copy of the memoized citation or None)
+        """
+        if key not in self._entries:
+            self.stats['memo_misses'] += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.stats['memo_hits'] += 1
+        return True, copy_citation(self._entries[key])
+    
+    def put(self, key: Hashable, citation: Optional[Citation]):
+        """Store a copy of a parse result, evicting the least recently used ones.
+        
+        Args:
+            key: Memo key
+            citation: Parse result (None for text that did not parse)
+        """
+        self._entries[key] = copy_citation(citation)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats['memo_evictions'] += 1
+    
+    def clear(self):
+        """Drop all memoized results."""
+        self._entries.clear()
+    
+    def __len__(self):
+        return len(self._entries)
@@ -1,16 +1,17 @@
 import re
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from src.models.citation import Citation
 from src.parsers.base_parser import BaseCitationParser
+from src.parsers.prefilter import has_quoted_title, starts_with_full_name
+from src.parsers.regex_backend import BudgetExceeded
 from src.parsers.utils import (
-    normalize_author_name, 
-    extract_urls, 
-    extract_year, 
-    extract_doi,
     clean_title,
-    extract_pages
+    scan_fields
 )
 
+# A book ends its publisher with ", Year."
+YEAR_END = re.compile(r',\s*\d{4}\.')
+
 class MLACitationParser(BaseCitationParser):
     """Parser for MLA citation format.
     
@@ -19,8 +20,21 @@ class MLACitationParser(BaseCitationParser):
     Author, First. "Title." Source, vol. X, no. Y, Date, pp. X-Y.
     """
     
-    def __init__(self):
-        super().__init__()
+    author_style = "mla"
+    
+    # Indicators of each citation type, in the order they are tried; books are
+    # recognised by the capitalised "Author. Title. Publisher, Year" shape
+    type_rules = [
+        ("article", ['journal', 'magazine']),
+        ("book_chapter", ['edited by', 'chapter']),
+        ("web", ['http://', 'https://', 'web', 'website', 'accessed']),
+        ("book", re.compile(r'[A-Z][^.]+\.\s*[A-Z][^.]+\.\s*[A-Z][^,]+,\s*\d{4}')),
+        ("conference", ['conference', 'proceedings', 'symposium']),
+        ("thesis", ['thesis', 'dissertation'])
+    ]
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.format_name = "mla"
         
         # Regex patterns for MLA citation components
@@ -28,12 +42,6 @@ class MLACitationParser(BaseCitationParser):
             # Author pattern - matches "Last, First" or "Last, First, and Second Author" or "Last, First, et al."
             "author": r"^([^.]+?)(?:\.|,\s+(?:and\s+|et\s+al\.))(?:\s|$)",
             
-            # Multiple authors with "and" - "Smith, John, and Mary Johnson"
-            "authors_and": r"^(.+?),\s+and\s+(.+?)\.",
-            
-            # Multiple authors with "et al." - "Smith, John, et al."
-            "authors_et_al": r"^(.+?),\s+et\s+al\.",
-            
             # Title pattern - matches quoted title "Title of Work"
             "title": r'"([^"]+)"',
             
@@ -64,29 +72,42 @@ class MLACitationParser(BaseCitationParser):
         # Complete MLA patterns for different citation types
         self.mla_patterns = {
             # Journal article: Author. "Title." Journal, vol. X, no. Y, Date, pp. X-Y.
-            "journal": re.compile(
+            "journal": self.regex_backend.compile(
                 r'^(.+?)\.\s*"([^"]+)"\.\s*([^,]+),\s*(?:vol\.\s*(\d+),?\s*)?(?:no\.\s*(\d+[A-Za-z]?),?\s*)?(.+?),\s*pp?\.\s*(\d+(?:[-–]\d+)?)\.',
                 re.DOTALL
             ),
             
             # Book: Author. Title. Publisher, Year.
-            "book": re.compile(
+            "book": self.regex_backend.compile(
                 r'^(.+?)\.\s*([^.]+)\.\s*([^,]+),\s*(\d{4})\.',
                 re.DOTALL
             ),
             
             # Web article: Author. "Title." Website, Date, URL.
-            "web": re.compile(
+            "web": self.regex_backend.compile(
                 r'^(.+?)\.\s*"([^"]+)"\.\s*([^,]+),\s*(.+?),\s*(https?://[^\s,]+)',
                 re.DOTALL
             ),
             
             # Book chapter: Author. "Chapter Title." Book Title, edited by Editor, Publisher, Year, pp. X-Y.
-            "chapter": re.compile(
+            "chapter": self.regex_backend.compile(
                 r'^(.+?)\.\s*"([^"]+)"\.\s*([^,]+),\s*edited by\s+(.+?),\s*([^,]+),\s*(\d{4}),\s*pp?\.\s*(\d+(?:[-–]\d+)?)\.',
                 re.DOTALL
             ),
         }
+        
+        # Features a candidate must have for each complete pattern to match;
+        # patterns missing one are not tried
+        self.pattern_features = {
+            "journal": {"quoted", "pages"},
+            "book": {"year_end"},
+            "web": {"quoted", "url"},
+            "chapter": {"quoted", "edited_by", "pages"}
+        }
+        self.pattern_stats = {'mla_patterns_skipped': 0}
+        for citation_type in self.mla_patterns:
+            self.pattern_stats[f'mla_{citation_type}_tried'] = 0
+            self.pattern_stats[f'mla_{citation_type}_hits'] = 0
     
     def parse(self, text: str) -> Optional[Citation]:
         """Parse a single MLA citation string.
@@ -99,15 +120,53 @@ class MLACitationParser(BaseCitationParser):
         """
         text = text.strip()
         
-        # Try each MLA pattern type
-        for citation_type, pattern in self.mla_patterns.items():
-            match = pattern.match(text)
-            if match:
-                return self._parse_by_type(text, citation_type, match)
+        # Very long candidates are unsplit pages, not citations
+        if not self.budget.fits(text):
+            return None
+        
+        # Try each plausible MLA pattern type, giving up once the time budget is spent
+        features = self._features(text)
+        stats = self.pattern_stats
+        deadline = self.budget.deadline()
+        try:
+            for citation_type, pattern in self.mla_patterns.items():
+                if not self.pattern_features[citation_type] <= features:
+                    stats['mla_patterns_skipped'] += 1
+                    continue
+                stats[f'mla_{citation_type}_tried'] += 1
+                match = self.budget.match(pattern, text, deadline)
+                if match:
+                    stats[f'mla_{citation_type}_hits'] += 1
+                    return self._parse_by_type(text, citation_type, match)
+            self.budget.check(deadline)
+        except BudgetExceeded:
+            return None
         
         # Fallback: try to extract components individually
         return self._fallback_parse(text)
     
+    def _features(self, text: str) -> Set[str]:
+        """Cheap features that decide which complete patterns could match.
+        
+        Args:
+            text: Citation string
+            
+        Returns:
+            Set of feature names found in the text
+        """
+        features = set()
+        if text.count('"') >= 2:
+            features.add("quoted")
+        if "p." in text:
+            features.add("pages")
+        if "http://" in text or "https://" in text:
+            features.add("url")
+        if "edited by" in text:
+            features.add("edited_by")
+        if YEAR_END.search(text):
+            features.add("year_end")
+        return features
+    
     def _parse_by_type(self, text: str, citation_type: str, match) -> Optional[Citation]:
         """Parse citation based on identified type and regex match."""
         
@@ -186,11 +245,10 @@ class MLACitationParser(BaseCitationParser):
             return None
         
         # Extract additional metadata
-        citation.doi = extract_doi(text)
+        fields = scan_fields(text)
+        citation.doi = fields.get("doi")
         if not citation.url:
-            urls = extract_urls(text)
-            if urls:
-                citation.url = urls[0]
+            citation.url = fields.get("url")
         
         # Calculate confidence
         citation.confidence_score = self.calculate_confidence(citation)
@@ -199,10 +257,14 @@ class MLACitationParser(BaseCitationParser):
     
     def _fallback_parse(self, text: str) -> Optional[Citation]:
         """Fallback method for when the main regex patterns don't match."""
+        self.parse_stats['fallback_parses'] += 1
         authors = self._extract_authors(text)
         title = self._extract_title(text)
         source = self._extract_source(text)
-        year = self._extract_year_from_text(text)
+        # One scan finds dates, DOI, URL, pages and vol./no. together
+        fields = scan_fields(text)
+        year_str = fields.get("date_year") or fields.get("bare_year")
+        year = int(year_str) if year_str else None
         
         if authors and title and source:
             citation = Citation(
@@ -215,11 +277,11 @@ class MLACitationParser(BaseCitationParser):
             )
             
             # Extract additional metadata
-            citation.doi = extract_doi(text)
-            citation.url = self._extract_url(text)
-            citation.pages = self._extract_pages_mla(text)
-            citation.volume = self._extract_volume(text)
-            citation.issue = self._extract_issue(text)
+            citation.doi = fields.get("doi")
+            citation.url = fields.get("url")
+            citation.pages = fields.get("labeled_pages") or fields.get("pages")
+            citation.volume = fields.get("labeled_volume")
+            citation.issue = fields.get("labeled_issue")
             citation.citation_type = self._determine_citation_type(text)
             
             # Calculate confidence (will be lower for partial matches)
@@ -238,90 +300,16 @@ class MLACitationParser(BaseCitationParser):
         Returns:
             List of Citation objects found in the text
         """
-        citations = []
-        
-        # Look for a works cited section
-        works_cited_match = re.search(r'(?:Works Cited|Bibliography|References)[:.\n]+(.*)', text, re.IGNORECASE | re.DOTALL)
-        if works_cited_match:
-            # If we found a works cited section, focus on that
-            works_cited_text = works_cited_match.group(1)
-            # Split by newlines (common format for works cited lists)
-            potential_citations = re.split(r'\n\s*\n|\n(?=[A-Z])', works_cited_text)
-        else:
-            # Otherwise, try to find citations in the full text
-            # Split by periods followed by multiple spaces or newlines, or by newlines followed by capital letters
-            potential_citations = re.split(r'\.\s{2,}|\.\n+|\n(?=[A-Z])', text)
-        
-        for potential in potential_citations:
-            # Skip very short strings
-            if len(potential.strip()) < 20:
-                continue
-                
-            # Basic check: does it look like it might be an MLA citation?
-            # Look for author pattern followed by title in quotes or just title in quotes
-            if (re.search(r'[A-Za-z]+.*"[^"]+"', potential) or 
-                re.search(r'^[A-Z][a-z]+,\s+[A-Z][a-z]+', potential)):
-                citation = self.parse(potential)
-                if citation and citation.confidence_score > 0.5:
-                    citations.append(citation)
-        
-        return citations
+        return list(self.iter_citations(text))
+    
+    def _looks_like_citation(self, text: str) -> bool:
+        """Basic check: does it look like it might be an MLA citation?"""
+        # Look for author pattern followed by title in quotes or just title in quotes
+        return has_quoted_title(text) or starts_with_full_name(text)
     
     def _process_authors(self, authors_str: str) -> List[str]:
         """Process author string into list of normalized author names for MLA format."""
-        authors_str = authors_str.strip()
-        
-        # Handle "et al." case
-        et_al_match = re.match(self.patterns["authors_et_al"], authors_str)
-        if et_al_match:
-            first_author = et_al_match.group(1).strip()
-            # Remove any trailing comma from the first author
-            if first_author.endswith(','):
-                first_author = first_author[:-1].strip()
-            return [normalize_author_name(first_author)]
-        
-        # Handle "and" case - "Smith, John, and Mary Johnson"
-        and_match = re.match(self.patterns["authors_and"], authors_str)
-        if and_match:
-            first_author = and_match.group(1).strip()
-            second_author = and_match.group(2).strip()
-            return [normalize_author_name(first_author), normalize_author_name(second_author)]
-        
-        # Handle multiple authors separated by commas (more than 2)
-        if ', and ' in authors_str:
-            # Split at ", and " to get the last author
-            parts = authors_str.split(', and ')
-            if len(parts) == 2:
-                # Process all authors before "and"
-                main_authors = parts[0].split(', ')
-                last_author = parts[1]
-                
-                authors = []
-                # Process main authors (pairs of lastname, firstname)
-                current_author = ""
-                for i, part in enumerate(main_authors):
-                    if i % 2 == 0:  # Even index = lastname
-                        current_author = part.strip()
-                    else:  # Odd index = firstname
-                        if current_author:
-                            authors.append(f"{current_author}, {part.strip()}")
-                            current_author = ""
-                
-                # Add any remaining single author
-                if current_author:
-                    authors.append(current_author)
-                
-                # Add the last author
-                authors.append(last_author.strip())
-                
-                return [normalize_author_name(author) for author in authors if author.strip()]
-        
-        # Single author case - "Smith, John"
-        if ',' in authors_str:
-            return [normalize_author_name(authors_str)]
-        
-        # Fallback - just return as is
-        return [normalize_author_name(authors_str)]
+        return self.author_tokenizer.split(authors_str)
     
     def _extract_authors(self, text: str) -> List[str]:
         """Extract authors from citation text."""
@@ -385,60 +373,9 @@ class MLACitationParser(BaseCitationParser):
         
         return None
     
-    def _extract_url(self, text: str) -> Optional[str]:
-        """Extract URL from citation text."""
-        urls = extract_urls(text)
-        if urls:
-            return urls[0]
-        
-        # Also check for MLA web pattern
-        web_match = re.search(self.patterns["web_url"], text)
-        if web_match:
-            return web_match.group(1)
-        
-        return None
-    
-    def _extract_pages_mla(self, text: str) -> Optional[str]:
-        """Extract page numbers in MLA format."""
-        pages_match = re.search(self.patterns["pages_mla"], text)
-        if pages_match:
-            return pages_match.group(1)
-        
-        # Fallback to general page extraction
-        return extract_pages(text)
-    
-    def _extract_volume(self, text: str) -> Optional[str]:
-        """Extract volume number in MLA format."""
-        volume_match = re.search(self.patterns["volume"], text)
-        if volume_match:
-            return volume_match.group(1)
-        return None
-    
-    def _extract_issue(self, text: str) -> Optional[str]:
-        """Extract issue number in MLA format."""
-        issue_match = re.search(self.patterns["issue"], text)
-        if issue_match:
-            return issue_match.group(1)
-        return None
-    
     def _determine_citation_type(self, text: str) -> str:
         """Determine the type of citation (article, book, chapter, etc.)."""
-        # Look for indicators of citation type
-        if re.search(r'"[^"]+".*[A-Z][^,]+,\s*vol\.|journal|magazine', text.lower()):
-            return "article"
-        if re.search(r'edited by|chapter', text.lower()):
-            return "book_chapter"
-        if re.search(r'https?://|web|website|accessed', text.lower()):
-            return "web"
-        if re.search(r'[A-Z][^.]+\.\s*[A-Z][^.]+\.\s*[A-Z][^,]+,\s*\d{4}', text):
-            return "book"
-        if re.search(r'conference|proceedings|symposium', text.lower()):
-            return "conference"
-        if re.search(r'thesis|dissertation', text.lower()):
-            return "thesis"
-        
-        # Default to article as most common type
-        return "article"
+        return self.type_classifier.classify(text)
     
     def calculate_confidence(self, citation: Citation) -> float:
         """Calculate confidence score for a parsed MLA citation.
@@ -468,3 +405,24 @@ class MLACitationParser(BaseCitationParser):
             score += 0.05
         
         return min(score, 1.0)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get parsing statistics, with how often each complete pattern matched.
+        
+        Returns:
+            Dictionary of counters, including mla_<type>_tried, mla_<type>_hits
+            and mla_<type>_hit_rate (hits per pattern tried) for each pattern
+        """
+        stats = super().get_stats()
+        stats.update(self.pattern_stats)
+        for citation_type in self.mla_patterns:
+            tried = stats[f'mla_{citation_type}_tried']
+            hits = stats[f'mla_{citation_type}_hits']
+            stats[f'mla_{citation_type}_hit_rate'] = hits / tried if tried else 0.0
+        return stats
+    
+    def reset_stats(self):
+        """Reset all parsing statistics."""
+        super().reset_stats()
+        for key in self.pattern_stats:
+            self.pattern_stats[key] = 0
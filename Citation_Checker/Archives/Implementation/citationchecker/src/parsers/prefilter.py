@@ -0,0 +1,72 @@
+"""
+Candidate Prefilter
+
+This module decides cheaply whether a candidate string could be a citation before
+it is handed to a full parse. Each check runs in time linear in the candidate: it
+searches for a rare structural anchor (a parenthesised year, a quoted title) and
+then only looks back along the anchor's own line, instead of backtracking over
+every letter of the text the way an equivalent single regex would.
+"""
+
+import re
+
+PAREN_YEAR = re.compile(r'\(\d{4}[a-z]?\)')
+LETTER = re.compile(r'[A-Za-z]')
+FULL_NAME_START = re.compile(r'[A-Z][a-z]+,\s+[A-Z][a-z]+')
+
+def has_author_year(text: str) -> bool:
+    """Check for a year in parentheses preceded by a letter on the same line.
+    
+    Accepts exactly the strings re.search(r'[A-Za-z]+.*\\(\\d{4}[a-z]?\\)', text)
+    accepts.
+    
+    Args:
+        text: Candidate citation string
+        
+    Returns:
+        True if the text has an author-year feature
+    """
+    checked = 0
+    for match in PAREN_YEAR.finditer(text):
+        # Everything between the line start and the previous anchor has
+        # already been found to contain no letter
+        start = max(text.rfind('\n', 0, match.start()) + 1, checked)
+        if LETTER.search(text, start, match.start()):
+            return True
+        checked = match.start()
+    return False
+
+def has_quoted_title(text: str) -> bool:
+    """Check for a non-empty quoted string opened after a letter on the same line.
+    
+    Accepts exactly the strings re.search(r'[A-Za-z]+.*"[^"]+"', text) accepts.
+    
+    Args:
+        text: Candidate citation string
+        
+    Returns:
+        True if the text has a quoted-title feature
+    """
+    last_quote = text.rfind('"')
+    checked = 0
+    quote = text.find('"')
+    while 0 <= quote < last_quote:
+        # The quote must open a non-empty run closed by a later quote
+        if text[quote + 1] != '"':
+            start = max(text.rfind('\n', 0, quote) + 1, checked)
+            if LETTER.search(text, start, quote):
+                return True
+            checked = quote
+        quote = text.find('"', quote + 1)
+    return False
+
+def starts_with_full_name(text: str) -> bool:
+    """Check whether the text starts with "Surname, Forename".
+    
+    Args:
+        text: Candidate citation string
+        
+    Returns:
+        True if the text starts with a spelled-out name
+    """
+    return FULL_NAME_START.match(text) is not None
@@ -0,0 +1,200 @@
+"""
+Regex Backends for Citation Parsers
+
+This module lets the full-citation patterns of the parsers run on different regex
+engines: the standard library re module, the third-party regex module (which can
+abort a match after a timeout), or an RE2 binding (linear-time matching with no
+catastrophic backtracking). Optional engines are only imported when selected.
+"""
+
+import logging
+import re
+import time
+from typing import Optional
+from src.parsers.timing import StageTimer, timed_stage
+
+logger = logging.getLogger(__name__)
+
+class BudgetExceeded(Exception):
+    """Raised when a citation candidate runs past its matching time budget."""
+    pass
+
+class RegexBackend:
+    """Standard library re backend.
+    
+    The stdlib engine cannot be interrupted, so a time budget is only enforced
+    between match attempts; the length budget is what bounds a single attempt.
+    """
+    
+    name = "re"
+    supports_timeout = False
+    
+    def compile(self, pattern: str, flags: int = 0):
+        """Compile a pattern for this backend.
+        
+        Args:
+            pattern: Regular expression source in Python re syntax
+            flags: re module flags (re.DOTALL, re.IGNORECASE, ...)
+            
+        Returns:
+            Compiled pattern object with re-compatible match()/search()
+        """
+        return re.compile(pattern, flags)
+    
+    def match(self, compiled, text: str, timeout: Optional[float] = None):
+        """Match a compiled pattern at the start of text.
+        
+        Args:
+            compiled: Pattern returned by compile()
+            text: Text to match
+            timeout: Seconds the match may take (ignored by this backend)
+            
+        Returns:
+            Match object or None
+        """
+        return compiled.match(text)
+
+class RegexModuleBackend(RegexBackend):
+    """Backend for the third-party regex module, which supports match timeouts."""
+    
+    name = "regex"
+    supports_timeout = True
+    
+    def __init__(self):
+        import regex
+        self._regex = regex
+    
+    def compile(self, pattern: str, flags: int = 0):
+        """Compile a pattern with the regex module (V0 behaves like re)."""
+        return self._regex.compile(_inline_flags(flags) + pattern, self._regex.VERSION0)
+    
+    def match(self, compiled, text: str, timeout: Optional[float] = None):
+        """Match a compiled pattern, raising BudgetExceeded if it times out."""
+        try:
+            return compiled.match(text, timeout=timeout)
+        except TimeoutError:
+            raise BudgetExceeded(f"Regex match exceeded {timeout:.3f}s")
+
+class RE2Backend(RegexBackend):
+    """Backend for an RE2 binding; patterns RE2 cannot express fall back to re."""
+    
+    name = "re2"
+    
+    def __init__(self):
+        import re2
+        self._re2 = re2
+    
+    def compile(self, pattern: str, flags: int = 0):
+        """Compile a pattern with RE2, or with re if RE2 rejects the syntax."""
+        try:
+            return self._re2.compile(_inline_flags(flags) + pattern)
+        except Exception as e:
+            logger.debug(f"RE2 cannot compile pattern, using re instead: {str(e)}")
+            return re.compile(pattern, flags)
+
+def _inline_flags(flags: int) -> str:
+    """Express re flags as an inline group that every backend understands."""
+    inline = ""
+    if flags & re.IGNORECASE:
+        inline += "i"
+    if flags & re.MULTILINE:
+        inline += "m"
+    if flags & re.DOTALL:
+        inline += "s"
+    return f"(?{inline})" if inline else ""
+
+# Backends in the order "auto" tries them
+_BACKENDS = {
+    "re2": RE2Backend,
+    "regex": RegexModuleBackend,
+    "re": RegexBackend,
+}
+
+def get_backend(name: str = "re") -> RegexBackend:
+    """Get a regex backend by name.
+    
+    Args:
+        name: "re", "regex", "re2", or "auto" for the first installed of
+            re2, regex and re
+            
+    Returns:
+        RegexBackend instance
+        
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the named backend's module is not installed
+    """
+    name = name.lower()
+    if name == "auto":
+        for backend_class in _BACKENDS.values():
+            try:
+                return backend_class()
+            except ImportError:
+                continue
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown regex backend: {name}")
+    return _BACKENDS[name]()
+
+class MatchBudget:
+    """Per-candidate time and length budget for full-citation matching.
+    
+    Attributes:
+        max_length: Longest candidate (in characters) that will be matched
+        time_budget: Seconds a single candidate may spend in pattern matching
+        stats: Counters of how often each budget was hit
+        timer: Stage timer that counts matches as the "match" stage, if any
+    """
+    
+    def __init__(self, backend: RegexBackend, max_length: Optional[int] = 5000,
+                 time_budget: Optional[float] = 0.25, timer: Optional[StageTimer] = None):
+        self.backend = backend
+        self.max_length = max_length
+        self.time_budget = time_budget
+        self.timer = timer
+        self.stats = {
+            'length_budget_hits': 0,
+            'time_budget_hits': 0
+        }
+    
+    def fits(self, text: str) -> bool:
+        """Check a candidate against the length budget, counting a hit if it is too long."""
+        if self.max_length is not None and len(text) > self.max_length:
+            self.stats['length_budget_hits'] += 1
+            return False
+        return True
+    
+    def deadline(self) -> Optional[float]:
+        """Start the clock for one candidate and return its deadline."""
+        if self.time_budget is None:
+            return None
+        return time.perf_counter() + self.time_budget
+    
+    def check(self, deadline: Optional[float]):
+        """Raise BudgetExceeded (and count a hit) if the deadline has passed."""
+        if deadline is not None and time.perf_counter() > deadline:
+            self.stats['time_budget_hits'] += 1
+            raise BudgetExceeded("Citation candidate exceeded its time budget")
+    
+    def match(self, compiled, text: str, deadline: Optional[float]):
+        """Match within the remaining budget.
+        
+        Args:
+            compiled: Pattern compiled by the backend
+            text: Candidate citation text
+            deadline: Value returned by deadline()
+            
+        Returns:
+            Match object or None
+            
+        Raises:
+            BudgetExceeded: If the budget ran out before or during the match
+        """
+        self.check(deadline)
+        timeout = None
+        if deadline is not None and self.backend.supports_timeout:
+            timeout = max(deadline - time.perf_counter(), 0.0)
+        try:
+            return timed_stage(self.timer, "match", self.backend.match, compiled, text, timeout)
+        except BudgetExceeded:
+            self.stats['time_budget_hits'] += 1
+            raise
@@ -0,0 +1,120 @@
+"""
+Reference Entry Segmentation
+
+This module splits a reference section into entries in a single pass over its
+lines. In a numbered list ("[12]", "12.") an entry starts at the next number in
+sequence, or at a later or repeated number (a gap left by a deleted reference or
+OCR) on a line at the entry indent that does not continue a broken-off line;
+the count then carries on from that number. Otherwise an entry starts at a line that begins like a reference (an
+author name such as "Smith, J." or "Smith, John", a quoted title, or a name
+followed by a year in parentheses), unless the line is indented under the
+previous one (a hanging indent) or the previous line breaks off mid-sentence.
+Blank lines always end an entry. Lines that start none of these continue the
+entry before them, so wrapped entries stay whole.
+"""
+
+import mmap
+import re
+from typing import IO, Iterable, Iterator, Tuple, Union
+from src.parsers.locator import iter_lines
+
+NUMBER_MARKER = re.compile(r'(?:\[(\d{1,4})\]|(\d{1,3})\.)\s+')
+AUTHOR_START = re.compile(
+    r"(?:(?:van|von|de|der|den|del|della|di|da|du|la|le)\s+)*"
+    r"[A-ZÀ-Þ][\w'’-]*(?:[ -][A-ZÀ-Þ][\w'’-]*)?"
+    r"(?:,\s*(?:[A-ZÀ-Þ]\b|[A-ZÀ-Þ][a-z]|&)"
+    # Vancouver style: "Smith JA, Jones B" or "Smith JA."
+    r"|\s+[A-Z]{1,3}(?:,\s+[A-ZÀ-Þ][\w'’-]*\s+[A-Z]{1,3}\b|\.))"
+)
+DATED_START = re.compile(r'[A-ZÀ-Þ][^()\n]{0,150}?\((?:\d{4}[a-z]?|n\.d\.)\)')
+QUOTED_START = re.compile(r'["“]')
+# A line ending like this breaks off in the middle of an entry
+OPEN_END = re.compile(r'(?:[,;:&(\-–]|\band|[a-z])$')
+
+Line = Tuple[int, int, int, str]
+
+def iter_entry_spans(source: Union[str, IO[str], bytes], start: int = 0, end: int = None) -> Iterator[Tuple[int, int]]:
+    """Yield the offsets of the reference entries in part of a document.
+    
+    Args:
+        source: Document text, a text file object, or a UTF-8 buffer such as
+            bytes or an mmap (see iter_lines)
+        start: Offset of the reference section
+        end: End offset of the section, or None for the end of the document
+        
+    Returns:
+        Iterator over (start, end) offsets of each entry, without its
+        number marker or indentation
+    """
+    byte_offsets = isinstance(source, (bytes, bytearray, memoryview, mmap.mmap))
+    return segment_lines(iter_lines(source, start, end), byte_offsets)
+
+def segment_lines(lines: Iterable[Line], byte_offsets: bool = False) -> Iterator[Tuple[int, int]]:
+    """Group the lines of a reference section into entries.
+    
+    Args:
+        lines: (offset, end of line, offset of next line, line text) tuples,
+            as yielded by iter_lines
+        byte_offsets: Whether offsets count UTF-8 bytes rather than characters
+        
+    Returns:
+        Iterator over (start, end) offsets of each entry
+    """
+    entry_start = entry_end = None
+    entry_indent = 0
+    # Decided by the first line: a numbered list or not
+    numbered = None
+    expected = None
+    previous = ""
+    
+    for offset, line_end, _, text in lines:
+        stripped = text.lstrip()
+        if not stripped.rstrip():
+            if entry_start is not None:
+                yield entry_start, entry_end
+                entry_start = None
+            continue
+        
+        indent = len(text) - len(stripped)
+        marker = NUMBER_MARKER.match(stripped)
+        if numbered is None:
+            numbered = marker is not None
+        
+        if numbered:
+            number = int(marker.group(1) or marker.group(2)) if marker else None
+            starts = marker is not None and (
+                expected is None or number == expected
+                # Out of sequence: only where an unnumbered entry could start too
+                or (number >= expected - 1 and indent <= entry_indent and not OPEN_END.search(previous))
+            )
+        else:
+            starts = (indent <= entry_indent
+                      and not OPEN_END.search(previous)
+                      and _looks_like_entry_start(stripped))
+        
+        if entry_start is None or starts:
+            if entry_start is not None:
+                yield entry_start, entry_end
+            skip = indent
+            if numbered and marker:
+                skip += marker.end()
+                expected = number + 1
+            prefix = text[:skip]
+            entry_start = offset + (len(prefix.encode('utf-8')) if byte_offsets else len(prefix))
+            entry_indent = indent
+        entry_end = line_end
+        previous = _last_word(stripped)
+    
+    if entry_start is not None:
+        yield entry_start, entry_end
+
+def _looks_like_entry_start(line: str) -> bool:
+    """Check whether a line begins the way reference entries begin."""
+    return (AUTHOR_START.match(line) is not None
+            or QUOTED_START.match(line) is not None
+            or DATED_START.match(line) is not None)
+
+def _last_word(line: str) -> str:
+    """Last word of a line, or "" if it is a URL or DOI, which never breaks off."""
+    word = line.rstrip().rsplit(None, 1)[-1]
+    return "" if '/' in word else word
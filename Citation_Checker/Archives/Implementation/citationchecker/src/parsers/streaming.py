@@ -0,0 +1,219 @@
+"""
+Streaming Reference Splitter
+
+This module splits a document into candidate citation strings without holding
+the whole document or the list of candidates in memory. The reference sections
+found by the locator are split into entries by the segmenter. A document with no
+heading-shaped section falls back to the text after the first mention of a
+reference heading, and with no mention at all the whole text is split on
+sentence ends and capitalised lines.
+"""
+
+import re
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+from src.parsers.locator import iter_lines, locate_reference_sections
+from src.parsers.segmenter import iter_entry_spans, segment_lines
+from src.parsers.timing import StageTimer, timed_iter, timed_stage
+
+# Characters read from a file (or sliced from a string) at a time
+CHUNK_SIZE = 64 * 1024
+
+HEADING_PATTERN = re.compile(r'(?:References|Bibliography|Works Cited)[:.\n]+', re.IGNORECASE)
+TEXT_SPLIT_PATTERN = re.compile(r'\.\s{2,}|\.\n+|\n(?=[A-Z])')
+
+# Byte versions of the patterns above for splitting a UTF-8 buffer in place.
+# Newlines also match \r\n and \r (open() translates them), and whitespace
+# covers the UTF-8 encodings of everything str patterns treat as \s. The
+# heading is matched case-insensitively in ASCII only.
+_NL = rb'(?:\r\n|\r(?!\n)|\n)'
+_WS = (rb'(?:[\t\n\x0b\x0c\r\x1c-\x1f ]|\xc2[\x85\xa0]|\xe1\x9a\x80'
+       rb'|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)')
+BYTES_HEADING_PATTERN = re.compile(rb'(?:References|Bibliography|Works Cited)(?::|\.|' + _NL + rb')+', re.IGNORECASE)
+BYTES_TEXT_SPLIT_PATTERN = re.compile(rb'\.' + _WS + rb'{2,}|\.' + _NL + rb'+|' + _NL + rb'(?=[A-Z])')
+
+# Longest heading word; a heading can start no earlier than this many
+# characters before the end of a chunk that did not contain one
+_HEADING_LOOKBACK = len("Bibliography")
+
+def iter_reference_entries(source: Union[str, IO[str]], chunk_size: int = CHUNK_SIZE,
+                           timer: Optional[StageTimer] = None) -> Iterator[str]:
+    """Yield candidate citation strings from a text or a text file object.
+    
+    Memory use is bounded by the current candidate plus one chunk, except
+    for file objects that cannot seek, which are read whole because the
+    reference sections are located before any of them is split.
+    
+    Args:
+        source: Document text, or a file object opened in text mode
+        chunk_size: Number of characters to read at a time
+        timer: Stage timer to count locating and splitting under, if any
+        
+    Returns:
+        Iterator over candidate citation strings
+    """
+    if not isinstance(source, str) and not source.seekable():
+        source = source.read()
+    
+    if isinstance(source, str):
+        sections = timed_stage(timer, "locate", _reference_sections, source)
+        if sections is None:
+            pieces = split_chunks(_slices(source, 0, chunk_size), TEXT_SPLIT_PATTERN)
+            yield from timed_iter(timer, "segment", pieces)
+        for section_start, section_end in sections or []:
+            for start, end in timed_iter(timer, "segment", iter_entry_spans(source, section_start, section_end)):
+                yield source[start:end]
+        return
+    
+    origin = source.tell()
+    sections = timed_stage(timer, "locate", _locate_in_file, source, origin, chunk_size)
+    source.seek(origin)
+    
+    if sections is None:
+        pieces = split_chunks(iter(lambda: source.read(chunk_size), ""), TEXT_SPLIT_PATTERN)
+        yield from timed_iter(timer, "segment", pieces)
+        return
+    yield from timed_iter(timer, "segment", _file_entries(iter_lines(source, sections[0][0]), sections))
+
+def iter_reference_spans(data, timer: Optional[StageTimer] = None) -> Iterator[Tuple[int, int]]:
+    """Yield the byte offsets of candidate citations in a UTF-8 buffer.
+    
+    The buffer (bytes, mmap or memoryview) is searched in place, so nothing is
+    copied. Decoding each span and translating its newlines gives the
+    candidates iter_reference_entries() finds in the decoded text.
+    
+    Args:
+        data: UTF-8 encoded document
+        timer: Stage timer to count locating and splitting under, if any
+        
+    Returns:
+        Iterator over (start, end) byte offsets
+    """
+    sections = timed_stage(timer, "locate", _reference_sections, data)
+    if sections is None:
+        yield from timed_iter(timer, "segment", _split_spans(data))
+        return
+    for section_start, section_end in sections:
+        yield from timed_iter(timer, "segment", iter_entry_spans(data, section_start, section_end))
+
+def _split_spans(data) -> Iterator[Tuple[int, int]]:
+    """Byte offsets of the pieces between TEXT_SPLIT separators in a buffer."""
+    start = 0
+    for separator in BYTES_TEXT_SPLIT_PATTERN.finditer(data):
+        yield start, separator.start()
+        start = separator.end()
+    yield start, len(data)
+
+def _reference_sections(source) -> Optional[List[Tuple[int, Optional[int]]]]:
+    """Reference sections of text or a UTF-8 buffer, or None if it has no heading at all.
+    
+    Without a heading-shaped section, the text after the first mention of a
+    reference heading is used.
+    """
+    sections = locate_reference_sections(source)
+    if sections:
+        return sections
+    pattern = HEADING_PATTERN if isinstance(source, str) else BYTES_HEADING_PATTERN
+    match = pattern.search(source)
+    return [(match.end(), None)] if match else None
+
+def _locate_in_file(source: IO[str], origin: int, chunk_size: int) -> Optional[List[Tuple[int, Optional[int]]]]:
+    """Reference sections of a seekable file read from origin, like _reference_sections()."""
+    sections = locate_reference_sections(source)
+    if sections:
+        return sections
+    source.seek(origin)
+    heading_end = _find_heading_end(source, chunk_size)
+    return None if heading_end is None else [(heading_end, None)]
+
+def _find_heading_end(source: IO[str], chunk_size: int) -> Optional[int]:
+    """Offset just past the first reference heading in a file, read in chunks."""
+    window = ""
+    # Characters read before the window starts
+    consumed = 0
+    for chunk in iter(lambda: source.read(chunk_size), ""):
+        window += chunk
+        match = HEADING_PATTERN.search(window)
+        if match and match.end() < len(window):
+            return consumed + match.end()
+        # A match running to the end of the window may still grow
+        keep = match.start() if match else max(len(window) - _HEADING_LOOKBACK, 0)
+        consumed += keep
+        window = window[keep:]
+    match = HEADING_PATTERN.search(window)
+    return consumed + match.end() if match else None
+
+def _file_entries(lines: Iterator[Tuple[int, int, int, str]], sections) -> Iterator[str]:
+    """Yield the text of each entry in the sections of a file, from one pass over its lines.
+    
+    Lines are held only until the entries they belong to have been yielded.
+    """
+    held = []
+    
+    def section_lines(start, end):
+        for line in lines:
+            if end is not None and line[0] >= end:
+                return
+            if line[0] >= start:
+                held.append(line)
+                yield line
+    
+    for section_start, section_end in sections:
+        for start, end in segment_lines(section_lines(section_start, section_end)):
+            pieces = []
+            for offset, line_end, next_offset, text in held:
+                if offset >= end:
+                    break
+                if next_offset > line_end:
+                    text += '\n'
+                pieces.append(text[max(start - offset, 0):end - offset])
+            yield ''.join(pieces)
+            held = [line for line in held if line[0] >= end]
+
+def split_chunks(chunks: Iterable[str], pattern) -> Iterator[str]:
+    """Split a stream of text chunks on a separator pattern, like re.split().
+    
+    Separators may straddle chunk boundaries. A separator is only acted on once
+    a non-whitespace character has been read after its start, which is all the
+    look-ahead the splitting patterns in this module need.
+    
+    Args:
+        chunks: Consecutive pieces of the text
+        pattern: Compiled separator pattern made of whitespace, "." and a
+            one-character lookahead
+            
+    Returns:
+        Iterator over the pieces between separators
+    """
+    buffer = ""
+    scan_from = 0
+    
+    for chunk in chunks:
+        buffer += chunk
+        stable_end = _last_non_space(buffer)
+        start = 0
+        for match in pattern.finditer(buffer, scan_from):
+            if match.start() >= stable_end:
+                break
+            yield buffer[start:match.start()]
+            start = match.end()
+        buffer = buffer[start:]
+        # Every position before stable_end has been tried already
+        scan_from = max(stable_end - start, 0)
+    
+    start = 0
+    for match in pattern.finditer(buffer, scan_from):
+        yield buffer[start:match.start()]
+        start = match.end()
+    yield buffer[start:]
+
+def _slices(text: str, start: int, size: int) -> Iterator[str]:
+    """Yield text[start:] in slices of at most size characters."""
+    for i in range(start, len(text), size):
+        yield text[i:i + size]
+
+def _last_non_space(text: str) -> int:
+    """Index of the last non-whitespace character in text, or -1."""
+    i = len(text) - 1
+    while i >= 0 and text[i].isspace():
+        i -= 1
+    return i
@@ -0,0 +1,137 @@
+"""
+Parsing Stage Timer
+
+This module keeps aggregate call counts and times for each stage of citation
+extraction, from locating the reference sections to scoring each citation. Only
+counters are kept, never per-call records, and timing can be limited to one in
+every N calls of a stage, so the timer can stay on in production.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+# In document order. Times are inclusive: "fallback" contains the author,
+# type and confidence stages it runs
+STAGES = ("locate", "segment", "prefilter", "match", "fallback", "authors", "classify", "confidence")
+
+class StageTimer:
+    """Aggregate counters of calls and time spent per parsing stage.
+    
+    Attributes:
+        sample_every: Time one in this many calls of each stage
+        calls: Calls per stage
+        sampled: Timed calls per stage
+        seconds: Time spent in the timed calls, per stage
+    """
+    
+    def __init__(self, sample_every: int = 1):
+        """Initialize the timer.
+        
+        Args:
+            sample_every: Time one in this many calls of each stage (1 times
+                every call)
+                
+        Raises:
+            ValueError: If sample_every is less than 1
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.sample_every = sample_every
+        self.calls = dict.fromkeys(STAGES, 0)
+        self.sampled = dict.fromkeys(STAGES, 0)
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+    
+    def call(self, stage: str, func: Callable, *args, **kwargs) -> Any:
+        """Run func as one call of a stage.
+        
+        Args:
+            stage: Stage name from STAGES
+            func: Callable doing the stage's work
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Whatever func returns
+        """
+        calls = self.calls[stage] + 1
+        self.calls[stage] = calls
+        # Calls 1, 1 + N, 1 + 2N, ... are timed, so one-off stages are always timed
+        if (calls - 1) % self.sample_every:
+            return func(*args, **kwargs)
+        
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.seconds[stage] += time.perf_counter() - start
+            self.sampled[stage] += 1
+    
+    def add(self, stage: str, seconds: float):
+        """Record one call of a stage that the caller has already timed.
+        
+        Args:
+            stage: Stage name from STAGES
+            seconds: Time the call took
+        """
+        self.calls[stage] += 1
+        self.sampled[stage] += 1
+        self.seconds[stage] += seconds
+    
+    def iterate(self, stage: str, iterable: Iterable) -> Iterator:
+        """Yield from an iterable, counting each step of it as a call of a stage.
+        
+        Only the time spent producing items is counted, not the time the
+        consumer spends between them. The final step, which finds the end,
+        counts as a call too.
+        
+        Args:
+            stage: Stage name from STAGES
+            iterable: Iterable doing the stage's work lazily
+            
+        Returns:
+            Iterator over the same items
+        """
+        iterator = iter(iterable)
+        while True:
+            try:
+                item = self.call(stage, next, iterator)
+            except StopIteration:
+                return
+            yield item
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get call counts and estimated time for every stage.
+        
+        When only some calls are timed, a stage's time is estimated from
+        the mean of its timed calls.
+        
+        Returns:
+            Dictionary with stage_<name>_calls and stage_<name>_seconds for
+            each stage
+        """
+        stats = {}
+        for stage in STAGES:
+            calls = self.calls[stage]
+            sampled = self.sampled[stage]
+            stats[f'stage_{stage}_calls'] = calls
+            stats[f'stage_{stage}_seconds'] = self.seconds[stage] * calls / sampled if sampled else 0.0
+        return stats
+    
+    def reset(self):
+        """Reset all counters."""
+        for stage in STAGES:
+            self.calls[stage] = 0
+            self.sampled[stage] = 0
+            self.seconds[stage] = 0.0
+
+def timed_stage(timer, stage: str, func: Callable, *args, **kwargs) -> Any:
+    """Run func as a call of a stage if there is a timer, or plainly if timer is None."""
+    if timer is None:
+        return func(*args, **kwargs)
+    return timer.call(stage, func, *args, **kwargs)
+
+def timed_iter(timer, stage: str, iterable: Iterable) -> Iterable:
+    """Time an iterable's items as calls of a stage if there is a timer."""
+    if timer is None:
+        return iterable
+    return timer.iterate(stage, iterable)
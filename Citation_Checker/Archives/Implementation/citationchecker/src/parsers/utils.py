@@ -1,4 +1,5 @@
 import re
+from dataclasses import dataclass
 from typing import List, Optional, Tuple, Dict
 
 def normalize_author_name(author: str) -> str:
@@ -141,4 +142,163 @@ def extract_volume_issue(text: str) -> Tuple[Optional[str], Optional[str]]:
     if vol_match:
         return vol_match.group(1), None
     
-    return None, None
\ No newline at end of file
+    return None, None
+
+# Single-pass field scanner. Every alternative starts at a cheap trigger (a digit
+# run, "(", "p", "vol.", "no.", "Accessed", "http" or "doi:") and records its
+# field through a lookahead, consuming at most the trigger itself, so fields that
+# overlap (a year inside a DOI, a page number after "p") are all seen in one scan.
+# The two leading lookaheads only exist to reject non-trigger positions quickly.
+_FIELD_SCANNER = re.compile(r"""
+    (?=[\d(pvnAhHdD])(?=[\d(]|pp?\.?\s*\d|vol\.|no\.|Acc|[hH][tT]|[dD][oO][iI]:)
+    (?:
+    (?P<digits>(?=\d)
+        (?:(?=(?P<date>\b\d{1,2}\s+[A-Za-z]{3,9}\.?\s+(?P<date_year>(?:19|20)\d{2})\b))|)
+        (?:(?=(?P<bare_doi>\b10\.\d{4,}/[-._;()/:A-Za-z0-9]+\b))|)
+        (?:(?<!\w)(?=(?P<bare_year>(?:19|20)\d{2}(?!\w)))|)
+        (?:(?<=[,\s])(?P<sep_before>)|)
+        (?P<num>\d+)
+        (?:(?=\s*\((?P<num_issue>\d+[A-Za-z]?)\))|)
+        (?:(?=[,\s])(?P<sep_after>)|)
+        (?:(?=(?P<range_tail>[-–—]\d+)\.?$)|)
+    )
+    | (?P<paren>(?=\((?P<paren_year>\d{4})[a-z]?\)) \( )
+    | (?P<page>(?=pp?(?P<page_dot>\.)?\s*(?P<page_value>(?P<page_lo>\d+)(?:(?P<page_dash>[-–—])\d+)?)) p )
+    | (?P<vol>(?=vol\.\s*(?P<labeled_volume>\d+)) v )
+    | (?P<no>(?=no\.\s*(?P<labeled_issue>\d+[A-Za-z]?)) n )
+    | (?P<accessed>(?=Accessed\s+(?P<access_date>\d{1,2}\s+[A-Za-z]{3,9}\.?\s+\d{4})) A )
+    | (?P<link>
+        (?=(?P<url>https?://[^\s)"]+))
+        (?:(?=(?i:https?://doi\.org/)(?P<url_doi>\S+))|)
+        h
+    )
+    | (?P<doi_label>(?=(?i:https?://doi\.org/|doi:\s*)(?P<doi>\S+)) [hHdD] )
+    )
+""", re.VERBOSE)
+
+_GROUPS = _FIELD_SCANNER.groupindex
+_G_DATE, _G_DATE_YEAR = _GROUPS["date"], _GROUPS["date_year"]
+_G_BARE_DOI, _G_BARE_YEAR = _GROUPS["bare_doi"], _GROUPS["bare_year"]
+_G_SEP_BEFORE, _G_SEP_AFTER = _GROUPS["sep_before"], _GROUPS["sep_after"]
+_G_NUM, _G_NUM_ISSUE, _G_RANGE_TAIL = _GROUPS["num"], _GROUPS["num_issue"], _GROUPS["range_tail"]
+_G_PAREN_YEAR = _GROUPS["paren_year"]
+_G_PAGE_DOT, _G_PAGE_VALUE, _G_PAGE_LO = _GROUPS["page_dot"], _GROUPS["page_value"], _GROUPS["page_lo"]
+_G_LABELED_VOLUME, _G_LABELED_ISSUE = _GROUPS["labeled_volume"], _GROUPS["labeled_issue"]
+_G_ACCESS_DATE = _GROUPS["access_date"]
+_G_URL, _G_URL_DOI, _G_DOI = _GROUPS["url"], _GROUPS["url_doi"], _GROUPS["doi"]
+
+Span = Tuple[int, int]
+
+@dataclass
+class CitationFields:
+    """Field spans found by scan_fields() in one pass over a citation string.
+    
+    Every span is a (start, end) pair of offsets into text, or None when the
+    field was not found. The generic fields follow the same precedence as the
+    extract_* helpers above; the labeled_* fields are the "p."/"pp.", "vol."
+    and "no." forms used by MLA citations.
+    """
+    
+    text: str
+    paren_year: Optional[Span] = None
+    bare_year: Optional[Span] = None
+    date: Optional[Span] = None
+    date_year: Optional[Span] = None
+    access_date: Optional[Span] = None
+    doi: Optional[Span] = None
+    url: Optional[Span] = None
+    pages: Optional[Span] = None
+    labeled_pages: Optional[Span] = None
+    volume: Optional[Span] = None
+    issue: Optional[Span] = None
+    labeled_volume: Optional[Span] = None
+    labeled_issue: Optional[Span] = None
+    
+    def get(self, field: str) -> Optional[str]:
+        """Return the text of a scanned field, or None if it was not found."""
+        span = getattr(self, field)
+        if span is None:
+            return None
+        return self.text[span[0]:span[1]]
+    
+    @property
+    def year(self) -> Optional[int]:
+        """Year with the same precedence as extract_year()."""
+        span = self.paren_year or self.bare_year
+        return int(self.text[span[0]:span[1]]) if span else None
+
+def scan_fields(text: str) -> CitationFields:
+    """Find year, DOI, URL, pages, volume/issue and dates in a single pass.
+    
+    Args:
+        text: Citation text to scan
+        
+    Returns:
+        CitationFields holding the span of the first occurrence of each field
+    """
+    fields = CitationFields(text)
+    bare_doi = None
+    trailing_pages = None
+    bare_volume = None
+    
+    for match in _FIELD_SCANNER.finditer(text):
+        kind = match.lastgroup
+        if kind == "digits":
+            if fields.date is None and match.start(_G_DATE) >= 0:
+                fields.date = match.span(_G_DATE)
+                fields.date_year = match.span(_G_DATE_YEAR)
+            if bare_doi is None and match.start(_G_BARE_DOI) >= 0:
+                bare_doi = match.span(_G_BARE_DOI)
+            if fields.bare_year is None and match.start(_G_BARE_YEAR) >= 0:
+                fields.bare_year = match.span(_G_BARE_YEAR)
+            if fields.volume is None and match.start(_G_NUM_ISSUE) >= 0:
+                fields.volume = match.span(_G_NUM)
+                fields.issue = match.span(_G_NUM_ISSUE)
+            elif (bare_volume is None and match.start(_G_SEP_BEFORE) >= 0
+                  and match.start(_G_SEP_AFTER) >= 0):
+                bare_volume = match.span(_G_NUM)
+            if match.start(_G_RANGE_TAIL) >= 0 and _follows_separator(text, match.start(_G_NUM)):
+                trailing_pages = (match.start(_G_NUM), match.end(_G_RANGE_TAIL))
+        elif kind == "paren":
+            if fields.paren_year is None:
+                fields.paren_year = match.span(_G_PAREN_YEAR)
+        elif kind == "page":
+            if fields.pages is None:
+                fields.pages = match.span(_G_PAGE_VALUE)
+            if fields.labeled_pages is None and match.start(_G_PAGE_DOT) >= 0:
+                if match.group("page_dash") == "—":
+                    fields.labeled_pages = match.span(_G_PAGE_LO)
+                else:
+                    fields.labeled_pages = match.span(_G_PAGE_VALUE)
+        elif kind == "vol":
+            if fields.labeled_volume is None:
+                fields.labeled_volume = match.span(_G_LABELED_VOLUME)
+        elif kind == "no":
+            if fields.labeled_issue is None:
+                fields.labeled_issue = match.span(_G_LABELED_ISSUE)
+        elif kind == "accessed":
+            if fields.access_date is None:
+                fields.access_date = match.span(_G_ACCESS_DATE)
+        elif kind == "link":
+            if fields.url is None:
+                fields.url = match.span(_G_URL)
+            if fields.doi is None and match.start(_G_URL_DOI) >= 0:
+                fields.doi = match.span(_G_URL_DOI)
+        elif fields.doi is None:
+            fields.doi = match.span(_G_DOI)
+    
+    if fields.doi is None:
+        fields.doi = bare_doi
+    if fields.pages is None:
+        fields.pages = trailing_pages
+    if fields.volume is None:
+        fields.volume = bare_volume
+    
+    return fields
+
+def _follows_separator(text: str, pos: int) -> bool:
+    """Check whether pos is preceded by a comma or period and optional whitespace."""
+    pos -= 1
+    while pos >= 0 and text[pos].isspace():
+        pos -= 1
+    return pos >= 0 and text[pos] in ",."
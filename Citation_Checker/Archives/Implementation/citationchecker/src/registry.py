@@ -0,0 +1,100 @@
+"""
+Component Registry
+
+This module lists the parsers and crawlers by name, as "module:Class" strings,
+so that looking one up imports only that component, and only the first time
+it is used. Short command-line runs then never import the parsers they do not
+use, or the crawlers and their HTTP and HTML libraries at all.
+"""
+
+import importlib
+from typing import Any, Dict, List, Union
+
+class Registry:
+    """Named classes that are imported when first used.
+    
+    Attributes:
+        kind: What the registry holds ("parser" or "crawler"), for messages
+    """
+    
+    def __init__(self, kind: str, targets: Dict[str, str]):
+        """Initialize the registry.
+        
+        Args:
+            kind: What the registry holds, for error messages
+            targets: "module:Class" import path for each name
+        """
+        self.kind = kind
+        self._targets: Dict[str, Union[str, type]] = {}
+        for name, target in targets.items():
+            self.register(name, target)
+    
+    def register(self, name: str, target: Union[str, type]):
+        """Add a component, or replace the one registered under the same name.
+        
+        Args:
+            name: Name to look the component up by (case-insensitive)
+            target: The class itself, or its "module:Class" import path
+        """
+        self._targets[name.lower()] = target
+    
+    def names(self) -> List[str]:
+        """Get the registered names, sorted."""
+        return sorted(self._targets)
+    
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._targets
+    
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a component's class has been imported yet."""
+        return isinstance(self._targets.get(name.lower()), type)
+    
+    def load(self, name: str) -> type:
+        """Get a component's class, importing its module the first time.
+        
+        Args:
+            name: Registered name
+            
+        Returns:
+            The component's class
+            
+        Raises:
+            ValueError: If no component is registered under the name
+        """
+        key = name.lower()
+        target = self._targets.get(key)
+        if target is None:
+            raise ValueError(f"Unknown {self.kind} '{name}'; available: {', '.join(self.names())}")
+        if isinstance(target, str):
+            module_name, class_name = target.split(":")
+            target = getattr(importlib.import_module(module_name), class_name)
+            self._targets[key] = target
+        return target
+    
+    def create(self, name: str, *args, **kwargs) -> Any:
+        """Create an instance of a component.
+        
+        Args:
+            name: Registered name
+            *args: Positional arguments for the class
+            **kwargs: Keyword arguments for the class
+            
+        Returns:
+            New instance of the component's class
+            
+        Raises:
+            ValueError: If no component is registered under the name
+        """
+        return self.load(name)(*args, **kwargs)
+
+parsers = Registry("parser", {
+    "apa": "src.parsers.apa_parser:APACitationParser",
+    "mla": "src.parsers.mla_parser:MLACitationParser",
+    # Detects the format of each entry, for mixed bibliographies
+    "auto": "src.parsers.auto_parser:AutoCitationParser"
+})
+
+crawlers = Registry("crawler", {
+    "academic": "src.crawlers.academic_crawler:AcademicCrawler",
+    "web": "src.crawlers.web_crawler:WebCrawler"
+})
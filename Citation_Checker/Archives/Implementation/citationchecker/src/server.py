@@ -0,0 +1,427 @@
+"""
+Citation Parser Module - Parse Server
+
+This module runs the citation parsers as a long-lived local service, so that
+callers such as an editor plugin do not pay interpreter startup, imports and
+parser construction on every request. Each parser is built once and owned by
+a batching thread, which gathers requests that arrive close together into a
+single parse_many() call. The server listens on a local TCP port or a Unix
+domain socket and speaks JSON over HTTP:
+
+- POST /parse: {"text": ...} extracts every citation from a document,
+  {"citation": ...} parses one citation and {"citations": [...]} parses
+  several; "parser" selects apa, mla or auto (default: apa)
+- GET /health: liveness and the parsers being served; 503 if a parser's
+  batching thread has stopped
+- GET /metrics: request, batch and parser counters
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.main import get_parser
+
+logger = logging.getLogger(__name__)
+
+# Largest request body accepted, in bytes
+MAX_BODY = 10 * 1024 * 1024
+
+class ParseBatcher:
+    """Runs parse requests for one warm parser, batching those that arrive together.
+    
+    Only the batcher's thread touches the parser, so requests from many
+    connections can be served without locking it.
+    
+    Attributes:
+        parser: Parser instance requests are run on
+        max_batch: Most requests run in one batch
+        max_wait: Seconds to wait for more requests after the first of a batch;
+            with 0, a batch is whatever has queued up while the last one ran
+        workers: Worker processes parse_many() may use (None parses serially)
+        stats: Counters of requests and batches
+    """
+    
+    def __init__(self, parser, max_batch: int = 64, max_wait: float = 0.0, workers: Optional[int] = None):
+        self.parser = parser
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.workers = workers
+        self.stats = {
+            'requests': 0,
+            'batches': 0,
+            'batched_citations': 0,
+            'largest_batch': 0
+        }
+        if workers and workers > 1:
+            parser.start_pool(workers)
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"parse-batcher-{parser.format_name}", daemon=True)
+        self._thread.start()
+    
+    def submit(self, kind: str, payload: Any = None) -> Future:
+        """Queue a request for the batcher's thread.
+        
+        Args:
+            kind: "parse" (payload is a list of citation strings), "extract"
+                (payload is a document) or "stats"
+            payload: Request data
+            
+        Returns:
+            Future for the request's result
+        """
+        future = Future()
+        self._queue.put((kind, payload, future))
+        return future
+    
+    @property
+    def alive(self) -> bool:
+        """Whether the batching thread is still taking requests."""
+        return self._thread.is_alive()
+    
+    def close(self):
+        """Finish queued requests, stop the thread and close any worker pool."""
+        self._queue.put(None)
+        self._thread.join()
+        self.parser.close_pool()
+    
+    def _run(self):
+        """Take requests off the queue in batches until close() is called."""
+        running = True
+        while running:
+            request = self._queue.get()
+            if request is None:
+                break
+            batch = [request]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                try:
+                    # Past the deadline, still take whatever is already queued
+                    request = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    running = False
+                    break
+                batch.append(request)
+            self._run_batch(batch)
+    
+    def _run_batch(self, batch: List[Tuple[str, Any, Future]]):
+        """Run one batch: all citation strings in one parse_many() call, then the rest.
+        
+        If the shared parse_many() call fails, each parse request is run again
+        on its own, so one bad request does not fail the others in its batch.
+        """
+        self.stats['requests'] += len(batch)
+        self.stats['batches'] += 1
+        self.stats['largest_batch'] = max(self.stats['largest_batch'], len(batch))
+        
+        parses = [(payload, future) for kind, payload, future in batch if kind == "parse"]
+        if parses:
+            texts = [text for payload, _ in parses for text in payload]
+            self.stats['batched_citations'] += len(texts)
+            try:
+                results = self.parser.parse_many(texts, workers=self.workers)
+            except Exception:
+                # Run each request on its own, so only the one that fails gets the error
+                logger.debug("Batch of %d requests failed; retrying them one by one", len(parses))
+                for payload, future in parses:
+                    try:
+                        future.set_result(self.parser.parse_many(payload, workers=self.workers))
+                    except Exception as e:
+                        future.set_exception(e)
+            else:
+                start = 0
+                for payload, future in parses:
+                    future.set_result(results[start:start + len(payload)])
+                    start += len(payload)
+        
+        for kind, payload, future in batch:
+            if kind == "parse":
+                continue
+            try:
+                if kind == "extract":
+                    future.set_result(self.parser.extract_citations(payload))
+                else:
+                    future.set_result(dict(self.parser.get_stats()))
+            except Exception as e:
+                future.set_exception(e)
+
+class RequestError(Exception):
+    """A request the server cannot handle, with the HTTP status to answer it with."""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+class CitationServer:
+    """Warm parsers and the request handling shared by every connection.
+    
+    Attributes:
+        batchers: ParseBatcher for each parser name served
+        request_timeout: Seconds a request waits for its batcher before a 503
+        stats: Counters of requests and errors
+        started: Time the server started
+    """
+    
+    def __init__(self, parsers: Iterable[str] = ("apa", "mla", "auto"), max_batch: int = 64,
+                 max_wait: float = 0.0, workers: Optional[int] = None, request_timeout: float = 30.0):
+        """Build the parsers and start their batching threads.
+        
+        Args:
+            parsers: Names of the parsers to serve
+            max_batch: Most requests run in one batch
+            max_wait: Seconds a batch waits for more requests after its first
+            workers: Worker processes each parser may use for parse_many()
+            request_timeout: Seconds a request waits for its result before it
+                is answered with 503
+            
+        Raises:
+            ValueError: If a parser name is unknown
+        """
+        self.request_timeout = request_timeout
+        self.batchers = {}
+        for name in parsers:
+            parser = get_parser(name)
+            if parser is None:
+                self.close()
+                raise ValueError(f"Parser '{name}' not found.")
+            self.batchers[name.lower()] = ParseBatcher(parser, max_batch, max_wait, workers)
+        self.stats = {
+            'requests': 0,
+            'errors': 0,
+            'request_seconds': 0.0
+        }
+        self._lock = threading.Lock()
+        self.started = time.time()
+    
+    def handle(self, method: str, path: str, body: bytes = b"") -> Tuple[int, Dict[str, Any]]:
+        """Handle one request.
+        
+        Args:
+            method: HTTP method
+            path: Request path
+            body: Request body
+            
+        Returns:
+            HTTP status and JSON-serializable response
+        """
+        started = time.perf_counter()
+        try:
+            status, response = 200, self._route(method, path.split("?", 1)[0], body)
+        except RequestError as e:
+            status, response = e.status, {"error": str(e)}
+        except Exception as e:
+            logger.exception("Error handling request")
+            status, response = 500, {"error": f"{type(e).__name__}: {str(e)}"}
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['errors'] += status >= 400
+            self.stats['request_seconds'] += time.perf_counter() - started
+        return status, response
+    
+    def _route(self, method: str, path: str, body: bytes) -> Dict[str, Any]:
+        """Dispatch a request to its endpoint."""
+        if path == "/health" and method == "GET":
+            stopped = sorted(name for name, batcher in self.batchers.items() if not batcher.alive)
+            if stopped:
+                raise RequestError(503, f"Parsers not running: {', '.join(stopped)}")
+            return {"status": "ok", "parsers": sorted(self.batchers), "uptime_seconds": time.time() - self.started}
+        if path == "/metrics" and method == "GET":
+            return self.metrics()
+        if path == "/parse":
+            if method != "POST":
+                raise RequestError(405, "Use POST for /parse")
+            return self._parse(body)
+        raise RequestError(404, f"No endpoint {method} {path}")
+    
+    def _parse(self, body: bytes) -> Dict[str, Any]:
+        """Run a /parse request on its parser's batcher."""
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError as e:
+            raise RequestError(400, f"Invalid JSON: {str(e)}")
+        if not isinstance(request, dict):
+            raise RequestError(400, "Request must be a JSON object")
+        batcher = self.batchers.get(str(request.get("parser", "apa")).lower())
+        if batcher is None:
+            raise RequestError(400, f"Parser '{request.get('parser')}' is not served")
+        
+        if isinstance(request.get("text"), str):
+            citations = self._run(batcher, "extract", request["text"])
+            return {"citations": [citation.to_dict() for citation in citations], "count": len(citations)}
+        if isinstance(request.get("citation"), str):
+            citation = self._run(batcher, "parse", [request["citation"]])[0]
+            return {"citation": citation.to_dict() if citation else None}
+        texts = request.get("citations")
+        if isinstance(texts, list) and all(isinstance(text, str) for text in texts):
+            citations = self._run(batcher, "parse", texts)
+            return {"citations": [citation.to_dict() if citation else None for citation in citations]}
+        raise RequestError(400, 'Request needs "text", "citation" or a "citations" list of strings')
+    
+    def _run(self, batcher: ParseBatcher, kind: str, payload: Any = None) -> Any:
+        """Submit a request to a batcher and wait for it, up to request_timeout.
+        
+        Raises:
+            RequestError: 503 if the batcher has stopped or does not answer in time
+        """
+        if not batcher.alive:
+            raise RequestError(503, f"Parser '{batcher.parser.format_name}' is not running")
+        try:
+            return batcher.submit(kind, payload).result(timeout=self.request_timeout)
+        except FutureTimeoutError:
+            raise RequestError(503, f"Parser '{batcher.parser.format_name}' did not answer "
+                                    f"within {self.request_timeout:g} seconds")
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Get server, batching and parser counters.
+        
+        Returns:
+            Dictionary with server counters, and batch and parser statistics
+            for each parser; parser statistics are left out for a parser
+            whose batching thread has stopped
+        """
+        with self._lock:
+            metrics = dict(self.stats)
+        metrics['uptime_seconds'] = time.time() - self.started
+        metrics['parsers'] = {}
+        for name, batcher in self.batchers.items():
+            # Only the batching thread may touch the parser
+            parser_stats = self._run(batcher, "stats") if batcher.alive else {}
+            parser_stats['alive'] = batcher.alive
+            batches = batcher.stats['batches']
+            parser_stats.update(batcher.stats)
+            parser_stats['mean_batch_size'] = batcher.stats['requests'] / batches if batches else 0.0
+            metrics['parsers'][name] = parser_stats
+        return metrics
+    
+    def close(self):
+        """Stop every batching thread."""
+        for batcher in self.batchers.values():
+            batcher.close()
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Passes HTTP requests to the CitationServer of the listening server."""
+    
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; don't let Nagle hold the body back
+    disable_nagle_algorithm = True
+    
+    def do_GET(self):
+        self._respond(b"")
+    
+    def do_POST(self):
+        # A body that is not read cannot be skipped either, so errors close the connection
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send(400, {"error": "Invalid Content-Length"})
+            self.close_connection = True
+            return
+        if length > MAX_BODY:
+            self._send(413, {"error": "Request body too large"})
+            self.close_connection = True
+            return
+        self._respond(self.rfile.read(length))
+    
+    def _respond(self, body: bytes):
+        self._send(*self.server.app.handle(self.command, self.path, body))
+    
+    def _send(self, status: int, response: Dict[str, Any]):
+        data = json.dumps(response).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def address_string(self) -> str:
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else "unix"
+    
+    def log_message(self, format: str, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+class _UnixRequestHandler(_RequestHandler):
+    """Request handler for Unix domain sockets, which have no Nagle algorithm to disable."""
+    
+    disable_nagle_algorithm = False
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a Unix domain socket, one thread per connection."""
+    
+    daemon_threads = True
+
+def make_server(app: CitationServer, host: str = "127.0.0.1", port: int = 8765,
+                unix_socket: Optional[str] = None) -> socketserver.BaseServer:
+    """Create a threaded HTTP server for a CitationServer.
+    
+    Args:
+        app: CitationServer that handles the requests
+        host: Address to listen on (default: local connections only)
+        port: TCP port to listen on (0 picks a free port)
+        unix_socket: Path of a Unix domain socket to listen on instead of TCP
+        
+    Returns:
+        Server ready for serve_forever(); its app attribute is the CitationServer
+    """
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        server = _UnixHTTPServer(unix_socket, _UnixRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), _RequestHandler)
+        server.daemon_threads = True
+    server.app = app
+    return server
+
+def main():
+    """Run the parse server from the command line."""
+    parser = argparse.ArgumentParser(description="Citation Parser Module - Parse Server")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on (default: 8765)")
+    parser.add_argument("--socket", help="Listen on this Unix domain socket instead of TCP")
+    parser.add_argument("--parsers", default="apa,mla,auto",
+                        help="Comma-separated parsers to keep warm (default: apa,mla,auto)")
+    parser.add_argument("--max-batch", type=int, default=64, help="Most requests per batch (default: 64)")
+    parser.add_argument("--max-wait-ms", type=float, default=0.0,
+                        help="Milliseconds a batch waits for more requests (default: 0, batch only "
+                             "requests that queued up while the last batch ran)")
+    parser.add_argument("-j", "--workers", type=int,
+                        help="Worker processes per parser for batches of citations (default: none)")
+    parser.add_argument("--request-timeout", type=float, default=30.0,
+                        help="Seconds a request waits for its parser before a 503 (default: 30)")
+    args = parser.parse_args()
+    
+    if args.socket and not hasattr(socket, "AF_UNIX"):
+        parser.error("Unix domain sockets are not available on this platform")
+    logging.basicConfig(level=logging.INFO)
+    app = CitationServer(args.parsers.split(","), args.max_batch, args.max_wait_ms / 1000, args.workers,
+                         args.request_timeout)
+    server = make_server(app, args.host, args.port, args.socket)
+    logger.info(f"Serving {', '.join(sorted(app.batchers))} parsers on "
+                f"{args.socket or '%s:%d' % server.server_address[:2]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        app.close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+if __name__ == "__main__":
+    main()
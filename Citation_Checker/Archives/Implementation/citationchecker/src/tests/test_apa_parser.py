@@ -1,7 +1,9 @@
+import io
 import json
 import os
 import pytest
 from src.parsers.apa_parser import APACitationParser
+from src.models.source_buffer import SourceBuffer
 
 # Load test data
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -100,4 +102,54 @@ class TestAPAParser:
         
         # Incomplete citation
         incomplete = self.parser.parse("Smith, J. (2020).")
-        assert incomplete is None or incomplete.confidence_score < 0.5, "Incomplete citation should have low confidence"
\ No newline at end of file
+        assert incomplete is None or incomplete.confidence_score < 0.5, "Incomplete citation should have low confidence"
+    
+    def test_parse_many_preserves_order(self):
+        """Test that batch parsing matches parse() in input order, serially and in a pool."""
+        texts = [c["text"] for c in test_data["citations"]] + ["This is not a citation"]
+        expected = [self.parser.parse(text) for text in texts]
+        
+        serial = self.parser.parse_many(texts)
+        assert [c and c.to_dict() for c in serial] == [c and c.to_dict() for c in expected]
+        
+        pooled = self.parser.parse_many(texts, workers=2, chunksize=2)
+        assert [c and c.to_dict() for c in pooled] == [c and c.to_dict() for c in expected]
+        assert pooled[-1] is None, "Non-citation text should stay None in its slot"
+    
+    def test_parse_many_reuses_pool(self):
+        """Test that a started pool is reused across parse_many calls."""
+        texts = [c["text"] for c in test_data["citations"]]
+        with APACitationParser() as parser:
+            parser.start_pool(workers=2)
+            pool = parser._pool
+            first = parser.parse_many(texts)
+            second = parser.parse_many(texts[::-1])
+            assert parser._pool is pool, "Pool should be reused between calls"
+        assert parser._pool is None, "Pool should be closed on context exit"
+        assert [c.title for c in first] == [c.title for c in second[::-1]]
+    
+    def test_iter_citations_streams_file(self):
+        """Test that streaming from text or a file finds the same citations as extract_citations."""
+        text = test_data["mixed_text"]
+        expected = [c.to_dict() for c in self.parser.extract_citations(text)]
+        
+        assert [c.to_dict() for c in self.parser.iter_citations(text)] == expected
+        assert [c.to_dict() for c in self.parser.iter_citations(io.StringIO(text))] == expected
+        
+        # Citations are yielded lazily, before the rest of the text is read
+        citations = self.parser.iter_citations(io.StringIO(text))
+        assert next(citations).year == expected[0]["year"]
+    
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_buffer_citations_point_into_file(self, tmp_path, newline):
+        """Test that memory-mapped parsing matches text parsing but keeps only offsets."""
+        text = test_data["mixed_text"]
+        path = tmp_path / "paper.txt"
+        path.write_bytes(text.replace("\n", newline).encode("utf-8"))
+        expected = [c.to_dict() for c in self.parser.extract_citations(text)]
+        
+        with SourceBuffer(str(path)) as source:
+            citations = list(self.parser.iter_buffer_citations(source))
+            assert [c.to_dict() for c in citations] == expected
+            assert all(c._citation_text == "" for c in citations), "Text should not be copied"
+            assert citations[0].citation_text in text
\ No newline at end of file
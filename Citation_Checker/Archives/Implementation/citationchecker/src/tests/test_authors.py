@@ -0,0 +1,71 @@
+import pytest
+from src.parsers.authors import AuthorTokenizer
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.mla_parser import MLACitationParser
+
+class TestAuthorTokenizer:
+    """Test suite for the shared author list tokenizer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.apa = AuthorTokenizer("apa")
+        self.mla = AuthorTokenizer("mla")
+    
+    @pytest.mark.parametrize("authors,expected", [
+        ("Smith, J.", ["Smith, J."]),
+        ("Smith, J. D., & Johnson, M.", ["Smith, J. D.", "Johnson, M."]),
+        ("Luo, M., Li, C. C., Molina, D., Andersen, J. P., & Paget, M.",
+         ["Luo, M.", "Li, C. C.", "Molina, D.", "Andersen, J. P.", "Paget, M."]),
+        ("Smith, J., and Jones, K.", ["Smith, J.", "Jones, K."]),
+        ("Smith, J., Jones, K., et al.", ["Smith, J.", "Jones, K."]),
+        ("American Society for Testing and Materials", ["American Society for Testing and Materials"])
+    ])
+    def test_apa_lists(self, authors, expected):
+        """Test splitting APA author lists."""
+        assert self.apa.split(authors) == expected
+    
+    @pytest.mark.parametrize("authors,expected", [
+        ("Smith, John", ["Smith, John"]),
+        ("Johnson, Mary, and David Brown", ["Johnson, Mary", "Brown, David"]),
+        ("Garcia, Patricia, et al", ["Garcia, Patricia"]),
+        ("Smith, John, Mary Jo Lee, and Bob Ray", ["Smith, John", "Lee, Mary Jo", "Ray, Bob"]),
+        ("Department of Health and Human Services", ["Department of Health and Human Services"])
+    ])
+    def test_mla_lists(self, authors, expected):
+        """Test splitting MLA author lists, turning later authors round."""
+        assert self.mla.split(authors) == expected
+    
+    def test_names_are_cached_and_shared(self):
+        """Test that a repeated name is normalized once and returned as the same object."""
+        first = self.apa.split("Smith, J., & Lee, K.")
+        second = self.apa.split("Lee, K., & Smith, J.")
+        assert first[0] is second[1]
+        stats = self.apa.get_stats()
+        assert stats['author_cache_misses'] == 2
+        assert stats['author_cache_hits'] == 2
+    
+    def test_cache_is_bounded(self):
+        """Test that the least recently used names are evicted past the cache size."""
+        tokenizer = AuthorTokenizer("apa", cache_size=2)
+        tokenizer.split("A, B., B, C., & C, D.")
+        stats = tokenizer.get_stats()
+        assert stats['author_cache_size'] == 2
+        assert stats['author_cache_evictions'] == 1
+    
+    def test_unknown_style(self):
+        """Test that an unsupported style is rejected."""
+        with pytest.raises(ValueError):
+            AuthorTokenizer("chicago")
+    
+    def test_parsers_report_cache_stats(self):
+        """Test that parsers use the tokenizer and include its counters in their stats."""
+        parser = MLACitationParser(memo_size=0)
+        citation = parser.parse(
+            'Johnson, Mary, and David Brown. "Citation Analysis in the Digital Age." '
+            'Academic Writing Quarterly, vol. 12, no. 4, 2021, pp. 45-67.'
+        )
+        assert citation.authors == ["Johnson, Mary", "Brown, David"]
+        assert parser.get_stats()['author_cache_misses'] == 2
+        parser.reset_stats()
+        assert parser.get_stats()['author_cache_misses'] == 0
+        assert APACitationParser().author_tokenizer.style == "apa"
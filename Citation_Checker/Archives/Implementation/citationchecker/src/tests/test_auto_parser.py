@@ -0,0 +1,56 @@
+import json
+import os
+import pytest
+from src.parsers.auto_parser import AutoCitationParser
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.mla_parser import MLACitationParser
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(current_dir, "test_data", "apa_citations.json"), 'r') as f:
+    apa_data = json.load(f)
+with open(os.path.join(current_dir, "test_data", "mla_citations.json"), 'r') as f:
+    mla_data = json.load(f)
+
+class TestAutoParser:
+    """Test suite for the format-detecting parser."""
+    
+    def setup_method(self):
+        """Set up test environment before each test method."""
+        self.parser = AutoCitationParser()
+    
+    @pytest.mark.parametrize("text", [c["text"] for c in apa_data["citations"]])
+    def test_classify_apa(self, text):
+        """Test that APA fixtures are routed to the APA parser."""
+        assert self.parser.classify(text) == "apa"
+    
+    @pytest.mark.parametrize("text", [c["text"] for c in mla_data["citations"]])
+    def test_classify_mla(self, text):
+        """Test that MLA fixtures are routed to the MLA parser."""
+        assert self.parser.classify(text) == "mla"
+    
+    def test_parse_matches_format_parser(self):
+        """Test that a routed parse is identical to using the right parser directly."""
+        apa_text = apa_data["citations"][0]["text"]
+        mla_text = mla_data["citations"][0]["text"]
+        
+        assert self.parser.parse(apa_text).to_dict() == APACitationParser().parse(apa_text).to_dict()
+        assert self.parser.parse(mla_text).to_dict() == MLACitationParser().parse(mla_text).to_dict()
+    
+    def test_mixed_bibliography_single_pass(self):
+        """Test that a mixed reference list is parsed once per entry, by one parser each."""
+        apa_texts = [c["text"] for c in apa_data["citations"][:2]]
+        mla_texts = [c["text"] for c in mla_data["citations"][:2]]
+        text = "References\n\n" + "\n\n".join([apa_texts[0], mla_texts[0], apa_texts[1], mla_texts[1]])
+        
+        citations = self.parser.extract_citations(text)
+        
+        assert [c.citation_format for c in citations] == ["apa", "mla", "apa", "mla"]
+        stats = self.parser.get_stats()
+        assert stats["routed_apa"] == 2
+        assert stats["routed_mla"] == 2
+    
+    def test_unknown_default_format(self):
+        """Test that an unsupported default format is rejected."""
+        with pytest.raises(ValueError):
+            AutoCitationParser(default_format="chicago")
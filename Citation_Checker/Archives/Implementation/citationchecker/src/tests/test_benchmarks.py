@@ -0,0 +1,57 @@
+import copy
+import json
+import pytest
+from src.benchmarks.corpus import MUTATIONS, iter_corpus, load_fixtures
+from src.benchmarks.runner import compare_results, percentile, run_benchmarks
+
+class TestBenchmarks:
+    """Test suite for the parser benchmark suite."""
+    
+    def test_corpus_is_reproducible(self):
+        """Test that the same seed gives the same corpus, built from the fixtures."""
+        first = list(iter_corpus(200, "mla", seed=3))
+        assert first == list(iter_corpus(200, "mla", seed=3))
+        assert first != list(iter_corpus(200, "mla", seed=4))
+        fixtures = set(load_fixtures("mla"))
+        assert all(text in fixtures for mutation, text in first if mutation == "none")
+        assert {mutation for mutation, _ in first} == set(MUTATIONS) | {"none"}
+    
+    def test_mutation_selection(self):
+        """Test that only the requested mutations are applied, at the requested rate."""
+        corpus = list(iter_corpus(100, "apa", mutation_rate=1.0, mutations=["long_authors"]))
+        assert {mutation for mutation, _ in corpus} == {"long_authors"}
+        assert all(text.count("&") == 1 for _, text in corpus)
+        with pytest.raises(ValueError):
+            list(iter_corpus(1, "apa", mutations=["shuffle"]))
+    
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = list(range(1, 101))
+        assert percentile(values, 0.5) == 50
+        assert percentile(values, 0.99) == 99
+        assert percentile([7], 0.99) == 7
+        assert percentile([], 0.5) is None
+    
+    def test_results_are_json(self):
+        """Test that a small run reports every measure and serializes to JSON."""
+        results = run_benchmarks(size=40, parsers=["apa"], entry_points=["parse", "iter_citations"])
+        assert json.loads(json.dumps(results)) == results
+        assert sum(results["corpora"]["apa"].values()) == 40
+        assert [r["entry_point"] for r in results["results"]] == ["parse", "iter_citations"]
+        for result in results["results"]:
+            assert result["entries_per_second"] > 0
+            assert result["latency_p50_ms"] <= result["latency_p99_ms"]
+            assert result["peak_memory_bytes"] > 0
+            assert 0.0 <= result["fallback_rate"] <= 1.0
+    
+    def test_compare_results(self):
+        """Test that slower throughput and higher memory are reported as regressions."""
+        baseline = {"results": [{
+            "parser": "apa", "entry_point": "parse",
+            "entries_per_second": 1000.0, "peak_memory_bytes": 1000
+        }]}
+        current = copy.deepcopy(baseline)
+        assert compare_results(baseline, current) == []
+        current["results"][0]["entries_per_second"] = 500.0
+        current["results"][0]["peak_memory_bytes"] = 2000
+        assert len(compare_results(baseline, current)) == 2
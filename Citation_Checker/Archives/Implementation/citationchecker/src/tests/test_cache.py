@@ -0,0 +1,154 @@
+import json
+import os
+import multiprocessing
+import pytest
+from src.main import parse_file, parse_text
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.cache import ParseCache, hash_text
+from src.parsers.regex_backend import MatchBudget
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(current_dir, "test_data", "apa_citations.json"), 'r') as f:
+    test_data = json.load(f)
+
+MIXED_TEXT = test_data["mixed_text"]
+
+def _write_entries(path, worker):
+    """Write cache entries from a separate process."""
+    parser = APACitationParser()
+    with ParseCache(path) as cache:
+        for i in range(20):
+            cache.put(hash_text(f"{worker}-{i}"), parser, parser.extract_citations(MIXED_TEXT))
+
+class TestParseCache:
+    """Test suite for the persistent parse cache."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test that a cached document gives back the citations it was stored with."""
+        parser = APACitationParser()
+        citations = parser.extract_citations(MIXED_TEXT)
+        
+        with ParseCache(str(tmp_path / "cache.db")) as cache:
+            assert cache.get(hash_text(MIXED_TEXT), parser) is None
+            cache.put(hash_text(MIXED_TEXT), parser, citations)
+            cached = cache.get(hash_text(MIXED_TEXT), parser)
+            
+            assert [c.to_dict() for c in cached] == [c.to_dict() for c in citations]
+            assert cache.get_stats()["hits"] == 1
+            assert cache.get_stats()["misses"] == 1
+    
+    def test_main_consults_cache(self, tmp_path):
+        """Test that parse_text and parse_file reuse results across cache instances."""
+        path = tmp_path / "paper.txt"
+        path.write_text(MIXED_TEXT, encoding="utf-8")
+        db = str(tmp_path / "cache.db")
+        
+        with ParseCache(db) as cache:
+            first_file = parse_file(str(path), cache=cache)
+            first_text = parse_text(MIXED_TEXT, cache=cache)
+        with ParseCache(db) as cache:
+            assert [c.to_dict() for c in parse_file(str(path), cache=cache)] == [c.to_dict() for c in first_file]
+            assert [c.to_dict() for c in parse_text(MIXED_TEXT, cache=cache)] == [c.to_dict() for c in first_text]
+            assert cache.get_stats()["hits"] == 2
+    
+    def test_pattern_change_invalidates(self, tmp_path):
+        """Test that changing a parser's patterns misses and purges old results."""
+        parser = APACitationParser()
+        with ParseCache(str(tmp_path / "cache.db")) as cache:
+            cache.put("doc", parser, parser.extract_citations(MIXED_TEXT))
+            
+            changed = APACitationParser()
+            changed.patterns["title"] = r'\)\.\s+(.+?)\.'
+            assert cache.get("doc", changed) is None
+            
+            cache.put("other", changed, [])
+            assert cache.get("doc", parser) is None, "Results of the old pattern set should be purged"
+            assert cache.get_stats()["entries"] == 1
+    
+    def test_parser_limits_are_part_of_key(self, tmp_path):
+        """Test that results parsed under a smaller length limit are not served to a larger one."""
+        strict = APACitationParser(max_length=50)
+        with ParseCache(str(tmp_path / "cache.db")) as cache:
+            cache.put("doc", strict, strict.extract_citations(MIXED_TEXT))
+            assert cache.get("doc", APACitationParser()) is None
+            assert cache.get("doc", APACitationParser(max_length=50, memo_size=0)) is not None
+    
+    def test_size_cap_evicts_least_recently_used(self, tmp_path):
+        """Test that the cache stays under its size cap by evicting old entries."""
+        parser = APACitationParser()
+        citations = parser.extract_citations(MIXED_TEXT)
+        entry_size = len(json.dumps([c.to_dict() for c in citations]))
+        
+        with ParseCache(str(tmp_path / "cache.db"), max_bytes=entry_size * 2) as cache:
+            cache.put("a", parser, citations)
+            cache.put("b", parser, citations)
+            cache.get("a", parser)
+            cache.put("c", parser, citations)
+            
+            assert cache.get_stats()["evictions"] == 1
+            assert cache.get("b", parser) is None, "Least recently used entry should go first"
+            assert cache.get("a", parser) is not None
+    
+    def test_timed_out_documents_are_not_stored(self, tmp_path, monkeypatch):
+        """Test that a document whose entries ran out of time is parsed again on the next run."""
+        path = tmp_path / "paper.txt"
+        path.write_text(MIXED_TEXT, encoding="utf-8")
+        deadline = MatchBudget.deadline
+        
+        with ParseCache(str(tmp_path / "cache.db")) as cache:
+            monkeypatch.setattr(MatchBudget, "deadline", lambda budget: 0.0)
+            parse_text(MIXED_TEXT, cache=cache)
+            parse_file(str(path), cache=cache)
+            assert cache.get_stats()["writes"] == 0
+            
+            monkeypatch.setattr(MatchBudget, "deadline", deadline)
+            expected = parse_text(MIXED_TEXT)
+            assert [c.to_dict() for c in parse_text(MIXED_TEXT, cache=cache)] == [c.to_dict() for c in expected]
+            assert cache.get_stats()["writes"] == 1
+    
+    def test_size_is_tracked(self, tmp_path):
+        """Test that the stored size follows replaced, purged, evicted and cleared entries."""
+        parser = APACitationParser()
+        citations = parser.extract_citations(MIXED_TEXT)
+        entry_size = len(json.dumps([c.to_dict() for c in citations]))
+        db = str(tmp_path / "cache.db")
+        
+        with ParseCache(db, max_bytes=entry_size * 2) as cache:
+            cache.put("a", parser, citations)
+            cache.put("a", parser, citations)
+            cache.put("b", parser, [])
+            assert cache.get_stats()["bytes"] == entry_size + 2
+            cache.put("c", parser, citations)
+            cache.put("d", parser, citations)
+            assert cache.get_stats()["bytes"] == entry_size * 2
+            
+            changed = APACitationParser()
+            changed.patterns["title"] = r'\)\.\s+(.+?)\.'
+            cache.put("e", changed, [])
+            assert cache.get_stats()["bytes"] == 2
+            cache.clear()
+            assert cache.get_stats()["bytes"] == 0
+        
+        # A cache written before the size was tracked is added up when opened
+        with ParseCache(db) as cache:
+            cache.put("a", parser, citations)
+            cache._conn.execute("DROP TABLE parse_cache_size")
+        with ParseCache(db) as cache:
+            assert cache.get_stats()["bytes"] == entry_size
+    
+    def test_concurrent_writers(self, tmp_path):
+        """Test that several processes can write to the same cache at once."""
+        db = str(tmp_path / "cache.db")
+        ParseCache(db).close()
+        
+        workers = [multiprocessing.Process(target=_write_entries, args=(db, i)) for i in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        assert all(worker.exitcode == 0 for worker in workers)
+        with ParseCache(db) as cache:
+            assert cache.get_stats()["entries"] == 60
+            assert cache.get_stats()["bytes"] == cache._conn.execute("SELECT SUM(size) FROM parse_cache").fetchone()[0]
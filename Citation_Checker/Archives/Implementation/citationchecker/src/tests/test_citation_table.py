@@ -0,0 +1,86 @@
+import copy
+import pickle
+import sys
+import tracemalloc
+import pytest
+from src.models.citation import Citation
+from src.models.citation_table import CitationTable
+
+def make_citations(count):
+    """Build citations with unique titles and repeated sources, types and authors."""
+    return [
+        Citation(authors=[f"Author{i % 50}, A.", "Smith, J."], year=None if i % 7 == 0 else 2000 + i % 20,
+                 title=f"Title {i}", source=f"Journal {i % 10}", pages=f"{i}-{i + 9}",
+                 citation_type="book" if i % 3 == 0 else "article", citation_format="apa",
+                 citation_text=f"Smith, J. ({2000 + i % 20}). Title {i}. Journal {i % 10}.",
+                 confidence_score=(i % 10) / 10)
+        for i in range(count)
+    ]
+
+class TestCitationTable:
+    """Test suite for the column-wise citation table."""
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10")
+    def test_citation_is_slotted(self):
+        """Test that citations have no per-instance dictionary and still pickle."""
+        citation = make_citations(1)[0]
+        assert not hasattr(citation, "__dict__")
+        assert pickle.loads(pickle.dumps(citation)) == citation
+    
+    def test_rows_read_back(self):
+        """Test that every row reads back as the citation that was appended."""
+        citations = make_citations(100)
+        table = CitationTable(citations)
+        assert len(table) == 100
+        assert list(table) == citations
+        assert table.to_citations() == citations
+        assert table[-1].title == "Title 99"
+        assert table[0].year is None
+        assert table[5].to_dict() == citations[5].to_dict()
+        with pytest.raises(IndexError):
+            table[100]
+        with pytest.raises(AttributeError):
+            table[0].editor
+    
+    def test_views_pickle_and_copy(self):
+        """Test that views pickle and deep-copy as Citations and copy as views."""
+        citations = make_citations(3)
+        view = CitationTable(citations)[1]
+        assert pickle.loads(pickle.dumps(view)) == citations[1]
+        assert isinstance(pickle.loads(pickle.dumps(view)), Citation)
+        assert copy.deepcopy(view) == citations[1]
+        shallow = copy.copy(view)
+        assert shallow.table is view.table and shallow.row == view.row
+    
+    def test_filter_where_and_sort(self):
+        """Test that selections are views with the expected rows."""
+        citations = make_citations(100)
+        table = CitationTable(citations)
+        books = table.where(citation_type="book", source="Journal 3")
+        assert books.to_citations() == [c for c in citations if c.citation_type == "book" and c.source == "Journal 3"]
+        assert len(table.where(source="Journal 99")) == 0
+        assert len(table.filter(lambda c: c.confidence_score > 0.5)) == 40
+        
+        ordered = table.sort("year", "title", reverse=True)
+        assert ordered.column("year")[:2] == [2019, 2019]
+        assert ordered.column("year")[-1] is None
+        # Views of views map back to the same base rows
+        assert ordered[:10].where(citation_type="book").to_citations() == [
+            c for c in ordered.to_citations()[:10] if c.citation_type == "book"
+        ]
+        with pytest.raises(ValueError):
+            books.append(citations[0])
+    
+    def test_smaller_than_citations(self):
+        """Test that a table takes well under half the memory of the citations it holds."""
+        tracemalloc.start()
+        try:
+            citations = make_citations(5000)
+            list_size = tracemalloc.get_traced_memory()[0]
+            table = CitationTable(citations)
+            del citations
+            table_size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        assert table_size < list_size / 2
+        assert len(table) == 5000
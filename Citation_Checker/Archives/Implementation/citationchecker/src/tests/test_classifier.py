@@ -0,0 +1,64 @@
+import re
+import pytest
+from src.parsers.classifier import CitationTypeClassifier
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.mla_parser import MLACitationParser
+
+class TestCitationTypeClassifier:
+    """Test suite for the keyword citation type classifier."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.apa = APACitationParser()
+        self.mla = MLACitationParser()
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Smith, J. (2020). Title. Journal of Things, 1(2), 3-4.", "article"),
+        ("Smith, J. (2020). Title. Oxford University Press.", "book"),
+        ("Smith, J. (2020). A chapter. In A. Brown (Ed.), Proceedings.", "book_chapter"),
+        ("Smith, J. (2020). Title. Proceedings of the Symposium.", "conference"),
+        ("Smith, J. (2020). Title [Doctoral dissertation].", "thesis"),
+        ("Smith, J. (2020). Technical Report 12.", "report"),
+        ("Smith, J. (2020). Title. Retrieved from http://example.org", "web"),
+        ("Smith, J. (2020). Title.", "article")
+    ])
+    def test_apa_types(self, text, expected):
+        """Test that APA rules are tried in order."""
+        assert self.apa._determine_citation_type(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ('Smith, John. "Title." Modern Magazine, 2020.', "article"),
+        ('Smith, John. "Title." Edited by Ann Lee, Press, 2020.', "book_chapter"),
+        ('Smith, John. "Title." Site, https://example.org. Accessed 1 May 2021.', "web"),
+        ("Smith, John. The Book. Penguin, 2019.", "book"),
+        ("smith, john. the thesis. univ, 2019.", "thesis")
+    ])
+    def test_mla_types(self, text, expected):
+        """Test that the MLA book shape is only tried after the higher priority keywords."""
+        assert self.mla._determine_citation_type(text) == expected
+
+    def test_overlapping_keywords(self):
+        """Test that a keyword overlapping the end of an earlier one is still found."""
+        assert self.apa._determine_citation_type("Available atechnical") == "report"
+
+    def test_batch_matches_single(self):
+        """Test that classifying a batch gives the same types as one at a time."""
+        texts = [
+            "Smith, J. (2020). Title. Retrieved from http://example.org",
+            "",
+            "Brown, A. Book. Press.",
+            "İstanbul Press",
+            "thesis"
+        ]
+        for parser in (self.apa, self.mla):
+            assert parser.classify_types(texts) == [parser._determine_citation_type(t) for t in texts]
+
+    def test_pattern_and_keyword_rules(self):
+        """Test a custom rule set mixing keywords and an original-case pattern."""
+        classifier = CitationTypeClassifier([
+            ("acronym", re.compile(r'\b[A-Z]{3,}\b')),
+            ("web", ["www."])
+        ], default="other")
+        assert classifier.classify("See WWW.example.org") == "acronym"
+        assert classifier.classify("See www.example.org") == "web"
+        assert classifier.classify_many(["NASA", "none"]) == ["acronym", "other"]
@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+import pytest
+from src.main import main, parse_text
+from src.models.citation import Citation
+from src.output.columnar import (DICTIONARY_COLUMNS, citations_from_batches, iter_record_batches,
+                                 write_arrow, write_parquet)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(current_dir, "test_data", "mla_citations.json"), 'r') as f:
+    test_data = json.load(f)
+
+def make_citations():
+    """Parse the MLA fixture document many times over, plus a citation with missing fields."""
+    citations = parse_text(test_data["mixed_text"], "mla") * 20
+    citations.append(Citation(authors=[], year=None, title="Untitled", source="Another Source"))
+    return citations
+
+class TestColumnar:
+    """Test suite for Arrow and Parquet export."""
+    
+    def test_record_batches(self):
+        """Test batch sizes, the list column and dictionary-encoded columns."""
+        citations = make_citations()
+        batches = list(iter_record_batches(iter(citations), batch_size=8))
+        assert [batch.num_rows for batch in batches[:-1]] == [8] * (len(batches) - 1)
+        assert sum(batch.num_rows for batch in batches) == len(citations)
+        
+        schema = batches[0].schema
+        assert schema.field("authors").type == pa.list_(pa.string())
+        for name in DICTIONARY_COLUMNS:
+            assert pa.types.is_dictionary(schema.field(name).type)
+        # Dictionaries only grow, so the last batch holds every source
+        assert "Another Source" in batches[-1].column("source").dictionary.to_pylist()
+        assert list(citations_from_batches(batches)) == citations
+    
+    @pytest.mark.parametrize("writer,reader", [
+        (write_parquet, lambda path: pq.read_table(path)),
+        (write_arrow, lambda path: pa.ipc.open_file(path).read_all())
+    ])
+    def test_files_round_trip(self, tmp_path, writer, reader):
+        """Test that citations written across several batches read back unchanged."""
+        citations = make_citations()
+        path = str(tmp_path / "citations")
+        assert writer(iter(citations), path, batch_size=16) == len(citations)
+        table = reader(path)
+        assert pa.types.is_dictionary(table.schema.field("citation_type").type)
+        assert list(citations_from_batches([table])) == citations
+    
+    def test_command_line(self, tmp_path, monkeypatch):
+        """Test that -o parquet writes the parsed file and needs an output file."""
+        source = tmp_path / "paper.txt"
+        source.write_text(test_data["mixed_text"], encoding="utf-8")
+        output = tmp_path / "citations.parquet"
+        monkeypatch.setattr(sys, "argv", ["main", "-f", str(source), "-p", "mla", "-o", "parquet",
+                                          "--output-file", str(output)])
+        main()
+        assert pq.read_table(output).num_rows == len(parse_text(test_data["mixed_text"], "mla"))
+        
+        monkeypatch.setattr(sys, "argv", ["main", "-f", str(source), "-o", "parquet"])
+        with pytest.raises(SystemExit):
+            main()
@@ -0,0 +1,134 @@
+import random
+import pytest
+from src.dedup import DedupIndex, author_surname, citation_shingles, normalize_text
+from src.models.citation import Citation
+from src.models.citation_table import CitationTable
+
+TRIAL = Citation(authors=["Smith, J. A.", "Jones, B."], year=2020, source="Journal of Clinical Psychology",
+                 title="A randomized trial of cognitive behavioural therapy for insomnia in older adults")
+
+# The same work: initials dropped, typo, journal abbreviated, MLA author form
+VARIANTS = [
+    Citation(authors=["Smith, J.", "Jones, B."], year=2020, source="J. Clin. Psychol.",
+             title="A randomized trial of cognitive behavioural therapy for insomnia in older adluts"),
+    Citation(authors=["Smith, John A.", "et al."], year=2020, source="Journal of Clinical Psychology",
+             title="A Randomized Trial of Cognitive Behavioural Therapy for Insomnia in Older Adults.")
+]
+
+# Similar titles of other works
+OTHERS = [
+    Citation(authors=["Lee, H."], year=2020, source="Journal of Clinical Psychology",
+             title="A randomized trial of cognitive behavioural therapy for insomnia in young adults"),
+    Citation(authors=["Smith, J. A."], year=2020, source="Journal of Clinical Psychology",
+             title="Cognitive behavioural therapy for depression in older adults")
+]
+
+def synthetic_works(count, seed=0):
+    """Build citations of distinct works with random titles and authors."""
+    rng = random.Random(seed)
+    word = lambda: "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9)))
+    return [Citation(authors=[f"{word().capitalize()}, A."], year=rng.randint(1990, 2024),
+                     title=" ".join(word() for _ in range(8)), source="Journal")
+            for _ in range(count)]
+
+class TestShingles:
+    """Test suite for citation normalization and shingling."""
+    
+    def test_normalization(self):
+        """Test that case, accents, punctuation and author forms normalize alike."""
+        assert normalize_text("  Café-Society: A  Review ") == "cafe society a review"
+        assert author_surname("Smith, J. A.") == author_surname("J. A. Smith") == "smith"
+        assert author_surname("van der Berg, Anna") == "van der berg"
+    
+    def test_shingles(self):
+        """Test that the title, first authors and year are shingled, and "et al." is not."""
+        shingles = citation_shingles(VARIANTS[1])
+        assert {"rand", "author:smith", "year:2020"} <= shingles
+        assert not any("et al" in shingle for shingle in shingles)
+        assert citation_shingles(Citation(authors=[], year=None, title="", source="")) == set()
+
+class TestDedupIndex:
+    """Test suite for the near-duplicate citation index."""
+    
+    def test_clusters_variants(self):
+        """Test that variants of a work cluster together and similar works do not."""
+        index = DedupIndex()
+        index.extend([TRIAL, OTHERS[0], VARIANTS[0], OTHERS[1], VARIANTS[1]],
+                     keys=["a.txt:1", "b.txt:1", "b.txt:2", "c.txt:1", "c.txt:2"])
+        assert index.clusters() == [["a.txt:1", "b.txt:2", "c.txt:2"]]
+        assert len(index.clusters(min_size=1)) == 3
+        assert index.cluster_ids() == [0, 1, 0, 3, 0]
+        assert index.stats['merges'] == 2
+    
+    def test_query(self):
+        """Test that query() finds matches without adding the citation."""
+        index = DedupIndex()
+        index.extend(CitationTable([TRIAL] + OTHERS))
+        matches = index.query(VARIANTS[0])
+        assert [key for key, _ in matches] == [0]
+        assert 0.7 <= matches[0][1] < 1.0
+        assert index.query(Citation(authors=[], year=None, title="", source="")) == []
+        assert len(index) == 3
+    
+    def test_year_gap(self):
+        """Test that the same title years apart is kept apart unless the gap is allowed."""
+        reprint = Citation(authors=TRIAL.authors, year=2024, title=TRIAL.title, source="")
+        online_first = Citation(authors=TRIAL.authors, year=2019, title=TRIAL.title, source="")
+        index = DedupIndex()
+        index.add(TRIAL)
+        assert index.query(reprint) == []
+        assert index.query(online_first)[0][0] == 0
+        index = DedupIndex(max_year_gap=None)
+        index.add(TRIAL)
+        assert index.query(reprint)[0][0] == 0
+    
+    def test_duplicated_entries(self):
+        """Test that repeats left out of the buckets are still matched and reported."""
+        index = DedupIndex()
+        index.extend([TRIAL, TRIAL, TRIAL, VARIANTS[0]])
+        assert [key for key, _ in index.query(TRIAL)] == [0, 1, 2, 3]
+        
+        # The later citation only matches the undated one, which shares its
+        # bands with the first citation and so is not in them itself
+        undated = Citation(authors=TRIAL.authors, year=None, title=TRIAL.title, source="")
+        later = Citation(authors=TRIAL.authors, year=2022, title=TRIAL.title, source="")
+        index = DedupIndex()
+        index.extend([TRIAL, undated, later])
+        assert index.clusters() == [[0, 1, 2]]
+    
+    def test_repeated_citations_stay_cheap(self):
+        """Test that candidates stay few when works are cited many times."""
+        works = synthetic_works(300)
+        index = DedupIndex()
+        index.extend(works * 10)
+        assert len(index.clusters()) == 300
+        assert all(len(cluster) == 10 for cluster in index.clusters())
+        # One candidate per repeat, not one per earlier copy
+        assert index.stats['candidates'] < 300 * 9 * 1.2
+    
+    def test_save_load_and_continue(self, tmp_path):
+        """Test that a loaded index clusters new citations as the original would."""
+        works = synthetic_works(200, seed=1)
+        path = str(tmp_path / "citations.idx")
+        index = DedupIndex(threshold=0.65)
+        index.extend([TRIAL, OTHERS[0]] + works)
+        index.save(path)
+        
+        loaded = DedupIndex.load(path)
+        assert loaded.threshold == 0.65 and len(loaded) == len(index)
+        for citation in VARIANTS + works[:5]:
+            loaded.add(citation)
+            index.add(citation)
+        assert loaded.clusters() == index.clusters()
+        assert loaded.clusters()[0] == [0, 202, 203]
+        
+        (tmp_path / "other").write_bytes(b"not an index")
+        with pytest.raises(ValueError):
+            DedupIndex.load(str(tmp_path / "other"))
+    
+    def test_invalid_options(self):
+        """Test that bands must divide the signature and the threshold be a similarity."""
+        with pytest.raises(ValueError):
+            DedupIndex(num_perm=128, bands=30)
+        with pytest.raises(ValueError):
+            DedupIndex(threshold=0)
@@ -0,0 +1,53 @@
+import pytest
+import src.crawlers
+from src.benchmarks.imports import IMPORT_BUDGETS, check_budgets, measure_import
+from src.main import get_parser
+from src.parsers.apa_parser import APACitationParser
+from src.registry import Registry, parsers
+
+class TestRegistry:
+    """Test suite for the lazy parser and crawler registry."""
+    
+    def test_parsers_by_name(self):
+        """Test that parsers are created by name, in any case."""
+        assert parsers.names() == ["apa", "auto", "mla"]
+        assert isinstance(parsers.create("APA"), APACitationParser)
+        assert parsers.is_loaded("apa")
+        assert isinstance(get_parser("apa"), APACitationParser)
+        assert get_parser("chicago") is None
+        with pytest.raises(ValueError):
+            parsers.load("chicago")
+    
+    def test_imports_on_first_use(self):
+        """Test that a registered module is imported only when its class is needed."""
+        registry = Registry("thing", {"odict": "collections:OrderedDict"})
+        registry.register("list", list)
+        assert "ODICT" in registry and "set" not in registry
+        assert not registry.is_loaded("odict")
+        assert registry.create("odict", a=1) == {"a": 1}
+        assert registry.is_loaded("odict") and registry.load("list") is list
+    
+    def test_crawler_package_exports(self):
+        """Test that the crawler package still exports its classes."""
+        from src.crawlers.web_crawler import WebCrawler
+        assert src.crawlers.WebCrawler is WebCrawler
+        assert "CrawlerManager" in dir(src.crawlers)
+        with pytest.raises(AttributeError):
+            src.crawlers.MissingCrawler
+
+class TestImportBudgets:
+    """Test suite for cold-start import costs."""
+    
+    def test_no_forbidden_imports(self):
+        """Test that each budgeted module imports without its heavy dependencies."""
+        results = [measure_import(module, runs=1) for module in IMPORT_BUDGETS]
+        # Import times depend on the machine; python -m src.benchmarks.imports --check enforces them
+        assert check_budgets(results, budgets={}) == []
+        assert "requests" not in results[list(IMPORT_BUDGETS).index("src.crawlers")]["modules"]
+    
+    def test_reports_problems(self):
+        """Test that slow imports and forbidden modules are reported."""
+        result = {"module": "src.main", "seconds": 10.0, "modules": ["requests.adapters", "src.main"]}
+        problems = check_budgets([result])
+        assert len(problems) == 2
+        assert "requests.adapters" in problems[1]
@@ -0,0 +1,114 @@
+import json
+import os
+import pytest
+from src.main import reparse_file
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.incremental import IncrementalParser
+from src.parsers.regex_backend import MatchBudget
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(current_dir, "test_data", "apa_citations.json"), 'r') as f:
+    test_data = json.load(f)
+
+ENTRIES = [c["text"] for c in test_data["citations"]]
+
+def document(entries):
+    """Build a document with a reference list of the given entries."""
+    return "Some introduction.\n\nReferences\n\n" + "\n\n".join(entries)
+
+class TestIncrementalParser:
+    """Test suite for incremental re-parsing."""
+    
+    def setup_method(self):
+        """Set up test environment before each test method."""
+        self.parser = APACitationParser(memo_size=0)
+        self.incremental = IncrementalParser(self.parser)
+    
+    def test_first_version_is_all_added(self):
+        """Test that a new document parses every entry and reports it as added."""
+        result = self.incremental.reparse(document(ENTRIES[:3]))
+        
+        assert result.parsed == 3
+        assert result.reused == 0
+        assert [c.to_dict() for c in result.citations] == [c.to_dict() for c in self.parser.extract_citations(document(ENTRIES[:3]))]
+        assert len(result.diff.added) == 3
+    
+    def test_only_new_entries_are_parsed(self):
+        """Test that a revision parses only the entries it changed, and diffs them."""
+        self.incremental.reparse(document(ENTRIES[:4]))
+        edited = ENTRIES[1].replace("(2019)", "(2018)")
+        revision = [ENTRIES[0], edited, ENTRIES[3], ENTRIES[4]]
+        
+        result = self.incremental.reparse(document(revision))
+        
+        assert result.parsed == 2, "Only the edited and the new entry should be parsed"
+        assert result.reused == 2
+        assert [c.to_dict() for c in result.citations] == [c.to_dict() for c in self.parser.extract_citations(document(revision))]
+        
+        assert [(old.year, new.year) for old, new in result.diff.changed] == [(2019, 2018)]
+        assert [c.citation_text for c in result.diff.removed] == [ENTRIES[2]]
+        assert [c.citation_text for c in result.diff.added] == [ENTRIES[4]]
+    
+    def test_unchanged_revision(self):
+        """Test that re-submitting the same document parses nothing and has no diff."""
+        self.incremental.reparse(document(ENTRIES))
+        result = self.incremental.reparse(document(ENTRIES))
+        
+        assert result.parsed == 0
+        assert not result.diff
+    
+    def test_documents_are_independent(self, tmp_path):
+        """Test that files are tracked separately by path."""
+        first = tmp_path / "a.txt"
+        second = tmp_path / "b.txt"
+        first.write_text(document(ENTRIES[:2]), encoding="utf-8")
+        second.write_text(document(ENTRIES[2:4]), encoding="utf-8")
+        
+        reparse_file(str(first), self.incremental)
+        result = reparse_file(str(second), self.incremental)
+        
+        assert len(result.diff.added) == 2
+        assert self.incremental.get_stats()["documents"] == 2
+    
+    def test_timed_out_entries_are_parsed_again(self, monkeypatch):
+        """Test that an entry that ran out of time is not reused in the next version."""
+        deadline = MatchBudget.deadline
+        monkeypatch.setattr(MatchBudget, "deadline", lambda budget: 0.0)
+        self.incremental.reparse(document(ENTRIES[:3]))
+        
+        monkeypatch.setattr(MatchBudget, "deadline", deadline)
+        result = self.incremental.reparse(document(ENTRIES[:3]))
+        assert result.parsed == 3
+        assert len(result.diff.added) == 3
+        assert self.incremental.reparse(document(ENTRIES[:3])).parsed == 0
+    
+    def test_documents_are_capped(self):
+        """Test that the least recently re-parsed document is dropped first, or when forgotten."""
+        incremental = IncrementalParser(self.parser, max_documents=2)
+        incremental.reparse(document(ENTRIES[:2]), "a")
+        incremental.reparse(document(ENTRIES[2:4]), "b")
+        incremental.reparse(document(ENTRIES[:2]), "a")
+        incremental.reparse(document(ENTRIES[4:6]), "c")
+        
+        assert incremental.get_stats()["documents"] == 2
+        assert incremental.get_stats()["documents_evicted"] == 1
+        assert incremental.reparse(document(ENTRIES[:2]), "a").parsed == 0
+        assert incremental.reparse(document(ENTRIES[2:4]), "b").parsed == 2
+        
+        incremental.forget("b")
+        incremental.forget("missing")
+        assert incremental.reparse(document(ENTRIES[2:4]), "b").parsed == 2
+    
+    def test_entries_go_through_parse_candidate(self):
+        """Test that entries are parsed through the parser's public candidate hook."""
+        parsed = []
+        
+        class RecordingParser(APACitationParser):
+            def parse_candidate(self, potential):
+                parsed.append(potential)
+                return super().parse_candidate(potential)
+        
+        incremental = IncrementalParser(RecordingParser(memo_size=0))
+        incremental.reparse(document(ENTRIES[:2]))
+        assert parsed == ENTRIES[:2]
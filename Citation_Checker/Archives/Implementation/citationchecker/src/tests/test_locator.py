@@ -0,0 +1,69 @@
+import io
+import pytest
+from src.parsers.locator import locate_reference_sections
+from src.parsers.streaming import iter_reference_entries, iter_reference_spans
+
+# Table of contents mentioning "References", then one reference list per chapter
+EDITED_VOLUME = (
+    "Contents\n\n"
+    "1. Introduction\n"
+    "References\n\n"
+    "Chapter 1\n\n"
+    "We return to the references in 2010 later.\n\n"
+    "References\n\n"
+    "Smith, J. (2020). First title. Journal, 1(2), 3-4.\n"
+    "Brown, A. (2019). Second title. Publisher.\n\n"
+    "Chapter 2\n\n"
+    "More discussion.\n\n"
+    "Works Cited:\n"
+    "Lee, Kim. \"Third Title.\" Press, 2018.\n"
+)
+
+class TestLocator:
+    """Test suite for the reference section locator."""
+    
+    def test_finds_one_section_per_chapter(self):
+        """Test that each chapter's list is found and the contents line is skipped."""
+        sections = locate_reference_sections(EDITED_VOLUME)
+        assert [EDITED_VOLUME[start:end] for start, end in sections] == [
+            "Smith, J. (2020). First title. Journal, 1(2), 3-4.\n"
+            "Brown, A. (2019). Second title. Publisher.",
+            "Lee, Kim. \"Third Title.\" Press, 2018."
+        ]
+    
+    def test_numbered_heading(self):
+        """Test that a numbered heading is recognised."""
+        text = "1. Introduction\n\nBody.\n\n7. Bibliography\n\nSmith, J. (2020). A title."
+        start, end = locate_reference_sections(text)[0]
+        assert text[start:end] == "Smith, J. (2020). A title."
+    
+    def test_mention_in_prose_is_not_a_heading(self):
+        """Test that the heading word inside a sentence does not start a section."""
+        assert locate_reference_sections("See the References: Smith, J. (2020). A title.") == []
+    
+    def test_heading_without_entries_is_skipped(self):
+        """Test that a heading followed by no dated text is not a section."""
+        assert locate_reference_sections("Body text.\n\nReferences\n\nNone were used.") == []
+    
+    def test_offsets_match_for_files_and_buffers(self):
+        """Test that files give character offsets and UTF-8 buffers byte offsets of the same sections."""
+        text = "Résumé\n\n" + EDITED_VOLUME
+        data = text.encode("utf-8")
+        sections = locate_reference_sections(text)
+        assert locate_reference_sections(io.StringIO(text)) == sections
+        assert [data[start:end].decode("utf-8") for start, end in locate_reference_sections(data)] == [
+            text[start:end] for start, end in sections
+        ]
+    
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+    def test_entries_come_from_every_section(self, chunk_size):
+        """Test that the splitter yields entries from all sections and nothing from the body."""
+        expected = [
+            "Smith, J. (2020). First title. Journal, 1(2), 3-4.",
+            "Brown, A. (2019). Second title. Publisher.",
+            "Lee, Kim. \"Third Title.\" Press, 2018."
+        ]
+        assert list(iter_reference_entries(EDITED_VOLUME, chunk_size=chunk_size)) == expected
+        assert list(iter_reference_entries(io.StringIO(EDITED_VOLUME), chunk_size=chunk_size)) == expected
+        data = EDITED_VOLUME.encode("utf-8")
+        assert [data[start:end].decode("utf-8") for start, end in iter_reference_spans(data)] == expected
@@ -0,0 +1,125 @@
+import json
+import os
+import sys
+import pytest
+import src.main
+from src.main import expand_inputs, iter_file_citations, main, open_file_citations, parse_file, parse_files
+from src.models.citation import SpanCitation
+from src.models.source_buffer import SourceBuffer
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(current_dir, "test_data", "apa_citations.json"), 'r') as f:
+    test_data = json.load(f)
+
+MIXED_TEXT = test_data["mixed_text"]
+
+def make_tree(root):
+    """Write a few documents, one in a subdirectory, plus a file that is not UTF-8."""
+    (root / "sub").mkdir()
+    paths = [root / "a.txt", root / "b.txt", root / "sub" / "c.txt"]
+    for path in paths:
+        path.write_text(MIXED_TEXT, encoding="utf-8")
+    (root / "notes.md").write_text(MIXED_TEXT, encoding="utf-8")
+    (root / "broken.txt").write_bytes(b"\xff\xfe broken")
+    return [str(path) for path in paths]
+
+class TestParseFile:
+    """Test suite for parsing a single file."""
+    
+    def test_zero_copy_closes_buffer(self, tmp_path, monkeypatch):
+        """Test that memory-mapped parsing keeps spans while the map is open and then closes it."""
+        closed = []
+        
+        class TrackedBuffer(SourceBuffer):
+            def close(self):
+                closed.append(self.path)
+                super().close()
+        
+        monkeypatch.setattr(src.main, "SourceBuffer", TrackedBuffer)
+        path = tmp_path / "paper.txt"
+        path.write_text(MIXED_TEXT, encoding="utf-8")
+        expected = parse_file(str(path), "apa")
+        
+        with open_file_citations(str(path), "apa") as citations:
+            assert all(isinstance(citation, SpanCitation) for citation in citations)
+            assert [c.to_dict() for c in citations] == [c.to_dict() for c in expected]
+            assert closed == []
+        assert closed == [str(path)]
+        
+        assert list(iter_file_citations(str(path), "apa", zero_copy=True)) == expected
+        assert len(closed) == 2
+
+class TestMultiFile:
+    """Test suite for parsing many files from the command line."""
+    
+    def test_expand_inputs(self, tmp_path):
+        """Test that directories are searched recursively and globs expanded, without duplicates."""
+        documents = make_tree(tmp_path)
+        found = expand_inputs([str(tmp_path)])
+        assert set(documents) < set(found)
+        assert not any(path.endswith(".md") for path in found)
+        assert expand_inputs([str(tmp_path / "*.md"), str(tmp_path / "a.txt"), documents[0]]) == [
+            str(tmp_path / "notes.md"), documents[0]
+        ]
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_errors_are_isolated(self, tmp_path, workers):
+        """Test that one unreadable file is reported without stopping the others."""
+        documents = make_tree(tmp_path)
+        paths = documents + [str(tmp_path / "broken.txt"), str(tmp_path / "missing.txt")]
+        results = {result.path: result for result in parse_files(paths, "apa", workers=workers)}
+        assert set(results) == set(paths)
+        expected = parse_file(documents[0], "apa")
+        for path in documents:
+            assert results[path].error is None
+            assert results[path].citations == expected
+            assert results[path].stats["prefilter_accepted"] > 0
+        assert "UnicodeDecodeError" in results[str(tmp_path / "broken.txt")].error
+        assert "FileNotFoundError" in results[str(tmp_path / "missing.txt")].error
+    
+    @pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc to count open files")
+    def test_zero_copy_does_not_leak_files(self, tmp_path):
+        """Test that memory-mapping many files leaves no descriptors open."""
+        paths = []
+        for i in range(200):
+            path = tmp_path / f"paper{i}.txt"
+            path.write_text(MIXED_TEXT, encoding="utf-8")
+            paths.append(str(path))
+        expected = parse_file(paths[0], "apa")
+        
+        open_files = len(os.listdir("/proc/self/fd"))
+        results = list(parse_files(paths, "apa", workers=1, zero_copy=True))
+        assert len(os.listdir("/proc/self/fd")) <= open_files
+        assert all(result.error is None and result.citations == expected for result in results)
+    
+    def test_command_line(self, tmp_path, monkeypatch, capsys):
+        """Test that a directory run writes one JSON line per file and exits 1 on a failure."""
+        documents = make_tree(tmp_path)
+        output = tmp_path / "out.jsonl"
+        monkeypatch.setattr(sys, "argv", [
+            "main", "-f", str(tmp_path), "-o", "json", "-j", "1", "--output-file", str(output)
+        ])
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+        assert exit_info.value.code == 1
+        
+        lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert sorted(line["file"] for line in lines) == sorted(documents)
+        assert all(line["count"] == len(line["citations"]) > 0 for line in lines)
+        assert "Parsed 4 files (1 failed)" in capsys.readouterr().err
+    
+    def test_output_dir(self, tmp_path, monkeypatch):
+        """Test that --output-dir mirrors the input tree."""
+        source = tmp_path / "in"
+        source.mkdir()
+        make_tree(source)
+        monkeypatch.setattr(sys, "argv", [
+            "main", "-f", str(source / "**" / "[abc].txt"), "-o", "csv",
+            "-j", "1", "--output-dir", str(tmp_path / "out")
+        ])
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+        assert exit_info.value.code == 0
+        assert (tmp_path / "out" / "a.csv").exists()
+        assert (tmp_path / "out" / "sub" / "c.csv").read_text(encoding="utf-8").startswith("authors,")
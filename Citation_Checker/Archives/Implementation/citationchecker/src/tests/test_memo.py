@@ -0,0 +1,110 @@
+import json
+import os
+import unicodedata
+import pytest
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.memo import normalize_citation_text
+from src.parsers.regex_backend import BudgetExceeded
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(current_dir, "test_data", "apa_citations.json"), 'r') as f:
+    test_data = json.load(f)
+
+CITATION = test_data["citations"][0]["text"]
+
+class TestParseMemo:
+    """Test suite for memoized parsing."""
+    
+    def setup_method(self):
+        """Set up test environment before each test method."""
+        self.parser = APACitationParser(memo_size=2)
+    
+    def test_repeated_citation_is_a_hit(self):
+        """Test that parsing the same citation twice only parses it once."""
+        first = self.parser.parse(CITATION)
+        second = self.parser.parse(CITATION)
+        
+        assert first.to_dict() == second.to_dict()
+        stats = self.parser.get_stats()
+        assert stats["memo_misses"] == 1
+        assert stats["memo_hits"] == 1
+    
+    def test_whitespace_variants_share_entry(self):
+        """Test that line breaks and repeated spaces do not change the key."""
+        variant = CITATION.replace(" ", "\n", 3).replace(". ", ".  ")
+        assert normalize_citation_text(variant) == normalize_citation_text(CITATION)
+        
+        self.parser.parse(CITATION)
+        citation = self.parser.parse(variant)
+        
+        assert self.parser.get_stats()["memo_hits"] == 1
+        assert citation.citation_text == variant.strip(), "Original text should be the caller's"
+    
+    def test_defensive_copies(self):
+        """Test that changing a returned citation does not change later results."""
+        first = self.parser.parse(CITATION)
+        first.authors.append("Mallory, X.")
+        first.title = "Changed"
+        
+        second = self.parser.parse(CITATION)
+        second.authors.clear()
+        
+        third = self.parser.parse(CITATION)
+        assert "Mallory, X." not in third.authors
+        assert third.authors
+        assert third.title != "Changed"
+    
+    def test_eviction(self):
+        """Test that the least recently used entry is evicted at the size limit."""
+        texts = [c["text"] for c in test_data["citations"][:3]]
+        for text in texts:
+            self.parser.parse(text)
+        
+        assert len(self.parser.memo) == 2
+        assert self.parser.get_stats()["memo_evictions"] == 1
+        
+        self.parser.parse(texts[0])
+        assert self.parser.get_stats()["memo_misses"] == 4, "Oldest entry should have been evicted"
+    
+    def test_disabled(self):
+        """Test that memo_size=0 parses every time."""
+        parser = APACitationParser(memo_size=0)
+        parser.parse(CITATION)
+        parser.parse(CITATION)
+        
+        assert len(parser.memo) == 0
+        assert parser.get_stats()["memo_hits"] == 0
+    
+    def test_results_do_not_depend_on_memo(self):
+        """Test that wrapped and decomposed texts parse the same with and without the memo."""
+        texts = [c["text"] for c in test_data["citations"]]
+        texts += [text.replace(" ", "\n  ", 4) for text in texts]
+        texts += [unicodedata.normalize('NFD', text) for text in texts]
+        memoized = APACitationParser()
+        unmemoized = APACitationParser(memo_size=0)
+        for text in texts:
+            first, second = memoized.parse(text), unmemoized.parse(text)
+            assert (first and first.to_dict()) == (second and second.to_dict())
+    
+    def test_time_budget_failures_not_kept(self):
+        """Test that a citation that ran out of time is parsed again next time."""
+        match = self.parser.budget.match
+        
+        def out_of_time(compiled, text, deadline):
+            self.parser.budget.stats['time_budget_hits'] += 1
+            raise BudgetExceeded("Citation candidate exceeded its time budget")
+        
+        self.parser.budget.match = out_of_time
+        assert self.parser.parse(CITATION) is None
+        self.parser.budget.match = match
+        assert self.parser.parse(CITATION) is not None
+        assert self.parser.get_stats()["memo_hits"] == 0
+    
+    def test_options_are_part_of_key(self):
+        """Test that parsers with different budgets do not share results through one memo."""
+        strict = APACitationParser(max_length=20)
+        strict.memo = self.parser.memo
+        assert self.parser.parse(CITATION) is not None
+        assert strict.parse(CITATION) is None
+        assert len(self.parser.memo) == 2
@@ -225,3 +225,25 @@ class TestMLAParser:
         assert parser.format_name == "mla", "Format name should be 'mla'"
         assert hasattr(parser, 'patterns'), "Parser should have patterns attribute"
         assert hasattr(parser, 'mla_patterns'), "Parser should have mla_patterns attribute"
+    
+    def test_pattern_dispatch(self):
+        """Test that only patterns whose features are present are tried, and hits are counted."""
+        parser = MLACitationParser(memo_size=0)
+        text = "Smith, John. The Book Title. Penguin Press, 2019."
+        assert parser._features(text) == {"year_end"}
+        citation = parser.parse(text)
+        assert citation.citation_type == "book"
+        
+        stats = parser.get_stats()
+        assert stats['mla_journal_tried'] == 0
+        assert stats['mla_book_tried'] == 1
+        assert stats['mla_book_hit_rate'] == 1.0
+        assert stats['mla_patterns_skipped'] == 1
+        
+        parser.reset_stats()
+        assert parser.get_stats()['mla_book_tried'] == 0
+    
+    def test_dispatch_features(self):
+        """Test the features read from a chapter citation."""
+        text = 'Lee, Ann. "A Chapter." Big Book, edited by Bo Li, Press, 2020, pp. 1-9.'
+        assert self.parser._features(text) == {"quoted", "pages", "edited_by"}
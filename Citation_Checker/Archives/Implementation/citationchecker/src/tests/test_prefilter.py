@@ -0,0 +1,51 @@
+import json
+import os
+import re
+import time
+import pytest
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.prefilter import has_author_year, has_quoted_title, starts_with_full_name
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(current_dir, "test_data", "apa_citations.json"), 'r') as f:
+    apa_data = json.load(f)
+with open(os.path.join(current_dir, "test_data", "mla_citations.json"), 'r') as f:
+    mla_data = json.load(f)
+
+samples = []
+for data in (apa_data, mla_data):
+    samples.extend(c["text"] for c in data["citations"])
+    samples.append(data["mixed_text"])
+samples += ['(2020) no letter first', 'x\n(2020)', '(2020a)(2021)', 'A "" B', 'A ""x"', '\n"a"', 'a\n"b"', '"', 'Smith, John']
+
+class TestPrefilter:
+    """Test suite for the candidate prefilter."""
+    
+    @pytest.mark.parametrize("text", samples)
+    def test_matches_gate_regexes(self, text):
+        """Test that the linear checks accept exactly what the old gate regexes accepted."""
+        assert has_author_year(text) == bool(re.search(r'[A-Za-z]+.*\(\d{4}[a-z]?\)', text))
+        assert has_quoted_title(text) == bool(re.search(r'[A-Za-z]+.*"[^"]+"', text))
+        assert starts_with_full_name(text) == bool(re.search(r'^[A-Z][a-z]+,\s+[A-Z][a-z]+', text))
+    
+    def test_linear_on_long_prose(self):
+        """Test that a long line without any anchor is rejected quickly."""
+        prose = "word " * 20000 + "(2020 " + '"'
+        started = time.perf_counter()
+        assert not has_author_year(prose)
+        assert not has_quoted_title(prose)
+        assert time.perf_counter() - started < 0.1
+    
+    def test_counts_and_time_saved(self):
+        """Test that extraction reports accepted and rejected candidates."""
+        parser = APACitationParser()
+        citations = parser.extract_citations(apa_data["mixed_text"])
+        stats = parser.get_stats()
+        
+        assert stats["prefilter_accepted"] >= len(citations)
+        assert stats["prefilter_rejected"] > 0
+        assert stats["prefilter_seconds_saved"] > 0
+        
+        parser.reset_stats()
+        assert parser.get_stats()["prefilter_rejected"] == 0
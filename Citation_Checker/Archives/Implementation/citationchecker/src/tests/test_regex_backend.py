@@ -0,0 +1,72 @@
+import json
+import os
+import pytest
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.mla_parser import MLACitationParser
+from src.parsers.regex_backend import get_backend, RegexBackend
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(current_dir, "test_data", "apa_citations.json"), 'r') as f:
+    apa_data = json.load(f)
+with open(os.path.join(current_dir, "test_data", "mla_citations.json"), 'r') as f:
+    mla_data = json.load(f)
+
+# A run of MLA-looking fragments with no page range makes the lazy MLA
+# patterns backtrack super-linearly
+PATHOLOGICAL_MLA = 'Smith. "Title". Source, vol. 1, 2020, ' * 400
+
+class TestRegexBackend:
+    """Test suite for regex backends and matching budgets."""
+    
+    def test_default_backend_is_stdlib(self):
+        """Test that parsers use the re backend unless told otherwise."""
+        parser = APACitationParser()
+        assert parser.regex_backend.name == "re"
+    
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with pytest.raises(ValueError):
+            get_backend("pcre")
+    
+    def test_auto_backend(self):
+        """Test that auto always resolves to some backend."""
+        assert isinstance(get_backend("auto"), RegexBackend)
+    
+    @pytest.mark.parametrize("backend", ["regex", "re2"])
+    def test_optional_backends_match_stdlib(self, backend):
+        """Test that optional backends parse the fixtures exactly like re."""
+        module = "re2" if backend == "re2" else "regex"
+        pytest.importorskip(module)
+        
+        for parser_class, data in ((APACitationParser, apa_data), (MLACitationParser, mla_data)):
+            reference = parser_class()
+            candidate = parser_class(regex_backend=backend)
+            for item in data["citations"]:
+                expected = reference.parse(item["text"])
+                actual = candidate.parse(item["text"])
+                assert (actual and actual.to_dict()) == (expected and expected.to_dict())
+    
+    def test_length_budget(self):
+        """Test that over-long candidates are rejected and counted."""
+        parser = MLACitationParser(max_length=1000)
+        assert parser.parse(PATHOLOGICAL_MLA) is None
+        assert parser.get_stats()["length_budget_hits"] == 1
+        
+        parser.reset_stats()
+        assert parser.get_stats()["length_budget_hits"] == 0
+    
+    def test_time_budget(self):
+        """Test that a spent time budget abandons the candidate and is counted."""
+        parser = MLACitationParser(max_length=None, time_budget=0.0)
+        assert parser.parse(mla_data["citations"][0]["text"]) is None
+        assert parser.get_stats()["time_budget_hits"] == 1
+    
+    def test_budget_does_not_affect_normal_citations(self):
+        """Test that ordinary citations parse well within the default budget."""
+        parser = APACitationParser()
+        for item in apa_data["citations"]:
+            parser.parse(item["text"])
+        stats = parser.get_stats()
+        assert stats["length_budget_hits"] == 0
+        assert stats["time_budget_hits"] == 0
\ No newline at end of file
@@ -0,0 +1,108 @@
+import io
+import pytest
+from src.parsers.segmenter import iter_entry_spans
+
+def entries(text):
+    """Entry texts found in a whole reference section."""
+    return [text[start:end] for start, end in iter_entry_spans(text)]
+
+class TestSegmenter:
+    """Test suite for the reference entry segmenter."""
+    
+    def test_numbered_markers(self):
+        """Test that numbered entries are split at markers in sequence and the markers dropped."""
+        text = (
+            "[1] Smith, J. (2020). A title that wraps\n"
+            "onto the next line. Journal, 1(2), 3-4.\n"
+            "[2] Brown, A. (2019). Another title.\n"
+            "Press, 2019. [3] is cited in the text.\n"
+            "[3] Lee, K. (2018). Third title."
+        )
+        assert entries(text) == [
+            "Smith, J. (2020). A title that wraps\nonto the next line. Journal, 1(2), 3-4.",
+            "Brown, A. (2019). Another title.\nPress, 2019. [3] is cited in the text.",
+            "Lee, K. (2018). Third title."
+        ]
+    
+    def test_numbering_gaps_and_repeats(self):
+        """Test that a skipped or repeated number still starts an entry, and the count resyncs."""
+        text = "\n".join(f"[{number}] Author{number}, A. (2020). Title {number}." for number in (1, 2, 4, 5, 6))
+        assert entries(text) == [f"Author{number}, A. (2020). Title {number}." for number in (1, 2, 4, 5, 6)]
+        
+        text = (
+            "1. Smith, J. Title. Journal,\n"
+            "12. 1(2), 3-4.\n"
+            "2. Brown, A. Another. Press.\n"
+            "2. Lee, K. Third. Press.\n"
+            "3. Kim, H. Fourth. Press."
+        )
+        assert entries(text) == [
+            "Smith, J. Title. Journal,\n12. 1(2), 3-4.",
+            "Brown, A. Another. Press.",
+            "Lee, K. Third. Press.",
+            "Kim, H. Fourth. Press."
+        ]
+    
+    def test_dotted_numbers(self):
+        """Test that "12." markers work and a year starting a line is not taken for one."""
+        text = "1. Smith, J. Title. Journal,\n2020. 1(2), 3-4.\n2. Brown, A. Another. Press."
+        assert entries(text) == [
+            "Smith, J. Title. Journal,\n2020. 1(2), 3-4.",
+            "Brown, A. Another. Press."
+        ]
+    
+    def test_hanging_indent(self):
+        """Test that indented lines continue the entry above them, even when they look like a new one."""
+        text = (
+            "Smith, J. (2020). A title. In Brown, A. (Ed.),\n"
+            "    Collected Works (pp. 1-10).\n"
+            "    Press.\n"
+            "Lee, K. (2018). Third title."
+        )
+        assert entries(text) == [
+            "Smith, J. (2020). A title. In Brown, A. (Ed.),\n    Collected Works (pp. 1-10).\n    Press.",
+            "Lee, K. (2018). Third title."
+        ]
+    
+    def test_wrapped_lines_without_indent(self):
+        """Test that a capitalised continuation line is not split off as a new entry."""
+        text = (
+            "Smith, John. \"A Title That Wraps.\"\n"
+            "Journal of Things, vol. 1, 2020, pp. 1-2.\n"
+            "Brown, Anne. Book Title. Press, 2019.\n"
+            "\"Anonymous Article.\" The Times, 2021.\n"
+            "World Health Organization. (2020). Annual report."
+        )
+        assert entries(text) == [
+            "Smith, John. \"A Title That Wraps.\"\nJournal of Things, vol. 1, 2020, pp. 1-2.",
+            "Brown, Anne. Book Title. Press, 2019.",
+            "\"Anonymous Article.\" The Times, 2021.",
+            "World Health Organization. (2020). Annual report."
+        ]
+    
+    def test_line_breaking_off_mid_sentence_continues(self):
+        """Test that a line after one ending in a comma or a lowercase word is a continuation."""
+        text = "Smith, J., &\nBrown, A. (2020). Title of the\nSeries, Volume 2. Press."
+        assert entries(text) == [text]
+    
+    def test_blank_lines_separate_entries(self):
+        """Test that blank lines end entries whatever the next line looks like."""
+        text = "\nSmith, J. (2020). Title.\n\nsome lowercase entry, 2019.\n  \n\n"
+        assert entries(text) == ["Smith, J. (2020). Title.", "some lowercase entry, 2019."]
+    
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    def test_byte_offsets(self, newline):
+        """Test that buffers give byte offsets of the same entries, with non-ASCII indentation."""
+        text = "[1] Müller, K. (2020). Ein Titel.\n\u00a0\u00a0Verlag.\n[2] Brown, A. (2019). T."
+        data = text.replace("\n", newline).encode("utf-8")
+        spans = iter_entry_spans(data)
+        assert [data[start:end].decode("utf-8").replace(newline, "\n") for start, end in spans] == entries(text)
+    
+    def test_file_offsets_and_section_bounds(self):
+        """Test that a file gives character offsets and only the given section is segmented."""
+        text = "Body text.\nSmith, J. (2020). Title.\nBrown, A. (2019). T.\nAfter."
+        start = text.index("Smith")
+        end = text.index("\nAfter")
+        spans = list(iter_entry_spans(io.StringIO(text), start, end))
+        assert spans == list(iter_entry_spans(text, start, end))
+        assert [text[s:e] for s, e in spans] == ["Smith, J. (2020). Title.", "Brown, A. (2019). T."]
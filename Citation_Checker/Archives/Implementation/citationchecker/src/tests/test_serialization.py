@@ -0,0 +1,84 @@
+import io
+import json
+import pytest
+from src.crawlers.base_crawler import CrawlResult
+from src.models import serialization
+from src.models.citation import Citation
+from src.models.citation_table import CitationTable
+from src.models.serialization import from_bytes, iter_records, packb, to_bytes, unpackb, write_records
+
+CITATIONS = [
+    Citation(authors=["Smith, J.", "Doë, Ä."], year=2020, title="Título " * 10, source="Journal",
+             volume="3", citation_type="article", citation_format="apa", confidence_score=0.9),
+    Citation(authors=[], year=None, title="", source="", url="https://example.com")
+]
+
+def make_crawl_result():
+    """Build a crawl result with nested metadata and a fixed timestamp."""
+    result = CrawlResult("https://example.com", success=True, content="Page text",
+                         metadata={"title": "Example", "links": [1, 2, {"deep": None}]},
+                         status_code=200, response_time=0.25)
+    result.crawl_timestamp = 1700000000.5
+    return result
+
+@pytest.fixture(params=["msgpack", "pure"])
+def codec(request, monkeypatch):
+    """Run a test with the msgpack package (if installed) and with the pure-Python codec."""
+    if request.param == "msgpack":
+        pytest.importorskip("msgpack")
+    else:
+        monkeypatch.setattr(serialization, "_msgpack", lambda: None)
+    return request.param
+
+class TestSerialization:
+    """Test suite for binary and JSON Lines record files."""
+    
+    def test_from_dict(self):
+        """Test that both model classes round-trip through their dictionaries."""
+        citation = CITATIONS[0]
+        assert Citation.from_dict(dict(citation.to_dict(), file="paper.txt")) == citation
+        result = CrawlResult.from_dict(make_crawl_result().to_dict())
+        assert result.to_dict() == make_crawl_result().to_dict()
+    
+    def test_values_round_trip(self, codec):
+        """Test MessagePack encoding of every supported type and size."""
+        values = [None, True, False, 0, 127, 128, 65536, 2 ** 40, -1, -33, -40000, -2 ** 40, 1.5,
+                  "", "x" * 31, "x" * 300, "y" * 70000, b"\x00\xff", list(range(20)), {"k": {"n": [None]}}]
+        for value in values:
+            assert unpackb(packb(value)) == value
+        with pytest.raises(TypeError):
+            packb(object())
+    
+    def test_pure_codec_matches_msgpack(self, monkeypatch):
+        """Test that the pure-Python codec writes the same bytes as the msgpack package."""
+        msgpack = pytest.importorskip("msgpack")
+        value = [0, -5, 300, -300, 2.5, "é" * 40, [None] * 17, {"a": True}]
+        monkeypatch.setattr(serialization, "_msgpack", lambda: None)
+        assert packb(value) == msgpack.packb(value, use_bin_type=True)
+    
+    @pytest.mark.parametrize("format", ["binary", "jsonl"])
+    def test_files_round_trip(self, tmp_path, codec, format):
+        """Test that citations and crawl results read back unchanged, in order."""
+        path = tmp_path / "records"
+        records = CITATIONS + [make_crawl_result()] + list(CitationTable(CITATIONS))
+        assert write_records(iter(records), str(path), format) == 5
+        loaded = list(iter_records(path))
+        assert loaded[:2] == CITATIONS and loaded[3:] == CITATIONS
+        assert loaded[2].to_dict() == make_crawl_result().to_dict()
+        assert from_bytes(to_bytes(CITATIONS[0])) == CITATIONS[0]
+    
+    def test_streams_and_detects_truncation(self, tmp_path):
+        """Test that records are read from a stream one at a time and a cut file is reported."""
+        path = tmp_path / "records.bin"
+        write_records(CITATIONS * 100, str(path))
+        data = path.read_bytes()
+        records = iter_records(io.BytesIO(data))
+        assert next(records) == CITATIONS[0]
+        assert sum(1 for _ in records) == 199
+        with pytest.raises(ValueError):
+            list(iter_records(io.BytesIO(data[:-3])))
+    
+    def test_reads_command_line_json_lines(self):
+        """Test that JSON Lines without a "type" key are read as citations."""
+        lines = "".join(json.dumps(dict(c.to_dict(), file="a.txt")) + "\n" for c in CITATIONS)
+        assert list(iter_records(io.BytesIO(lines.encode("utf-8")))) == CITATIONS
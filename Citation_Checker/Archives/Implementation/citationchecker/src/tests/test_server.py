@@ -0,0 +1,171 @@
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+import pytest
+from src.main import parse_text
+from src.parsers.apa_parser import APACitationParser
+from src.server import CitationServer, ParseBatcher, make_server
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(current_dir, "test_data", "apa_citations.json"), 'r') as f:
+    test_data = json.load(f)
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+    
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.path = path
+    
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+@pytest.fixture
+def serve(tmp_path):
+    """Start a server in a thread and return a function that sends it requests."""
+    servers = []
+    
+    def start(unix=False, **options):
+        app = CitationServer(("apa", "mla"), **options)
+        path = str(tmp_path / "parse.sock") if unix else None
+        server = make_server(app, port=0, unix_socket=path)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        
+        def request(method, url, body=None, headers=None):
+            if unix:
+                connection = UnixHTTPConnection(path)
+            else:
+                connection = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+            connection.request(method, url, json.dumps(body) if body is not None else None, headers or {})
+            response = connection.getresponse()
+            result = response.status, json.loads(response.read())
+            connection.close()
+            return result
+        return request
+    
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+        server.app.close()
+
+class TestServer:
+    """Test suite for the parse server."""
+    
+    def test_parse_endpoints(self, serve):
+        """Test that documents and single citations parse as they would locally."""
+        request = serve()
+        status, response = request("POST", "/parse", {"text": test_data["mixed_text"]})
+        expected = parse_text(test_data["mixed_text"], "apa")
+        assert status == 200
+        assert response["count"] == len(expected)
+        assert response["citations"] == [citation.to_dict() for citation in expected]
+        
+        text = test_data["citations"][0]["text"]
+        status, response = request("POST", "/parse", {"citations": [text, "not a citation"], "parser": "apa"})
+        assert status == 200
+        assert response["citations"][0]["title"] == expected[0].title
+        assert response["citations"][1] is None
+    
+    def test_errors(self, serve):
+        """Test that bad requests get 4xx answers and are counted."""
+        request = serve()
+        assert request("POST", "/parse", {"citation": "x", "parser": "chicago"})[0] == 400
+        assert request("POST", "/parse", {"citations": [1, 2]})[0] == 400
+        assert request("POST", "/parse", [])[0] == 400
+        assert request("GET", "/parse")[0] == 405
+        assert request("GET", "/nowhere")[0] == 404
+        status, metrics = request("GET", "/metrics")
+        assert metrics["errors"] == 5 and metrics["requests"] == 5
+    
+    def test_invalid_content_length(self, serve):
+        """Test that a non-numeric or negative Content-Length is answered with 400."""
+        request = serve()
+        for length in ("abc", "-1"):
+            status, response = request("POST", "/parse", headers={"Content-Length": length})
+            assert status == 400
+            assert "Content-Length" in response["error"]
+        assert request("GET", "/health")[0] == 200
+    
+    def test_concurrent_requests_are_batched(self, serve):
+        """Test that requests arriving together share parse_many() calls."""
+        request = serve(max_wait=0.2)
+        text = test_data["citations"][0]["text"]
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(request("POST", "/parse", {"citation": text})))
+                   for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert [status for status, _ in results] == [200] * 12
+        assert len({json.dumps(response) for _, response in results}) == 1
+        
+        status, metrics = request("GET", "/metrics")
+        apa = metrics["parsers"]["apa"]
+        assert apa["batched_citations"] == 12
+        assert apa["batches"] < 12
+        assert apa["largest_batch"] > 1
+        assert "stage_match_calls" in apa
+    
+    def test_failed_request_does_not_fail_its_batch(self, monkeypatch):
+        """Test that only the request whose parse raises gets the error."""
+        parser = APACitationParser()
+        parse = parser.parse
+        
+        def failing_parse(text):
+            if text == "boom":
+                raise RuntimeError("boom")
+            return parse(text)
+        
+        monkeypatch.setattr(parser, "parse", failing_parse)
+        batcher = ParseBatcher(parser, max_wait=0.5)
+        text = test_data["citations"][0]["text"]
+        good, bad = batcher.submit("parse", [text]), batcher.submit("parse", ["boom"])
+        try:
+            assert good.result(timeout=10)[0].title == parse(text).title
+            with pytest.raises(RuntimeError):
+                bad.result(timeout=10)
+            assert batcher.stats["batches"] == 1
+        finally:
+            batcher.close()
+    
+    def test_stuck_batcher_times_out(self, serve, monkeypatch):
+        """Test that a request whose batcher does not answer in time gets a 503."""
+        request = serve(request_timeout=0.2)
+        monkeypatch.setattr(APACitationParser, "parse_many", lambda parser, texts, workers=None: time.sleep(1) or [None] * len(texts))
+        text = test_data["citations"][0]["text"]
+        status, response = request("POST", "/parse", {"citation": text})
+        assert status == 503
+        assert "did not answer" in response["error"]
+        assert request("POST", "/parse", {"citation": text, "parser": "mla"})[0] == 200
+    
+    def test_stopped_batcher(self):
+        """Test that /health and requests report a batcher whose thread has stopped."""
+        app = CitationServer(("apa", "mla"))
+        try:
+            app.batchers["apa"].close()
+            status, response = app.handle("GET", "/health")
+            assert status == 503 and "apa" in response["error"]
+            assert app.handle("POST", "/parse", b'{"citation": "Smith, J. (2020). Title."}')[0] == 503
+            status, metrics = app.handle("GET", "/metrics")
+            assert status == 200
+            assert metrics["parsers"]["apa"]["alive"] is False
+            assert metrics["parsers"]["mla"]["alive"] is True
+        finally:
+            app.close()
+    
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not available")
+    def test_unix_socket(self, serve):
+        """Test that the server answers on a Unix domain socket."""
+        request = serve(unix=True)
+        status, response = request("GET", "/health")
+        assert status == 200
+        assert response["status"] == "ok"
+        assert response["parsers"] == ["apa", "mla"]
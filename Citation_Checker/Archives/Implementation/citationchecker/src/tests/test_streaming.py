@@ -0,0 +1,62 @@
+import io
+import re
+import pytest
+from src.parsers.streaming import iter_reference_entries, iter_reference_spans
+
+SECTION_TEXT = (
+    "Introduction text.\n\nReferences:\n\n"
+    "Smith, J. (2020). First title. Journal, 1(2), 3-4.\n"
+    "Brown, A. (2019). Second title.\n  \n  Publisher.\n"
+    "Lee, K. (2018). Third title. Press."
+)
+SECTION_ENTRIES = [
+    "Smith, J. (2020). First title. Journal, 1(2), 3-4.",
+    "Brown, A. (2019). Second title.",
+    "Publisher.",
+    "Lee, K. (2018). Third title. Press."
+]
+PLAIN_TEXT = "Smith, J. (2020). A title.  Brown, A. (2019). Another.\n\nLee, K. (2018). Third."
+
+class UnseekableStringIO(io.StringIO):
+    """Text stream that cannot seek, like a pipe."""
+    
+    def seekable(self):
+        return False
+
+def split_in_memory(text):
+    """The whole-text splitting used for documents without a reference heading."""
+    return re.split(r'\.\s{2,}|\.\n+|\n(?=[A-Z])', text)
+
+EXPECTED = {
+    SECTION_TEXT: SECTION_ENTRIES,
+    PLAIN_TEXT: split_in_memory(PLAIN_TEXT),
+    "": [""],
+    "Works Cited\n": []
+}
+
+class TestStreaming:
+    """Test suite for the streaming reference splitter."""
+    
+    @pytest.mark.parametrize("text", list(EXPECTED))
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+    def test_same_candidates_for_every_source(self, text, chunk_size):
+        """Test that candidates are the same for any chunk size and source type."""
+        expected = EXPECTED[text]
+        for source in (text, io.StringIO(text), UnseekableStringIO(text)):
+            assert list(iter_reference_entries(source, chunk_size=chunk_size)) == expected
+    
+    def test_file_without_heading_is_reread_from_start_position(self):
+        """Test that a seekable file is rewound to where reading began when there is no heading."""
+        stream = io.StringIO("ignored" + PLAIN_TEXT)
+        stream.read(len("ignored"))
+        assert list(iter_reference_entries(stream, chunk_size=4)) == split_in_memory(PLAIN_TEXT)
+
+    
+    @pytest.mark.parametrize("text", list(EXPECTED))
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    def test_byte_spans_match_text_candidates(self, text, newline):
+        """Test that spans found in a UTF-8 buffer decode to the same candidates."""
+        data = text.replace("\n", newline).encode("utf-8")
+        spans = iter_reference_spans(data)
+        candidates = [data[start:end].decode("utf-8").replace(newline, "\n") for start, end in spans]
+        assert candidates == EXPECTED[text]
\ No newline at end of file
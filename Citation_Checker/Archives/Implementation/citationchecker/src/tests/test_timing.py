@@ -0,0 +1,78 @@
+import io
+import json
+import os
+import pytest
+from src.parsers.timing import STAGES, StageTimer
+from src.parsers.apa_parser import APACitationParser
+from src.parsers.mla_parser import MLACitationParser
+from src.parsers.auto_parser import AutoCitationParser
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+DOCUMENTS = {}
+for format_name in ("apa", "mla"):
+    with open(os.path.join(current_dir, "test_data", f"{format_name}_citations.json"), 'r') as f:
+        DOCUMENTS[format_name] = json.load(f)["mixed_text"]
+
+class TestStageTimer:
+    """Test suite for per-stage parsing timers."""
+    
+    def test_counts_every_call_and_samples_times(self):
+        """Test that all calls are counted but only one in sample_every is timed."""
+        timer = StageTimer(sample_every=4)
+        for value in range(10):
+            assert timer.call("authors", abs, -value) == value
+        assert timer.calls["authors"] == 10
+        # Calls 1, 5 and 9
+        assert timer.sampled["authors"] == 3
+        assert timer.get_stats()["stage_authors_calls"] == 10
+    
+    def test_iterate(self):
+        """Test that items pass through unchanged and each step is counted."""
+        timer = StageTimer()
+        assert list(timer.iterate("segment", "abc")) == ["a", "b", "c"]
+        assert timer.calls["segment"] == 4
+    
+    def test_invalid_sampling(self):
+        """Test that a sampling interval below one is rejected."""
+        with pytest.raises(ValueError):
+            StageTimer(sample_every=0)
+    
+    @pytest.mark.parametrize("parser_class,format_name", [
+        (APACitationParser, "apa"),
+        (MLACitationParser, "mla"),
+        (AutoCitationParser, "mla")
+    ])
+    def test_parsers_report_every_stage(self, parser_class, format_name):
+        """Test that extracting from a document reports every stage the parser runs."""
+        parser = parser_class(memo_size=0)
+        citations = list(parser.iter_citations(io.StringIO(DOCUMENTS[format_name])))
+        stats = parser.get_stats()
+        assert set(f"stage_{stage}_calls" for stage in STAGES) <= set(stats)
+        assert stats["stage_locate_calls"] == 1
+        assert stats["stage_segment_calls"] > len(citations)
+        assert stats["stage_prefilter_calls"] == stats["prefilter_accepted"] + stats["prefilter_rejected"]
+        assert stats["stage_match_calls"] > 0
+        assert stats["stage_confidence_calls"] >= len(citations)
+        assert stats["stage_match_seconds"] > 0.0
+        
+        parser.reset_stats()
+        assert parser.get_stats()["stage_match_calls"] == 0
+    
+    def test_timing_is_sampled_by_default(self):
+        """Test that parsers time a sample of calls unless asked to time every one."""
+        text = DOCUMENTS["apa"]
+        sampled = APACitationParser(memo_size=0)
+        exact = APACitationParser(memo_size=0, stage_timing=1)
+        assert sampled.extract_citations(text) == exact.extract_citations(text)
+        assert sampled.stage_timer.sample_every == 64
+        assert sampled.stage_timer.sampled["confidence"] < sampled.stage_timer.calls["confidence"]
+        assert exact.stage_timer.sampled == exact.stage_timer.calls
+    
+    def test_timing_can_be_turned_off(self):
+        """Test that stage_timing=None parses the same and reports no stages."""
+        timed = APACitationParser(memo_size=0)
+        untimed = APACitationParser(memo_size=0, stage_timing=None)
+        text = DOCUMENTS["apa"]
+        assert untimed.extract_citations(text) == timed.extract_citations(text)
+        assert "stage_match_calls" not in untimed.get_stats()
+        assert untimed.budget.timer is None
@@ -0,0 +1,74 @@
+import json
+import os
+import pytest
+from src.parsers.utils import (
+    scan_fields,
+    extract_year,
+    extract_doi,
+    extract_urls,
+    extract_pages,
+    extract_volume_issue
+)
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+citation_texts = []
+for name in ("apa_citations.json", "mla_citations.json"):
+    with open(os.path.join(current_dir, "test_data", name), 'r') as f:
+        citation_texts.extend(c["text"] for c in json.load(f)["citations"])
+
+class TestFieldScanner:
+    """Test suite for the single-pass citation field scanner."""
+    
+    @pytest.mark.parametrize("text", citation_texts)
+    def test_matches_extract_helpers(self, text):
+        """Test that one scan agrees with each of the individual extract_* helpers."""
+        fields = scan_fields(text)
+        
+        assert fields.year == extract_year(text)
+        assert fields.get("doi") == extract_doi(text)
+        assert fields.get("url") == (extract_urls(text) or [None])[0]
+        assert fields.get("pages") == extract_pages(text)
+        assert (fields.get("volume"), fields.get("issue")) == extract_volume_issue(text)
+    
+    def test_spans_point_into_text(self):
+        """Test that scanned fields are reported as offsets into the original text."""
+        text = "Smith, J. (2020). Title. Journal, 15(2), pp. 45-67. https://doi.org/10.1234/abc"
+        fields = scan_fields(text)
+        
+        start, end = fields.paren_year
+        assert text[start:end] == "2020"
+        assert fields.get("volume") == "15"
+        assert fields.get("issue") == "2"
+        assert fields.get("pages") == "45-67"
+        assert fields.get("url") == "https://doi.org/10.1234/abc"
+        assert fields.get("doi") == "10.1234/abc"
+    
+    def test_mla_labeled_fields(self):
+        """Test the vol./no./pp. and date fields used by MLA citations."""
+        text = ('Chen, Li. "Tools." Review, vol. 8, no. 3A, 15 Mar. 2023, pp. 12—19. '
+                'Accessed 2 May 2024.')
+        fields = scan_fields(text)
+        
+        assert fields.get("labeled_volume") == "8"
+        assert fields.get("labeled_issue") == "3A"
+        assert fields.get("labeled_pages") == "12", "MLA page ranges only use - and –"
+        assert fields.get("pages") == "12—19"
+        assert fields.get("date") == "15 Mar. 2023"
+        assert fields.get("date_year") == "2023"
+        assert fields.get("access_date") == "2 May 2024"
+    
+    def test_overlapping_fields(self):
+        """Test that a field inside another one (a year inside a DOI) is still found."""
+        text = "Author. Title. 10.1000/jx.2019.55"
+        fields = scan_fields(text)
+        
+        assert fields.get("doi") == "10.1000/jx.2019.55"
+        assert fields.year == 2019
+    
+    def test_empty_text(self):
+        """Test that scanning text without any fields finds nothing."""
+        fields = scan_fields("No fields here")
+        assert fields.year is None
+        assert fields.get("doi") is None
+        assert fields.get("pages") is None
\ No newline at end of file
@@ -0,0 +1,86 @@
+import csv
+import io
+import json
+import os
+import sys
+import pytest
+from src.main import format_citation_output, main
+from src.models.citation import Citation
+from src.output.writers import CSV_COLUMNS, get_writer
+
+# Load test data
+current_dir = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(current_dir, "test_data", "apa_citations.json"), 'r') as f:
+    test_data = json.load(f)
+
+CITATIONS = [
+    Citation(authors=["Smith, J.", "Doe, A."], year=2020, title='Commas, "quotes" and\nline breaks',
+             source="Journal of Tests", volume="3", pages="1-10", citation_type="article",
+             confidence_score=0.9),
+    Citation(authors=[], year=None, title="Untitled", source="", url="https://example.com")
+]
+
+class TestWriters:
+    """Test suite for the streaming citation writers."""
+    
+    @pytest.mark.parametrize("citations", [CITATIONS, []])
+    def test_json_matches_whole_document(self, citations):
+        """Test that streamed JSON is the same as dumping the whole document."""
+        assert format_citation_output(citations, "json") == json.dumps({
+            "citations": [citation.to_dict() for citation in citations],
+            "count": len(citations)
+        }, indent=2)
+    
+    def test_json_lines(self):
+        """Test that JSON Lines has one citation object per line."""
+        lines = format_citation_output(CITATIONS, "jsonl").splitlines()
+        assert [json.loads(line) for line in lines] == [citation.to_dict() for citation in CITATIONS]
+    
+    def test_csv_is_escaped(self):
+        """Test that CSV fields with commas, quotes and newlines read back unchanged."""
+        output = format_citation_output(CITATIONS, "csv")
+        assert output.startswith(",".join(CSV_COLUMNS) + "\r\n")
+        rows = list(csv.reader(io.StringIO(output, newline="")))
+        assert len(rows) == 3
+        assert rows[1][:4] == ["Smith, J.|Doe, A.", "2020", CITATIONS[0].title, "Journal of Tests"]
+        assert rows[2][1] == "" and rows[2][7] == "https://example.com"
+    
+    def test_text_header_and_footer(self):
+        """Test that the count heads text output when known and ends it otherwise."""
+        output = format_citation_output(CITATIONS, "text")
+        assert output.startswith("Found 2 citations:\n\nCitation 1:\n")
+        assert "  URL: https://example.com\n" in output
+        assert format_citation_output([], "text") == "No citations found."
+        
+        out = io.StringIO()
+        with get_writer("text", out) as writer:
+            writer.write_all(iter(CITATIONS))
+        assert out.getvalue().startswith("Citation 1:\n")
+        assert out.getvalue().endswith("Found 2 citations.")
+    
+    def test_writes_as_citations_arrive(self):
+        """Test that each citation is written before the next one is produced."""
+        out = io.StringIO()
+        writer = get_writer("jsonl", out)
+        
+        def produce():
+            for citation in CITATIONS:
+                yield citation
+                assert out.getvalue().count("\n") == writer.count
+        
+        assert writer.write_all(produce()) == 2
+        with pytest.raises(ValueError):
+            get_writer("xml", out)
+    
+    def test_command_line_streams_to_file(self, tmp_path, monkeypatch):
+        """Test that a file parsed from the command line is written as JSON Lines."""
+        source = tmp_path / "paper.txt"
+        source.write_text(test_data["mixed_text"], encoding="utf-8")
+        output = tmp_path / "out.jsonl"
+        monkeypatch.setattr(sys, "argv", [
+            "main", "-f", str(source), "-o", "jsonl", "--output-file", str(output)
+        ])
+        main()
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert len(lines) > 0
+        assert all(json.loads(line)["citation_format"] == "apa" for line in lines)